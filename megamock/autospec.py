@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import inspect
+import types
+import weakref
+from functools import partial
+from typing import Any, Callable, Mapping
+from unittest import mock
+
+
+class SpecIndex:
+    """
+    The attributes of a class that an autospec creates mocks for
+    """
+
+    __slots__ = ("names", "methods")
+
+    def __init__(self, spec: type) -> None:
+        # MagicMock already does the useful magic methods
+        self.names = frozenset(name for name in dir(spec) if not _is_dunder(name))
+        # functions on the class, which are called without self
+        self.methods = frozenset(
+            name
+            for name in self.names
+            if isinstance(_get_static(spec, name), types.FunctionType)
+        )
+
+
+class AutospecCache:
+    """
+    Caches the attribute index of each class that is autospecced, so creating
+    another autospec of the same class skips walking its attributes.
+
+    Results are held per class and are invalidated when the class is modified.
+    unittest.mock itself is left as-is, so an autospec that isn't lazy still
+    introspects the class each time.
+    """
+
+    enabled = True
+
+    # class -> (fingerprint, index)
+    _indexes: weakref.WeakKeyDictionary[type, tuple[tuple, SpecIndex]] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    @staticmethod
+    def spec_index(spec: type) -> SpecIndex:
+        if not AutospecCache.enabled:
+            return SpecIndex(spec)
+        return _cached(AutospecCache._indexes, spec, lambda: SpecIndex(spec))
+
+    @staticmethod
+    def create_autospec(
+        spec: Any,
+        spec_set: bool = False,
+        instance: bool = False,
+        lazy: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Drop-in replacement for mock.create_autospec that can create lazy autospecs
+        """
+        if lazy:
+            return _create_lazy_autospec(
+                spec, spec_set=spec_set, instance=instance, **kwargs
+            )
+        return mock.create_autospec(spec, spec_set=spec_set, instance=instance, **kwargs)
+
+    @staticmethod
+    def clear() -> None:
+        AutospecCache._indexes.clear()
+
+
+def create_autospec(
+    spec: Any,
+    spec_set: bool = False,
+    instance: bool = False,
+    lazy: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """
+    mock.create_autospec, with the option of creating attribute mocks lazily
+
+    :param lazy: If true and the spec is a class, the mocks for attributes are
+        created when they are first accessed rather than up front
+    """
+    return AutospecCache.create_autospec(
+        spec, spec_set=spec_set, instance=instance, lazy=lazy, **kwargs
+    )
+
+
+def _create_lazy_autospec(
+    spec: Any, spec_set: bool = False, instance: bool = False, **kwargs: Any
+) -> Any:
+    """
+    Same as mock.create_autospec, except that for classes the attribute mocks are
+    created on first access. Attribute names are still checked against the spec.
+    """
+    if not isinstance(spec, type):
+        # only classes have enough attributes to be worth it
+        return mock.create_autospec(spec, spec_set, instance=instance, **kwargs)
+
+    klass: type[mock.NonCallableMock] = LazyMagicMock
+    if instance and not _instance_callable(spec):
+        klass = LazyNonCallableMagicMock
+    legacy_mock = _with_spec(klass, spec, spec_set, **kwargs)
+    legacy_mock.__dict__["_megamock_lazy_spec"] = _LazySpec(spec, spec_set, instance)
+    legacy_mock.__dict__["_megamock_signature"] = _call_signature(spec, instance)
+
+    if not instance and "return_value" not in kwargs:
+        legacy_mock.return_value = _create_lazy_autospec(
+            spec, spec_set, instance=True
+        )
+    return legacy_mock
+
+
+class _LazySpec:
+    """
+    What is needed to create the attribute mocks of a lazy autospec
+    """
+
+    __slots__ = ("spec", "spec_set", "instance", "index")
+
+    def __init__(self, spec: type, spec_set: bool, instance: bool) -> None:
+        self.spec = spec
+        self.spec_set = spec_set
+        self.instance = instance
+        self.index = AutospecCache.spec_index(spec)
+
+    def create_attribute_mock(self, name: str) -> mock.NonCallableMock:
+        """
+        Autospec an attribute of the class the same way create_autospec does
+        """
+        original = getattr(self.spec, name)
+        if isinstance(original, type):
+            # nested classes can be instantiated from an instance too
+            return _create_lazy_autospec(original, self.spec_set, instance=False)
+        if not isinstance(original, (types.FunctionType, types.MethodType)):
+            return mock.create_autospec(
+                original, self.spec_set, instance=self.instance
+            )
+        if name in self.index.methods:
+            # the mock stands in for the method looked up on an instance
+            original = types.MethodType(original, self.spec)
+        klass: type[mock.NonCallableMock] = AutospecMagicMock
+        if inspect.iscoroutinefunction(original):
+            klass = AutospecAsyncMock
+        attribute_mock = _with_spec(klass, original, self.spec_set)
+        attribute_mock.__dict__["_megamock_signature"] = _signature(original)
+        return attribute_mock
+
+
+class _LazyAttributesMixin:
+    """
+    Creates the attribute mocks of a lazy autospec when they are first accessed
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        lazy_spec: _LazySpec | None = self.__dict__.get("_megamock_lazy_spec")
+        if (
+            lazy_spec is not None
+            and name in lazy_spec.index.names
+            # children that were created, assigned or deleted are left as-is
+            and name not in self._mock_children  # type: ignore[attr-defined]
+            and hasattr(lazy_spec.spec, name)
+        ):
+            self.attach_mock(  # type: ignore[attr-defined]
+                lazy_spec.create_attribute_mock(name), name
+            )
+        return super().__getattr__(name)  # type: ignore[misc]
+
+
+class _CheckedCallMixin:
+    """
+    Checks calls against the signature of the spec, like autospecced mocks do
+    """
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if (signature := self.__dict__.get("_megamock_signature")) is not None:
+            # raises a TypeError when called with the wrong arguments
+            signature.bind(*args, **kwargs)
+        return super().__call__(*args, **kwargs)  # type: ignore[misc]
+
+
+class LazyNonCallableMagicMock(_LazyAttributesMixin, mock.NonCallableMagicMock):
+    """
+    Lazy autospec of an instance of a class
+    """
+
+
+class LazyMagicMock(_LazyAttributesMixin, _CheckedCallMixin, mock.MagicMock):
+    """
+    Lazy autospec of a class, or of an instance of a callable class
+    """
+
+
+class AutospecMagicMock(_CheckedCallMixin, mock.MagicMock):
+    """
+    Autospec of a function or method of a lazy autospec
+    """
+
+
+class AutospecAsyncMock(_CheckedCallMixin, mock.AsyncMock):
+    """
+    Autospec of an async function or method of a lazy autospec
+    """
+
+
+def _with_spec(
+    klass: type[mock.NonCallableMock], spec: Any, spec_set: bool, **kwargs: Any
+) -> mock.NonCallableMock:
+    if spec_set:
+        return klass(spec_set=spec, **kwargs)
+    return klass(spec=spec, **kwargs)
+
+
+def _instance_callable(spec: type) -> bool:
+    return any("__call__" in vars(klass) for klass in spec.__mro__)
+
+
+def _call_signature(spec: type, instance: bool) -> inspect.Signature | None:
+    """
+    The signature of calling the class, or an instance of the class
+    """
+    func = spec.__call__ if instance else spec.__init__  # type: ignore[misc]
+    # skip self
+    return _signature(partial(func, None))
+
+
+def _signature(func: Any) -> inspect.Signature | None:
+    try:
+        return inspect.signature(func)
+    except (TypeError, ValueError):
+        # certain callable types are not supported by inspect.signature()
+        return None
+
+
+def spec_fingerprint(obj: Any) -> tuple | None:
+    """
+    Something that changes when the object is modified in a way that changes
+    the introspection results, or None if the object is not cacheable
+    """
+    if isinstance(obj, types.FunctionType):
+        return (
+            id(obj.__code__),
+            id(obj.__defaults__),
+            id(obj.__kwdefaults__),
+            _namespace_fingerprint(obj.__dict__),
+        )
+    if isinstance(obj, type) and type(obj).__dir__ is type.__dir__:
+        return tuple(_namespace_fingerprint(vars(cls)) for cls in obj.__mro__)
+    return None
+
+
+def _namespace_fingerprint(namespace: Mapping[str, Any]) -> tuple:
+    # replacing an attribute, even with one of the same kind, changes its identity
+    return tuple((name, id(value)) for name, value in namespace.items())
+
+
+def _cached(
+    cache: weakref.WeakKeyDictionary, obj: Any, compute: Callable[[], Any]
+) -> Any:
+    if (fingerprint := spec_fingerprint(obj)) is None:
+        return compute()
+    try:
+        cached_fingerprint, result = cache[obj]
+        if cached_fingerprint == fingerprint:
+            return result
+    except (KeyError, TypeError):
+        pass
+    result = compute()
+    try:
+        cache[obj] = (fingerprint, result)
+    except TypeError:
+        pass  # can't be weakly referenced
+    return result
+
+
+def _is_dunder(name: str) -> bool:
+    return name.startswith("__") and name.endswith("__")
+
+
+def _get_static(spec: type, name: str) -> Any:
+    try:
+        return inspect.getattr_static(spec, name)
+    except AttributeError:
+        return None
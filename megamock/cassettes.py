@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from enum import Enum
+from typing import Any
+
+_FORMAT_VERSION = 2
+
+
+class CassetteMissException(Exception):
+    """
+    Raised when replaying a call that was not recorded on the cassette
+    """
+
+
+class Cassette:
+    """
+    Recorded calls and their results, so a slow dependency only needs to be called
+    once. Calls to a spy with a cassette are recorded, MegaMock.replay serves them
+    back without calling the real object.
+
+        cassette = Cassette("tests/cassettes/model.pickle")
+        model = MegaMock.this(spy=Model(), cassette=cassette)
+        ...
+        cassette.save()
+
+        model = MegaMock.replay(Model, "tests/cassettes/model.pickle")
+
+    Calls are looked up by the attribute that was called and a hash of the
+    arguments, so they must be made with the same arguments, positional or keyword,
+    as when recording. Arguments can be None, bools, numbers, strings, bytes, enums
+    and tuples, lists, dicts, sets and frozensets of them; other arguments raise a
+    TypeError. When the same call was made several times, the results are replayed
+    in order, repeating the last one.
+
+    Results are pickled, and loading a pickle can run arbitrary code, so only load
+    cassettes you trust, such as the ones you recorded and committed yourself.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        """
+        :param path: Where the cassette is saved to and loaded from
+        """
+        self.path = path
+        # call key -> [(raised, result)]
+        self.calls: dict[bytes, list[tuple[bool, Any]]] = {}
+        # call key -> how many times it was replayed
+        self._replayed: dict[bytes, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> Cassette:
+        """
+        Load a saved cassette. It is unpickled, so it must come from a trusted source
+        """
+        cassette = Cassette(path)
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported cassette format in {path}")
+        cassette.calls = data["calls"]
+        return cassette
+
+    def save(self, path: str | os.PathLike | None = None) -> None:
+        if (path := path or self.path) is None:
+            raise ValueError("The cassette has no path to save to")
+        with self._lock:
+            data = {"version": _FORMAT_VERSION, "calls": self.calls}
+            with open(path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def call_key(name: str, args: tuple, kwargs: dict) -> bytes:
+        """
+        The key a call is recorded under. Raises TypeError if an argument can't be
+        keyed, so this can be checked before making the call
+        """
+        return _call_key(name, args, kwargs)
+
+    def record(
+        self,
+        name: str,
+        args: tuple,
+        kwargs: dict,
+        result: Any,
+        raised: bool = False,
+        key: bytes | None = None,
+    ) -> None:
+        """
+        Record the result of a call
+
+        :param name: The path to the called attribute, such as "client.get"
+        :param raised: If true, the result is an exception the call raised
+        :param key: The key from call_key, if it was already computed
+        """
+        if key is None:
+            key = _call_key(name, args, kwargs)
+        with self._lock:
+            self.calls.setdefault(key, []).append((raised, result))
+
+    def replay(self, name: str, args: tuple, kwargs: dict) -> Any:
+        """
+        The result of a recorded call. Recorded exceptions are raised
+        """
+        key = _call_key(name, args, kwargs)
+        with self._lock:
+            if (results := self.calls.get(key)) is None:
+                raise CassetteMissException(
+                    f"No recorded call to {name or 'the mock'} with args={args!r}, "
+                    f"kwargs={kwargs!r}"
+                )
+            replayed = self._replayed.get(key, 0)
+            self._replayed[key] = replayed + 1
+            raised, result = results[min(replayed, len(results) - 1)]
+        if raised:
+            raise result
+        return result
+
+    def rewind(self) -> None:
+        """
+        Replay calls from their first result again
+        """
+        with self._lock:
+            self._replayed.clear()
+
+
+def _call_key(name: str, args: tuple, kwargs: dict) -> bytes:
+    call = [name, _canonical(args), _canonical(kwargs)]
+    data = json.dumps(call, separators=(",", ":")).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _canonical(value: Any) -> Any:
+    """
+    A JSON serializable form of an argument, the same for arguments of the same
+    types and values, no matter the order of dicts and sets or memory addresses
+    """
+    value_type = type(value)
+    if value is None or value_type in (bool, int, float, str):
+        return value
+    if isinstance(value, Enum):
+        enum_name = f"{value_type.__module__}.{value_type.__qualname__}"
+        return ["enum", enum_name, value.name]
+    if value_type is bytes:
+        return ["bytes", value.hex()]
+    if value_type in (tuple, list):
+        return [value_type.__name__, [_canonical(item) for item in value]]
+    if value_type is dict:
+        items = [[_canonical(key), _canonical(item)] for key, item in value.items()]
+        return ["dict", _sorted(items)]
+    if value_type in (set, frozenset):
+        return ["set", _sorted([_canonical(item) for item in value])]
+    raise TypeError(
+        f"Can't look up a call with a {value_type.__name__} argument on a cassette, "
+        "use None, bools, numbers, strings, bytes, enums or containers of them"
+    )
+
+
+def _sorted(items: list) -> list:
+    return sorted(items, key=lambda item: json.dumps(item, separators=(",", ":")))
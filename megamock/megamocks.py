@@ -1,19 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import copy
+import json
+import os
 import random
 import re
+import sys
+import threading
 import time
 import traceback
+import weakref
 from abc import ABCMeta
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
+from functools import partial
+from itertools import pairwise
 from inspect import isawaitable, isclass, iscoroutinefunction
+from types import CodeType, FrameType, FunctionType
 from typing import (
     Any,
     Callable,
     Generic,
+    Iterator,
     Literal,
+    MutableSequence,
+    Sequence,
     TypeVar,
     Union,
     cast,
@@ -23,9 +36,12 @@ from typing import (
     overload,
 )
 from unittest import mock
-from unittest.mock import create_autospec
 
 from megamock import name_words
+from megamock.autospec import create_autospec, spec_fingerprint
+from megamock.cassettes import Cassette
+from megamock.simulation import Simulation
+from megamock.stubs import create_stub
 from megamock.type_util import MISSING, MISSING_TYPE
 
 T = TypeVar("T")
@@ -51,8 +67,86 @@ class _UseRealLogic:
 UseRealLogic = _UseRealLogic()
 
 
+# what time.time() was when time.perf_counter_ns() was 0
+_WALL_CLOCK_OFFSET = time.time() - time.perf_counter()
+
+
+_Frames = tuple[tuple[CodeType, int], ...]
+
+
+class _Stack:
+    """
+    The (code, line number) pairs of a captured stack. Unlike a tuple, it can be
+    weakly referenced
+    """
+
+    __slots__ = ("frames", "__weakref__")
+
+    def __init__(self, frames: _Frames) -> None:
+        self.frames = frames
+
+    def __iter__(self) -> Iterator[tuple[CodeType, int]]:
+        return iter(self.frames)
+
+
+# captured stacks are interned, as records created in a loop share the same stack.
+# Stacks are dropped once no record uses them
+_interned_stacks: weakref.WeakValueDictionary[_Frames, _Stack] = (
+    weakref.WeakValueDictionary()
+)
+
+
 class AttributeTrackingBase(metaclass=ABCMeta):
-    stacktrace: list[traceback.FrameSummary]
+    __slots__ = ("time_ns", "_frames", "_stacktrace")
+
+    # how many frames to capture, None for the whole stack
+    max_stack_depth: int | None = None
+    # tracking level of MegaMocks that don't specify one, see Tracking
+    default_tracking: str = "full"
+
+    time_ns: int  # from time.perf_counter_ns()
+    _frames: _Stack | _Frames
+    _stacktrace: list[traceback.FrameSummary] | None
+
+    def _init_tracking(
+        self,
+        stacktrace: list[traceback.FrameSummary] | None,
+        frames: _Stack | _Frames | None,
+    ) -> None:
+        # 0 is most recent frame, not oldest frame
+        self._stacktrace = stacktrace
+        self._frames = frames or ()
+        self.time_ns = time.perf_counter_ns()
+
+    @property
+    def time(self) -> float:
+        """
+        When the record was created, comparable to time.time()
+        """
+        return _WALL_CLOCK_OFFSET + self.time_ns / 1_000_000_000
+
+    @time.setter
+    def time(self, value: float) -> None:
+        self.time_ns = round((value - _WALL_CLOCK_OFFSET) * 1_000_000_000)
+
+    @property
+    def stacktrace(self) -> list[traceback.FrameSummary]:
+        """
+        The captured stack, where 0 is the most recent frame. Only the code objects and
+        line numbers are captured, they are turned into frame summaries on first use.
+        """
+        if self._stacktrace is None:
+            self._stacktrace = [
+                traceback.FrameSummary(
+                    code.co_filename, lineno, code.co_name, lookup_line=False
+                )
+                for code, lineno in self._frames
+            ]
+        return self._stacktrace
+
+    @stacktrace.setter
+    def stacktrace(self, stacktrace: list[traceback.FrameSummary]) -> None:
+        self._stacktrace = stacktrace
 
     @property
     def top_of_stacktrace(self) -> list[str]:
@@ -81,41 +175,649 @@ class AttributeTrackingBase(metaclass=ABCMeta):
         # when printing stacktraces, display the most recent frame last
         traceback.print_list(self.stacktrace[:-max_depth:-1])
 
+    @staticmethod
+    def _capture_frames(starting_depth: int) -> _Stack:
+        """
+        Capture the (code, line number) pairs of the stack, most recent first.
+        starting_depth is relative to the caller of this function.
+        """
+        frames: list[tuple[CodeType, int]] = []
+        frame: FrameType | None = sys._getframe(starting_depth)
+        max_depth = AttributeTrackingBase.max_stack_depth
+        while frame is not None and (max_depth is None or len(frames) < max_depth):
+            frames.append((frame.f_code, frame.f_lineno))
+            frame = frame.f_back
+        stack = tuple(frames)
+        if (interned := _interned_stacks.get(stack)) is None:
+            interned = _interned_stacks.setdefault(stack, _Stack(stack))
+        return interned
+
 
 class AttributeAssignment(AttributeTrackingBase):
+    __slots__ = ("attr_name", "attr_value")
+
     def __init__(
-        self, attr_name: str, attr_value: Any, stacktrace: list[traceback.FrameSummary]
+        self,
+        attr_name: str,
+        attr_value: Any,
+        stacktrace: list[traceback.FrameSummary] | None = None,
+        *,
+        frames: _Stack | _Frames | None = None,
     ) -> None:
         self.attr_name = attr_name
         self.attr_value = attr_value
-        self.stacktrace = stacktrace  # 0 is most recent frame, not oldest frame
-        self.time = time.time()
+        self._init_tracking(stacktrace, frames)
 
     @staticmethod
     def for_current_stack(
         attr_name: str, attr_value: Any, starting_depth=3
     ) -> AttributeAssignment:
-        stacktrace = traceback.extract_stack()[-starting_depth::-1]
-        return AttributeAssignment(attr_name, attr_value, stacktrace)
+        frames = AttributeTrackingBase._capture_frames(starting_depth)
+        return AttributeAssignment(attr_name, attr_value, frames=frames)
 
 
 class SpyAccess(AttributeTrackingBase):
+    __slots__ = ("attr_name", "attr_value")
+
     def __init__(
-        self, attr_name: str, attr_value: Any, stacktrace: list[traceback.FrameSummary]
+        self,
+        attr_name: str,
+        attr_value: Any,
+        stacktrace: list[traceback.FrameSummary] | None = None,
+        *,
+        frames: _Stack | _Frames | None = None,
+        snapshot: Callable[[Any], Any] | None = None,
     ) -> None:
+        """
+        :param snapshot: Creates the snapshot of the value stored as attr_value.
+            Defaults to a shallow copy
+        """
         self.attr_name = attr_name
-        self.attr_value = copy.copy(
-            attr_value  # just doing shallow copy, may need to revisit in future
-        )
-        self.stacktrace = stacktrace  # 0 is most recent frame, not oldest frame
-        self.time = time.time()
+        self.attr_value = (snapshot or _shallow_copy)(attr_value)
+        self._init_tracking(stacktrace, frames)
 
     @staticmethod
     def for_current_stack(
-        attr_name: str, attr_value: Any, starting_depth=3
+        attr_name: str,
+        attr_value: Any,
+        starting_depth=3,
+        snapshot: Callable[[Any], Any] | None = None,
     ) -> SpyAccess:
-        stacktrace = traceback.extract_stack()[-starting_depth::-1]
-        return SpyAccess(attr_name, attr_value, stacktrace)
+        frames = AttributeTrackingBase._capture_frames(starting_depth)
+        return SpyAccess(attr_name, attr_value, frames=frames, snapshot=snapshot)
+
+
+def _shallow_copy(value: Any) -> Any:
+    try:
+        return copy.copy(value)
+    except (TypeError, copy.Error):
+        # not copyable, the value itself is the best that can be done
+        return value
+
+
+def _no_copy(value: Any) -> Any:
+    return value
+
+
+SpySnapshot = Union[Literal["none", "shallow", "deep"], Callable[[Any], Any]]
+
+_spy_snapshots: dict[str, Callable[[Any], Any]] = {
+    "none": _no_copy,
+    "shallow": _shallow_copy,
+    "deep": copy.deepcopy,
+}
+
+
+def _get_spy_snapshot(spy_snapshot: SpySnapshot) -> Callable[[Any], Any]:
+    if callable(spy_snapshot):
+        return spy_snapshot
+    try:
+        return _spy_snapshots[spy_snapshot]
+    except KeyError:
+        raise ValueError(
+            f"Invalid spy snapshot {spy_snapshot!r}, "
+            'expected "none", "shallow", "deep" or a callable'
+        ) from None
+
+
+class _HistoryLevel:
+    """
+    How much history to keep, parsed from a setting like "last:10"
+    """
+
+    __slots__ = ("setting", "enabled", "maxlen")
+
+    OPTION: str  # name of the option, for error messages
+    # names of the levels that keep everything and nothing
+    KEEP_ALL: str
+    KEEP_NONE: str
+
+    def __init__(self, setting: str) -> None:
+        self.setting = setting
+        self.enabled = True
+        self.maxlen: int | None = None
+        level, _, size = setting.strip().lower().partition(":")
+        if level == self.KEEP_ALL and not size:
+            pass
+        elif level == self.KEEP_NONE and not size:
+            self.enabled = False
+        elif level == "count" and not size:
+            self.maxlen = 0
+        elif level == "last" and size.isdigit() and int(size) > 0:
+            self.maxlen = int(size)
+        else:
+            raise ValueError(
+                f"Invalid {self.OPTION} level {setting!r}, expected "
+                f'"{self.KEEP_ALL}", "last:N", "count" or "{self.KEEP_NONE}"'
+            )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.setting!r})"
+
+
+class Tracking(_HistoryLevel):
+    """
+    How much attribute assignment and spy access history a MegaMock keeps.
+
+    "full" keeps every record, "last:N" keeps the last N records for each attribute,
+    "count" only counts them and "off" does not track anything
+    """
+
+    __slots__ = ()
+
+    OPTION = "tracking"
+    KEEP_ALL = "full"
+    KEEP_NONE = "off"
+
+
+class CallRecording(_HistoryLevel):
+    """
+    How many calls a MegaMock records.
+
+    "all" records every call, "last:N" keeps the last N calls in call_args_list,
+    mock_calls and method_calls, "count" only keeps call_count and call_args, and
+    "none" does not record calls at all
+    """
+
+    __slots__ = ()
+
+    OPTION = "record"
+    KEEP_ALL = "all"
+    KEEP_NONE = "none"
+
+
+# argument types where equality is consistent with hashing
+_PLAIN_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+
+def _is_plain(value: Any) -> bool:
+    if type(value) in _PLAIN_TYPES:
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(_is_plain(item) for item in value)
+    return False
+
+
+def _call_key(matched_call: Any) -> tuple | None:
+    """
+    Hashable key for a call normalized by _call_matcher, or None if the call
+    can't be compared by its key
+    """
+    if isinstance(matched_call, Exception):
+        return None
+    args, kwargs = matched_call[-2:]
+    if not all(_is_plain(arg) for arg in args) or not all(
+        _is_plain(value) for value in kwargs.values()
+    ):
+        return None
+    return tuple(args), frozenset(kwargs.items())
+
+
+class CallIndex:
+    """
+    Index of the calls of a mock, so Mega can check whether a mock was called with
+    some arguments without comparing every call.
+
+    Calls are normalized the same way assert_any_call does. Calls with only builtin
+    values as arguments are counted by their arguments. Other calls are compared
+    one by one, as their equality may not be consistent with their hash.
+    """
+
+    __slots__ = ("_mock", "_calls", "_size", "_counts", "_irregular")
+
+    def __init__(self, legacy_mock: mock.NonCallableMock) -> None:
+        self._mock = legacy_mock
+        self._calls: list | None = None
+        self._size = 0
+        self._counts: Counter[tuple] = Counter()
+        self._irregular: list = []
+
+    def any_call(self, args: tuple, kwargs: dict) -> bool | None:
+        """
+        Whether the mock was called with the arguments, or None if the index
+        can't tell
+        """
+        self._sync()
+        expected = self._mock._call_matcher(mock._Call((args, kwargs), two=True))
+        if (key := _call_key(expected)) is None:
+            return None
+        if self._counts[key] > 0:
+            return True
+        return expected in mock._AnyComparer(self._irregular)  # type: ignore
+
+    def missing_calls(self, calls: Sequence[Any]) -> list | None:
+        """
+        The calls, in any order, the mock was not called with, or None if the index
+        can't tell
+        """
+        self._sync()
+        legacy_mock = self._mock
+        if (
+            # the index only has the calls of the mock itself
+            len(legacy_mock.mock_calls) != len(legacy_mock.call_args_list)
+            or self._irregular
+        ):
+            return None
+        remaining = self._counts.copy()
+        missing = []
+        for kall in calls:
+            if len(kall) > 2 and kall[0]:
+                return None  # call of a child mock
+            expected = legacy_mock._call_matcher(kall)
+            if (key := _call_key(expected)) is None:
+                return None
+            if remaining[key] > 0:
+                remaining[key] -= 1
+            else:
+                missing.append(expected)
+        return missing
+
+    def _sync(self) -> None:
+        calls = self._mock.call_args_list
+        if calls is self._calls and len(calls) == self._size:
+            return
+        # the calls were reset or changed, start over
+        self._calls = calls
+        self._size = 0
+        self._counts.clear()
+        self._irregular.clear()
+        for kall in calls:
+            self._add(kall)
+
+    def _add(self, kall: Any) -> None:
+        self._size += 1
+        matched = self._mock._call_matcher(kall)
+        if (key := _call_key(matched)) is None:
+            self._irregular.append(matched)
+        else:
+            self._counts[key] += 1
+
+    def _remove(self, kall: Any) -> None:
+        self._size -= 1
+        matched = self._mock._call_matcher(kall)
+        if (key := _call_key(matched)) is None:
+            self._irregular.remove(matched)
+        elif self._counts[key] > 1:
+            self._counts[key] -= 1
+        else:
+            del self._counts[key]
+
+    def _record_last_call(self) -> None:
+        calls = self._mock.call_args_list
+        if calls is self._calls and len(calls) == self._size + 1:
+            self._add(calls[-1])
+        else:
+            self._sync()
+
+    def _trim(self, maxlen: int) -> None:
+        calls = self._mock.call_args_list
+        if len(calls) > maxlen:
+            for kall in calls[: len(calls) - maxlen]:
+                self._remove(kall)
+            _trim_calls(calls, maxlen)
+
+
+class CallTimings:
+    """
+    When the calls of a mock were made, from time.perf_counter_ns. For async mocks,
+    how long each call was awaited for is also recorded. Both are kept in arrays of
+    64 bit integers, so timing many calls stays compact. When the mock only records
+    the last N calls, the timings of the last N calls are kept in deques instead.
+
+    Resetting the mock clears the timings.
+    """
+
+    __slots__ = ("maxlen", "starts", "await_durations")
+
+    def __init__(self, maxlen: int | None = None) -> None:
+        self.maxlen = maxlen
+        self.starts = self._timings()
+        self.await_durations = self._timings()
+
+    def _timings(self) -> MutableSequence[int]:
+        if self.maxlen is None:
+            return array("q")
+        return deque(maxlen=self.maxlen)
+
+    def clear(self) -> None:
+        self.starts = self._timings()
+        self.await_durations = self._timings()
+
+    def intervals(self) -> array:
+        """
+        The time between each call and the one before it, in nanoseconds
+        """
+        return array("q", (end - start for start, end in pairwise(self.starts)))
+
+    def call_rate(self) -> float:
+        """
+        Calls per second, between the first and the last call
+        """
+        if len(self.starts) < 2 or (elapsed := self.starts[-1] - self.starts[0]) <= 0:
+            return 0.0
+        return (len(self.starts) - 1) * 1_000_000_000 / elapsed
+
+    def histogram(
+        self, bucket_ns: int = 1_000_000, awaits: bool = False
+    ) -> dict[int, int]:
+        """
+        How many intervals between calls, or await durations if awaits is true,
+        fall in each bucket. Keyed by the start of the bucket, in nanoseconds
+        """
+        if bucket_ns <= 0:
+            raise ValueError("bucket_ns must be positive")
+        counts: Counter[int] = Counter(
+            duration // bucket_ns * bucket_ns
+            for duration in (self.await_durations if awaits else self.intervals())
+        )
+        return dict(sorted(counts.items()))
+
+    def as_dict(self) -> dict[str, list[int]]:
+        """
+        The timings, in nanoseconds
+        """
+        return {
+            "starts_ns": list(self.starts),
+            "intervals_ns": self.intervals().tolist(),
+            "await_durations_ns": list(self.await_durations),
+        }
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+
+def _install_call_hooks(
+    legacy_mock: mock.NonCallableMock, megamock_attrs: MegaMockAttributes
+) -> None:
+    legacy_mock.__dict__["_megamock_call_recording"] = megamock_attrs.call_recording
+    legacy_mock.__dict__["_megamock_call_index"] = megamock_attrs.call_index
+    legacy_mock.__dict__["_megamock_call_timings"] = megamock_attrs.call_timings
+    legacy_mock.__dict__["_megamock_simulation"] = megamock_attrs.simulation
+    legacy_mock.__dict__["_megamock_cassette"] = megamock_attrs.cassette
+    # mock classes are created for each instance, so this only affects this mock
+    type(legacy_mock)._increment_mock_call = (  # type: ignore[attr-defined]
+        _hooked_increment_mock_call
+    )
+    if megamock_attrs.call_timings is not None:
+        type(legacy_mock).reset_mock = _hooked_reset_mock  # type: ignore
+    if (
+        megamock_attrs.simulation is not None
+        or megamock_attrs.cassette is not None
+        or (
+            megamock_attrs.call_timings is not None
+            and isinstance(legacy_mock, mock.AsyncMockMixin)
+        )
+    ):
+        type(legacy_mock)._execute_mock_call = (  # type: ignore[attr-defined]
+            _hooked_execute_mock_call
+        )
+
+
+class CallWaiters:
+    """
+    Threads and tasks waiting for a mock to be called. They are woken up after
+    each call, see Mega.wait_until_called
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.events: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @staticmethod
+    def of(legacy_mock: mock.NonCallableMock) -> CallWaiters:
+        """
+        The waiters of the mock, hooking into its calls the first time
+        """
+        with CallWaiters._lock:
+            if (waiters := legacy_mock.__dict__.get("_megamock_call_waiters")) is None:
+                waiters = legacy_mock.__dict__["_megamock_call_waiters"] = (
+                    CallWaiters()
+                )
+                # mock classes are created for each instance, so this only
+                # affects this mock
+                type(legacy_mock)._increment_mock_call = (  # type: ignore
+                    _hooked_increment_mock_call
+                )
+        return waiters
+
+    def notify(self) -> None:
+        with self.condition:
+            self.condition.notify_all()
+        for loop, event in list(self.events):
+            loop.call_soon_threadsafe(event.set)
+
+
+def _hooked_increment_mock_call(self: Any, /, *args, **kwargs) -> None:
+    recording = self.__dict__.get("_megamock_call_recording")
+    if recording is not None and not recording.enabled:
+        return
+    super(type(self), self)._increment_mock_call(*args, **kwargs)
+    if (timings := self.__dict__.get("_megamock_call_timings")) is not None:
+        timings.starts.append(time.perf_counter_ns())
+    if (index := self.__dict__.get("_megamock_call_index")) is not None:
+        index._record_last_call()
+    # the call is also recorded on the parents, so they are trimmed too
+    node = self
+    while node is not None:
+        recording = node.__dict__.get("_megamock_call_recording")
+        if recording is not None and (maxlen := recording.maxlen) is not None:
+            if (index := node.__dict__.get("_megamock_call_index")) is not None:
+                index._trim(maxlen)
+            else:
+                _trim_calls(node.call_args_list, maxlen)
+            _trim_calls(node.mock_calls, maxlen)
+            _trim_calls(node.method_calls, maxlen)
+            if isinstance(node, mock.AsyncMockMixin):
+                _trim_calls(node.await_args_list, maxlen)
+        node = node._mock_new_parent
+    if (waiters := self.__dict__.get("_megamock_call_waiters")) is not None:
+        waiters.notify()
+
+
+def _hooked_reset_mock(self: Any, /, *args, **kwargs) -> None:
+    super(type(self), self).reset_mock(*args, **kwargs)
+    self.__dict__["_megamock_call_timings"].clear()
+
+
+def _hooked_execute_mock_call(self: Any, /, *args, **kwargs) -> Any:
+    execute = super(type(self), self)._execute_mock_call
+    if (cassette := self.__dict__["_megamock_cassette"]) is not None:
+        execute = _cassette_execute(self, cassette, execute)
+    end: float | None = None
+    if (simulation := self.__dict__["_megamock_simulation"]) is not None:
+        # the call is scheduled when it is made, not when it is awaited
+        end = simulation.schedule()
+    if isinstance(self, mock.AsyncMockMixin):
+        return _execute_async_mock_call(self, execute, simulation, end, args, kwargs)
+    if simulation is not None:
+        simulation.clock.sleep_until(end)
+    return execute(*args, **kwargs)
+
+
+def _cassette_execute(
+    legacy_mock: Any, cassette: Cassette, execute: Callable
+) -> Callable:
+    """
+    Execute the call of a spy and record the result, or replay the result when
+    there is nothing to call
+    """
+    name = _mock_path(legacy_mock)
+    if legacy_mock._mock_wraps is None:
+        if isinstance(legacy_mock, mock.AsyncMockMixin):
+
+            async def replay_awaited(*args, **kwargs) -> Any:
+                await execute(*args, **kwargs)  # for the await statistics
+                return cassette.replay(name, args, kwargs)
+
+            return replay_awaited
+        return lambda *args, **kwargs: cassette.replay(name, args, kwargs)
+
+    def record(*args, **kwargs) -> Any:
+        # fails on arguments that can't be keyed before the real call is made
+        key = cassette.call_key(name, args, kwargs)
+        try:
+            result = execute(*args, **kwargs)
+        except Exception as err:
+            cassette.record(name, args, kwargs, err, raised=True, key=key)
+            raise
+        if isawaitable(result):
+            return _record_awaited(cassette, name, args, kwargs, key, result)
+        cassette.record(name, args, kwargs, result, key=key)
+        return result
+
+    return record
+
+
+async def _record_awaited(
+    cassette: Cassette,
+    name: str,
+    args: tuple,
+    kwargs: dict,
+    key: bytes,
+    awaitable: Any,
+) -> Any:
+    try:
+        result = await awaitable
+    except Exception as err:
+        cassette.record(name, args, kwargs, err, raised=True, key=key)
+        raise
+    cassette.record(name, args, kwargs, result, key=key)
+    return result
+
+
+def _mock_path(legacy_mock: Any) -> str:
+    """
+    The attributes and calls leading to the mock from its root, like "client.get"
+    """
+    names = []
+    node = legacy_mock
+    while node._mock_new_parent is not None:
+        names.append(node._mock_new_name)
+        node = node._mock_new_parent
+    return ".".join(reversed(names)).replace(".()", "()")
+
+
+async def _execute_async_mock_call(
+    self: Any,
+    execute: Callable,
+    simulation: Simulation | None,
+    end: float | None,
+    args: tuple,
+    kwargs: dict,
+) -> Any:
+    start = time.perf_counter_ns()
+    try:
+        if simulation is not None:
+            await simulation.clock.async_sleep_until(cast(float, end))
+        return await execute(*args, **kwargs)
+    finally:
+        if (timings := self.__dict__["_megamock_call_timings"]) is not None:
+            timings.await_durations.append(time.perf_counter_ns() - start)
+
+
+def _trim_calls(calls: list, maxlen: int) -> None:
+    if (excess := len(calls) - maxlen) > 0:
+        del calls[:excess]
+        # lets snapshots of the list tell how far its entries have shifted
+        if (state := getattr(calls, "__dict__", None)) is not None:
+            state["_megamock_trimmed"] = trimmed_calls(calls) + excess
+
+
+def trimmed_calls(calls: list) -> int:
+    """
+    The number of calls trimmed from the front of a mock's call list
+    """
+    return getattr(calls, "_megamock_trimmed", 0)
+
+
+R = TypeVar("R", bound=AttributeTrackingBase)
+
+
+class TrackedRecords(deque[R]):
+    """
+    The tracked records of an attribute, oldest first. Depending on the tracking level,
+    older records are discarded. `total` counts all of them
+    """
+
+    def __init__(self, maxlen: int | None = None) -> None:
+        super().__init__(maxlen=maxlen)
+        self.total = 0
+
+    def append(self, record: R) -> None:
+        self.total += 1
+        super().append(record)
+
+
+class _AnnotationChecker:
+    """
+    What values assigned to an annotated attribute are checked against
+    """
+
+    __slots__ = ("hint", "check_type")
+
+    def __init__(self, hint: Any) -> None:
+        self.hint = hint
+        # This is pretty basic but should handle most cases
+        # Perhaps in the future this could handle things perfectly
+        self.check_type = hint
+        try:
+            isinstance(None, hint)
+        except TypeError:
+            # generics, such as list[str], are checked against their origin
+            if origin := get_origin(hint):
+                self.check_type = origin
+
+
+# spec -> (fingerprint, attribute name -> checker)
+_annotation_checkers_cache: weakref.WeakKeyDictionary[
+    Any, tuple[tuple | None, dict[str, _AnnotationChecker]]
+] = weakref.WeakKeyDictionary()
+
+
+def _annotation_checkers(spec: Any) -> dict[str, _AnnotationChecker]:
+    """
+    The checkers for the annotated attributes of the spec. Resolving the type hints
+    is slow, so they are cached for each spec
+    """
+    # instances change when their class does
+    fingerprint = spec_fingerprint(spec) or spec_fingerprint(type(spec))
+    try:
+        cached = _annotation_checkers_cache.get(spec)
+    except TypeError:
+        cached = None  # can't be weakly referenced
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    checkers = {
+        name: _AnnotationChecker(hint) for name, hint in get_type_hints(spec).items()
+    }
+    try:
+        _annotation_checkers_cache[spec] = (fingerprint, checkers)
+    except TypeError:
+        pass  # can't be weakly referenced
+    return checkers
 
 
 _base_mock_types = (
@@ -133,15 +835,40 @@ class MegaMockAttributes:
     spec: Any | None = None
     wraps: Any | None = None
     spy: Any | None = None
-    attr_assignments: dict[str, list[AttributeAssignment]] = field(
-        default_factory=lambda: defaultdict(list)
-    )
-    spied_access: dict[str, list[SpyAccess]] = field(
-        default_factory=lambda: defaultdict(list)
+    spy_snapshot: Callable[[Any], Any] = _shallow_copy
+    call_recording: CallRecording | None = None
+    call_index: CallIndex | None = None
+    call_timings: CallTimings | None = None
+    simulation: Simulation | None = None
+    cassette: Cassette | None = None
+    tracking: Tracking = field(
+        default_factory=lambda: Tracking(AttributeTrackingBase.default_tracking)
     )
     name: str | None = None
+    # the attribute of the parent this mock is, None for return values
+    attr_name: str | None = None
 
     _wrapped_mock: _base_mock_types | None = None
+    # the spec of the parent and the spec resolved from it
+    _spec_from_parents: tuple[Any, Any] | None = None
+    # created when first used, most mocks never have anything tracked
+    _attr_assignments: dict[str, TrackedRecords[AttributeAssignment]] | None = None
+    _spied_access: dict[str, TrackedRecords[SpyAccess]] | None = None
+
+    @property
+    def attr_assignments(self) -> dict[str, TrackedRecords[AttributeAssignment]]:
+        if (records := self._attr_assignments) is None:
+            records = self._attr_assignments = self._new_records()
+        return records
+
+    @property
+    def spied_access(self) -> dict[str, TrackedRecords[SpyAccess]]:
+        if (records := self._spied_access) is None:
+            records = self._spied_access = self._new_records()
+        return records
+
+    def _new_records(self) -> defaultdict[str, Any]:
+        return defaultdict(partial(TrackedRecords, self.tracking.maxlen))
 
 
 class _MegaMockMixin(Generic[T, U]):
@@ -180,6 +907,14 @@ class _MegaMockMixin(Generic[T, U]):
         instance: bool | None = None,
         side_effect: Any = None,
         return_value: Any = MISSING,
+        lazy: bool = False,
+        tracking: str | None = None,
+        spy_snapshot: SpySnapshot = "shallow",
+        record: str | None = None,
+        index_calls: bool | None = None,
+        time_calls: bool | None = None,
+        simulation: Simulation | None = None,
+        cassette: Cassette | None = None,
         _wraps_mock: (
             mock.Mock
             | mock.MagicMock
@@ -206,6 +941,30 @@ class _MegaMockMixin(Generic[T, U]):
         :param side_effect: The side effect to use for the mock. Exceptions are raised,
             fuctions are called, and iterables are returned in order in subsequent calls
         :param return_value: The return value to use for the mock.
+        :param lazy: If True and the spec is a class, the mocks for attributes are
+            created when first accessed instead of up front. Use for large classes
+            where only a few attributes are used
+        :param tracking: How much attribute assignment and spy access history to keep,
+            "full", "last:N", "count" or "off". Defaults to the tracking level of the
+            parent mock, or AttributeTrackingBase.default_tracking
+        :param spy_snapshot: How spied attribute values are recorded. "shallow" (the
+            default) records a shallow copy, "deep" a deep copy and "none" the value
+            itself. A callable is given the value and returns what to record
+        :param record: Which calls to record, "all", "last:N", "count" or "none". Use
+            for mocks called in hot loops to keep memory bounded. Defaults to the
+            setting of the parent mock, or "all"
+        :param index_calls: If True, index the calls as they are made so that
+            Mega.any_call and Mega.has_calls(..., any_order=True) don't compare every
+            call. Use for mocks called many times. Defaults to the setting of the
+            parent mock
+        :param time_calls: If True, record when each call is made, and for async
+            mocks how long it was awaited for, see Mega.call_timings. Defaults to the
+            setting of the parent mock
+        :param simulation: Make calls take time and queue up like calls to a remote
+            service, see Simulation. Shared with the attribute mocks
+        :param cassette: Record the results of the calls to the spied object, or
+            replay them if nothing is spied on, see Cassette. Shared with the
+            attribute mocks
         :param _wraps_mock: the wrapped mock, for internal use
         :param _parent_mega_mock: The parent MegaMock, for internal use
         :param _name: The name of the mock, for internal use
@@ -213,7 +972,14 @@ class _MegaMockMixin(Generic[T, U]):
         self.meganame = self._generate_meganame()
 
         self._linked_mock = None
-        megamock_attrs = MegaMockAttributes()
+        if tracking is not None:
+            megamock_attrs = MegaMockAttributes(tracking=Tracking(tracking))
+        elif _parent_mega_mock is not None:
+            megamock_attrs = MegaMockAttributes(
+                tracking=_parent_mega_mock.megamock.tracking
+            )
+        else:
+            megamock_attrs = MegaMockAttributes()
         megamock_attrs.name = self._generate_mock_name(spec, _parent_mega_mock, _name)
         self._wrapped_legacy_mock = None
         self._mock_return_value_cache = MISSING
@@ -235,14 +1001,15 @@ class _MegaMockMixin(Generic[T, U]):
             _wraps_mock = mock.MagicMock(wraps=wraps)
 
         megamock_attrs.spy = spy
+        megamock_attrs.spy_snapshot = _get_spy_snapshot(spy_snapshot)
         if return_value is not MISSING:
             kwargs["return_value"] = return_value
         kwargs["side_effect"] = side_effect
 
         if _wraps_mock is None:
             if spec is not None:
-                autospeced_legacy_mock = mock.create_autospec(
-                    spec, spec_set=spec_set, instance=instance, **kwargs
+                autospeced_legacy_mock = create_autospec(
+                    spec, spec_set=spec_set, instance=instance, lazy=lazy, **kwargs
                 )
                 megamock_attrs._wrapped_mock = autospeced_legacy_mock
             else:
@@ -260,6 +1027,45 @@ class _MegaMockMixin(Generic[T, U]):
                 self._mock_return_value_ = None
             megamock_attrs._wrapped_mock = _wraps_mock
 
+        if record is not None:
+            megamock_attrs.call_recording = CallRecording(record)
+        elif _parent_mega_mock is not None:
+            megamock_attrs.call_recording = _parent_mega_mock.megamock.call_recording
+        if _parent_mega_mock is not None:
+            if index_calls is None:
+                index_calls = _parent_mega_mock.megamock.call_index is not None
+            if time_calls is None:
+                time_calls = _parent_mega_mock.megamock.call_timings is not None
+            if simulation is None:
+                simulation = _parent_mega_mock.megamock.simulation
+            if cassette is None:
+                cassette = _parent_mega_mock.megamock.cassette
+        megamock_attrs.simulation = simulation
+        megamock_attrs.cassette = cassette
+        if (
+            megamock_attrs.call_recording is not None
+            or index_calls
+            or time_calls
+            or simulation is not None
+            or cassette is not None
+        ):
+            # not using `or`, that would record a call to __bool__
+            recorded_mock: Any = megamock_attrs._wrapped_mock
+            if recorded_mock is None:
+                recorded_mock = self
+            elif type(recorded_mock) is FunctionType:
+                # autospecced functions call the mock they wrap
+                recorded_mock = recorded_mock.mock  # type: ignore[attr-defined]
+            if index_calls:
+                megamock_attrs.call_index = CallIndex(recorded_mock)
+            if time_calls:
+                maxlen = None
+                if (recording := megamock_attrs.call_recording) is not None:
+                    # "count" keeps no calls, but the timings are still kept
+                    maxlen = recording.maxlen or None
+                megamock_attrs.call_timings = CallTimings(maxlen)
+            _install_call_hooks(recorded_mock, megamock_attrs)
+
         # must be last as the setattr behavior will change after this
         self.megamock = megamock_attrs
         # shortcut to the wrapped mock to avoid performance penalty
@@ -344,9 +1150,16 @@ class _MegaMockMixin(Generic[T, U]):
             result = getattr(self.megamock.spy, key)
             # if result is callable let wrapped handle it so that it's a mock object
             if not callable(result):
-                self.megamock.spied_access[key].append(
-                    SpyAccess.for_current_stack(key, result)
-                )
+                if (tracking := self.megamock.tracking).enabled:
+                    records = self.megamock.spied_access[key]
+                    if tracking.maxlen == 0:
+                        records.total += 1
+                    else:
+                        records.append(
+                            SpyAccess.for_current_stack(
+                                key, result, snapshot=self.megamock.spy_snapshot
+                            )
+                        )
                 return result
 
         if key == "_spec_signature":
@@ -370,6 +1183,7 @@ class _MegaMockMixin(Generic[T, U]):
                     mega_result.megamock.name = f"{self.megamock.name}()"
                 else:
                     mega_result.megamock.name = f"{self.megamock.name}.{key}"
+                    mega_result.megamock.attr_name = key
                 setattr(wrapped, key, mega_result)
                 return mega_result
             return result
@@ -387,9 +1201,12 @@ class _MegaMockMixin(Generic[T, U]):
             super().__setattr__(key, value)
         if self.megamock is not None:
             self._megamock_set_attr(key, value)
-            self.megamock.attr_assignments[key].append(
-                AttributeAssignment.for_current_stack(key, value)
-            )
+            if (tracking := self.megamock.tracking).enabled:
+                records = self.megamock.attr_assignments[key]
+                if tracking.maxlen == 0:
+                    records.total += 1
+                else:
+                    records.append(AttributeAssignment.for_current_stack(key, value))
         else:
             self.__dict__[key] = value
 
@@ -415,71 +1232,43 @@ class _MegaMockMixin(Generic[T, U]):
         # do not check type if assigning a mock object
         # note that MegaMock is a subclass of NonCallableMagicMock
         if not isinstance(value, mock.NonCallableMock | mock.NonCallableMagicMock):
-            allowed_values = get_type_hints(self.megamock.spec)[key]
-
-            def raise_type_error() -> None:
-                raise TypeError(f"{value!r} is not an instance of {allowed_values}")
-
-            # This is pretty basic but should handle most cases
-            # Perhaps in the future this could handle things perfectly
-            try:
-                is_allowed_type = isinstance(value, allowed_values)
-            except TypeError:
-                origin = get_origin(allowed_values)
-                if not origin:
-                    raise
-                if not isinstance(value, origin):
-                    raise_type_error()
-            else:
-                if not is_allowed_type:
-                    raise_type_error()
+            checker = _annotation_checkers(self.megamock.spec)[key]
+            if not isinstance(value, checker.check_type):
+                raise TypeError(f"{value!r} is not an instance of {checker.hint}")
 
-    def _get_spec_from_parents(
-        self, _parent_stack: list[_MegaMockMixin] | None = None
-    ) -> Any:
+    def _get_spec_from_parents(self) -> Any:
         """
         The built-in generate autospec function creates a few issues because
         it bypasses some of the tooling, so the whole tree of mocks are created
         without hitting MegaMock anywhere.
 
-        This function walks up the megamock parent tree to find the root,
-        then grabs the spec from there. It then walks back down, checking
-        the children of the wrapped mock for each MegaMock to see if one
-        of the legacy children mocks matches the wrapped mock from the
-        MegaMock that called this function. It then grabs the attribute
-        based on the name and the currently focused spec.
+        The spec is resolved from the spec of the root MegaMock, following the
+        attribute name each child was created from. Each MegaMock in the tree keeps
+        the spec it resolved until the spec of its parent changes.
         """
-        # to start, parent_stack is always empty
-        parent_stack = _parent_stack or []
-
-        # if this is a child mock, get the parent's spec
-        if self.megamock.parent:
-            cur_spec = self.megamock.parent._get_spec_from_parents(
-                parent_stack + [self]
-            )
-            # abort if for some reason there is no parent spec
-            if cur_spec is None:
-                return None
-        else:
+        if (parent := self.megamock.parent) is None:
             # the root MegaMock will hit this logic branch
-            cur_spec = self.megamock.spec
-        if cur_spec:
-            if not (wrapped := self._wrapped_legacy_mock):
-                return None
-            if parent_stack:
-                # the oldest item is the first element. The child that called this
-                # will be the last element of parent_stack.
-                child_that_called_me = parent_stack[-1]
-                for child_name, obj in wrapped._mock_children.items():
-                    if obj is child_that_called_me._wrapped_legacy_mock:
-                        return getattr(cur_spec, child_name)
-            else:
-                return cur_spec
-            # this is a class, and the child is an instance
-            if isinstance(cur_spec, type):
-                return cur_spec
-        # this will happen if the root has no spec
-        # or if the child that called this method cannot be located
+            return self.megamock.spec or None
+        # abort if for some reason there is no parent spec
+        if not (parent_spec := parent._get_spec_from_parents()):
+            return None
+        megamock_attrs = self.megamock
+        if (cached := megamock_attrs._spec_from_parents) is not None and (
+            cached[0] is parent_spec
+        ):
+            return cached[1]
+        spec = self._resolve_spec_from_parent(parent_spec)
+        megamock_attrs._spec_from_parents = (parent_spec, spec)
+        return spec
+
+    def _resolve_spec_from_parent(self, parent_spec: Any) -> Any:
+        if self._wrapped_legacy_mock is None:
+            return None
+        if (attr_name := self.megamock.attr_name) is not None:
+            return getattr(parent_spec, attr_name, None)
+        # this is a class, and the child is an instance
+        if isinstance(parent_spec, type):
+            return parent_spec
         return None
 
     def __enter__(self) -> U:
@@ -568,6 +1357,12 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
         wraps: None = None,
         spy: None = None,
         spec_set: bool = True,
+        tracking: str | None = None,
+        record: str | None = None,
+        index_calls: bool | None = None,
+        time_calls: bool | None = None,
+        simulation: Simulation | None = None,
+        cassette: Cassette | None = None,
         _wraps_mock: (
             mock.Mock
             | mock.MagicMock
@@ -600,6 +1395,13 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
         wraps: Any = None,
         spy: Any = None,
         spec_set: bool = True,
+        tracking: str | None = None,
+        record: str | None = None,
+        index_calls: bool | None = None,
+        time_calls: bool | None = None,
+        simulation: Simulation | None = None,
+        cassette: Cassette | None = None,
+        spy_snapshot: SpySnapshot = "shallow",
         _parent_mega_mock: _MegaMockMixin | None = None,
         _merged_type: type[U],
     ) -> None:
@@ -621,6 +1423,13 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
         wraps: T | None = None,
         spy: T | None = None,
         spec_set: bool = True,
+        tracking: str | None = None,
+        record: str | None = None,
+        index_calls: bool | None = None,
+        time_calls: bool | None = None,
+        simulation: Simulation | None = None,
+        cassette: Cassette | None = None,
+        spy_snapshot: SpySnapshot = "shallow",
         instance: bool | None = None,
         side_effect: T | None = None,
         return_value: T | None = None,
@@ -694,6 +1503,12 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
         spec_set: bool = True,
         side_effect: Any = None,
         return_value: Any = MISSING,
+        lazy: bool = False,
+        tracking: str | None = None,
+        record: str | None = None,
+        index_calls: bool | None = None,
+        time_calls: bool | None = None,
+        simulation: Simulation | None = None,
         _wraps_mock: (
             mock.Mock
             | mock.MagicMock
@@ -725,6 +1540,16 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
         :param side_effect: The side effect to use for the mock.
         :param return_value: The return value to use for the mock. Since this is for
             a class instance, it would be setting the return value of __call__
+        :param lazy: If True, the mocks for attributes are created when first accessed
+            instead of up front
+        :param tracking: How much attribute assignment and spy access history to keep,
+            "full", "last:N", "count" or "off"
+        :param record: Which calls to record, "all", "last:N", "count" or "none"
+        :param index_calls: If True, index the calls so that Mega.any_call and
+            Mega.has_calls don't compare every call
+        :param time_calls: If True, record when each call is made
+        :param simulation: Make calls take time and queue up like calls to a remote
+            service
         """
 
         return MegaMock(
@@ -733,6 +1558,12 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
             instance=True,
             side_effect=side_effect,
             return_value=return_value,
+            lazy=lazy,
+            tracking=tracking,
+            record=record,
+            index_calls=index_calls,
+            time_calls=time_calls,
+            simulation=simulation,
             _wraps_mock=_wraps_mock,
             _parent_mega_mock=_parent_mega_mock,
             _merged_type=type(MegaMock | spec.__class__),  # type: ignore
@@ -779,7 +1610,9 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
     ) -> M | MegaMock[M, MegaMock | T]:
         if not isclass(spec):
             raise Exception("MegaMock.the_class should be used with classes")
-        return_value = MegaMock.it(spec, spec_set=spec_set)
+        return_value = MegaMock.it(
+            spec, spec_set=spec_set, lazy=kwargs.get("lazy", False)
+        )
 
         return MegaMock(
             spec=spec,
@@ -800,6 +1633,8 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
         spec_set: bool = True,
         side_effect: Any = None,
         return_value: Any = MISSING,
+        spy_snapshot: SpySnapshot = "shallow",
+        cassette: Cassette | None = None,
         _wraps_mock: (
             mock.Mock
             | mock.MagicMock
@@ -825,6 +1660,10 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
             fuctions are called, and iterables are returned in order in subsequent
             calls
         :param return_value: The return value to use for the mock.
+        :param spy_snapshot: How spied attribute values are recorded, "shallow",
+            "deep", "none" or a callable that returns what to record
+        :param cassette: Record the results of the calls to the spied object, to
+            replay them later with MegaMock.replay
         """
 
         return MegaMock(
@@ -835,12 +1674,99 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
             instance=False,
             side_effect=side_effect,
             return_value=return_value,
+            spy_snapshot=spy_snapshot,
+            cassette=cassette,
             _wraps_mock=_wraps_mock,
             _parent_mega_mock=_parent_mega_mock,
             _merged_type=type(MegaMock | spec.__class__),
             **kwargs,
         )
 
+    @overload
+    @staticmethod
+    def stub(spec: type[T], **returns: Any) -> T:
+        ...
+
+    @overload
+    @staticmethod
+    def stub(spec: T, **returns: Any) -> T:
+        ...
+
+    @staticmethod
+    def stub(spec: Any, **returns: Any) -> Any:
+        """
+        A fake of a class instance or function that only returns canned values.
+
+        The methods of the stub are plain functions generated with the same
+        signatures as the spec, so calling them with the wrong arguments fails like
+        the real thing. Nothing is recorded and there are no child mocks, use this
+        for collaborators called in hot loops. Methods and attributes that are not
+        given a value return None. The generated code is cached for each spec.
+
+            stub = MegaMock.stub(Foo, some_method="value", moo="cow")
+            stub_func = MegaMock.stub(some_func, return_value="value")
+
+        :param spec: The class to create a stub instance of, or the function to stub
+        :param returns: What each method returns and what each attribute is, by name.
+            For functions, use return_value
+        """
+        return create_stub(spec, returns)
+
+    @no_type_check
+    @staticmethod
+    def replay(
+        spec: T,
+        cassette: Cassette | str | os.PathLike,
+        *,
+        spec_set: bool = True,
+        **kwargs,
+    ) -> T | MegaMock[T, MegaMock | T]:
+        """
+        MegaMock something, returning the results recorded on a cassette instead
+        of calling it. A call that wasn't recorded raises a CassetteMissException.
+
+        :param spec: The class or object that was spied on
+        :param cassette: The cassette, or the path it was saved to
+        :param spec_set: If True, only attributes in the spec will be allowed. Assigning
+            attributes not part of the spec will result in a AttributeError
+        """
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        return MegaMock(
+            spec=spec,
+            spec_set=spec_set,
+            cassette=cassette,
+            _merged_type=type(MegaMock | spec.__class__),
+            **kwargs,
+        )
+
+    @no_type_check
+    @staticmethod
+    def compiled(
+        spec: type[T], *, spec_set: bool = True, **kwargs
+    ) -> T | MegaMock[T, MegaMock | T]:
+        """
+        MegaMock a class instance, like `it`, using a class generated for the spec.
+
+        The generated class is cached for each spec. It knows the attributes of the
+        spec ahead of time, so after the first access, attributes are looked up
+        directly on the mock. Calls to its methods reuse the MegaMock for the
+        return value. Use this for mocks that are accessed or called in hot loops.
+
+        :param spec: The class to create a mock instance of
+        :param spec_set: If True, only attributes in the spec will be allowed. Assigning
+            attributes not part of the spec will result in a AttributeError
+        """
+        if "spy" in kwargs or "wraps" in kwargs:
+            raise ValueError("Compiled MegaMocks do not support spy or wraps")
+        return _compiled_class(spec)(
+            spec=spec,
+            spec_set=spec_set,
+            instance=True,
+            _merged_type=type(MegaMock | spec.__class__),
+            **kwargs,
+        )
+
     @staticmethod
     def from_legacy_mock(
         mock_obj: (
@@ -900,10 +1826,18 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
             if not isinstance(result, _MegaMockMixin) and isinstance(
                 result, mock.NonCallableMock | mock.NonCallableMagicMock
             ):
+                # set for the methods of compiled MegaMocks. Other MegaMocks wrap
+                # the result on every call, so each call gets its own MegaMock.
+                # Most of that time is unittest.mock creating a class per mock
+                cache = self.__dict__.get("_call_result_cache")
+                if cache is not None and cache[0] is result:
+                    return cache[1]
                 call_spec = self._get_call_spec()
                 mega_result = MegaMock.from_legacy_mock(
                     result, call_spec, self.megamock.wraps, parent_megamock=self
                 )
+                if cache is not None:
+                    self.__dict__["_call_result_cache"] = (result, mega_result)
                 return mega_result
             return result
         return super().__call__(*args, **kwargs)
@@ -940,6 +1874,7 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
         Determine what the spec is for a function's return based on the annnotations.
 
         This is used to a create a mock object with the same traits as the spec.
+        The spec is created once for each mock, as autospeccing is slow.
         """
         if self.megamock.spec is None:
             return None
@@ -951,7 +1886,80 @@ class MegaMock(_MegaMockMixin[T, U], mock.MagicMock, Generic[T, U]):
         return_type = annotations.get("return", None)
         if return_type is None:
             return None
-        return create_autospec(return_type, instance=True)
+        cached = self.__dict__.get("_call_spec_cache")
+        if cached is not None and cached[0] is return_type:
+            return cached[1]
+        call_spec = create_autospec(return_type, instance=True)
+        self.__dict__["_call_spec_cache"] = (return_type, call_spec)
+        return call_spec
+
+
+class _CompiledAttribute:
+    """
+    Descriptor for an attribute of the spec of a compiled MegaMock. The first access
+    uses the regular MegaMock logic and stores the result on the instance, which
+    takes precedence over this descriptor afterwards.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        value = obj.__getattr__(self.name)
+        if isinstance(value, _MegaMockMixin):
+            # enable reusing the MegaMock of the return value
+            value.__dict__.setdefault("_call_result_cache", (None, None))
+        obj.__dict__[self.name] = value
+        return value
+
+
+class _CompiledMegaMock(MegaMock[T, U]):
+    """
+    Base class of the classes generated by MegaMock.compiled
+    """
+
+    _compiled_names: frozenset[str] = frozenset()
+
+    def __setattr__(self, key, value) -> None:
+        if key in self._compiled_names:
+            self.__dict__.pop(key, None)
+        super().__setattr__(key, value)
+
+    def __delattr__(self, key) -> None:
+        if key in self._compiled_names:
+            self.__dict__.pop(key, None)
+        super().__delattr__(key)
+
+
+# spec -> (fingerprint, generated class)
+_compiled_classes: weakref.WeakKeyDictionary[
+    Any, tuple[tuple | None, type[_CompiledMegaMock]]
+] = weakref.WeakKeyDictionary()
+
+
+def _compiled_class(spec: Any) -> type[_CompiledMegaMock]:
+    fingerprint = spec_fingerprint(spec)
+    if (cached := _compiled_classes.get(spec)) is not None and cached[0] == fingerprint:
+        return cached[1]
+    # names used by MegaMock keep their regular behavior
+    names = frozenset(
+        name
+        for name in dir(spec)
+        if not mock._is_magic(name) and not hasattr(MegaMock, name)  # type: ignore
+    )
+    namespace: dict[str, Any] = {name: _CompiledAttribute(name) for name in names}
+    namespace["_compiled_names"] = names
+    compiled_class = type(
+        f"Compiled{getattr(spec, '__name__', 'MegaMock')}",
+        (_CompiledMegaMock,),
+        namespace,
+    )
+    _compiled_classes[spec] = (fingerprint, compiled_class)
+    return compiled_class
 
 
 MegaMockType = type[MegaMock[T, MegaMock | T] | T]
@@ -2,15 +2,32 @@ from __future__ import annotations
 
 import functools
 import inspect
+import json
 import logging
 import sys
+import threading
+import time
+from collections.abc import MutableSequence, Sequence
+from contextvars import ContextVar
 from functools import cached_property
-from types import ModuleType
-from typing import Any, Callable, Generic, Iterable, TypeVar, cast, no_type_check
+from operator import attrgetter, itemgetter
+from types import FrameType, ModuleType
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    TypeVar,
+    Union,
+    cast,
+    no_type_check,
+)
 from unittest import mock
 
 from varname import argname  # type: ignore
 
+from megamock.autospec import create_autospec
 from megamock.import_references import References
 from megamock.import_types import ModAndName
 from megamock.megamocks import MegaMock, _MegaMockMixin, _UseRealLogic
@@ -32,6 +49,7 @@ class MegaPatchBehavior:
         self,
         *,
         autospec: bool,
+        lazy: bool = False,
     ) -> None:
         """
         Define the mocking behavior.
@@ -41,31 +59,560 @@ class MegaPatchBehavior:
         behavior.
 
         :param autospec: Autospec the thing being mocked
+        :param lazy: When autospeccing a class, create the mocks for attributes
+            when they are first accessed instead of up front
         """
         self.autospec = autospec
+        self.lazy = lazy
 
     @staticmethod
     def for_thing(thing: Any) -> MegaPatchBehavior:
         return MegaPatchBehavior(autospec=True)
 
 
+class _PhaseTimer:
+    """
+    Accumulates the time spent in each phase since the previous lap
+    """
+
+    __slots__ = ("laps", "_last")
+
+    def __init__(self) -> None:
+        self.laps: dict[str, int] = {}
+        self._last = time.perf_counter_ns()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter_ns()
+        self.laps[phase] = self.laps.get(phase, 0) + now - self._last
+        self._last = now
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    laps: dict[str, int] = {}
+
+    def lap(self, phase: str) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class PatchTimings:
+    """
+    Opt-in timings of the phases of MegaPatch.it and MegaPatch.stop, aggregated
+    per target. When disabled, nothing is measured.
+
+    Phases:
+        autospec - creating the new value, which is usually create_autospec
+        argname - determining the name of the thing from the calling code
+        resolve_path - finding the module path and the original name
+        build_patches - creating a patch for each reference to the target
+        start - starting the patches
+        stop - stopping the patches
+
+        PatchTimings.enable()
+        ...
+        PatchTimings.report()
+    """
+
+    PHASES = ("autospec", "argname", "resolve_path", "build_patches", "start", "stop")
+
+    enabled = False
+    # target -> phase -> [count, total ns, max ns]
+    _stats: dict[str, dict[str, list[int]]] = {}
+
+    @staticmethod
+    def enable() -> None:
+        PatchTimings.enabled = True
+
+    @staticmethod
+    def disable() -> None:
+        PatchTimings.enabled = False
+
+    @staticmethod
+    def clear() -> None:
+        PatchTimings._stats.clear()
+
+    @staticmethod
+    def timer() -> _PhaseTimer | _NullTimer:
+        if PatchTimings.enabled:
+            return _PhaseTimer()
+        return _NULL_TIMER
+
+    @staticmethod
+    def add(target: str, timer: _PhaseTimer | _NullTimer) -> None:
+        if not timer.laps:
+            return
+        phases = PatchTimings._stats.setdefault(target, {})
+        for phase, elapsed in timer.laps.items():
+            if (stats := phases.get(phase)) is None:
+                phases[phase] = [1, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = max(stats[2], elapsed)
+
+    @staticmethod
+    def as_dict() -> dict[str, dict[str, dict[str, int]]]:
+        """
+        The aggregated timings, keyed by target and then by phase.
+        Times are in nanoseconds.
+        """
+        return {
+            target: {
+                phase: {"count": count, "total_ns": total, "max_ns": max_ns}
+                for phase, (count, total, max_ns) in phases.items()
+            }
+            for target, phases in PatchTimings._stats.items()
+        }
+
+    @staticmethod
+    def write_json(path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(PatchTimings.as_dict(), f, indent=2)
+
+    @staticmethod
+    def slowest(limit: int = 10) -> list[tuple[str, int]]:
+        """
+        The targets with the largest total time across all phases, slowest first
+        """
+        totals = [
+            (target, sum(stats[1] for stats in phases.values()))
+            for target, phases in PatchTimings._stats.items()
+        ]
+        totals.sort(key=lambda target_and_total: target_and_total[1], reverse=True)
+        return totals[:limit]
+
+    @staticmethod
+    def report(limit: int = 10) -> list[str]:
+        """
+        Lines describing the slowest patched targets and where the time went
+        """
+        lines = []
+        for target, total in PatchTimings.slowest(limit):
+            phases = PatchTimings._stats[target]
+            count = max(stats[0] for stats in phases.values())
+            breakdown = ", ".join(
+                f"{phase} {phases[phase][1] / 1e6:.2f}ms"
+                for phase in PatchTimings.PHASES
+                if phase in phases
+            )
+            lines.append(f"{total / 1e6:8.2f}ms {target} (x{count}): {breakdown}")
+        return lines
+
+
+_SEQUENCE_ITERATORS: tuple[type, ...] = (type(iter([])), type(iter(())))
+
+
+def _remaining_values(iterator: Any) -> tuple:
+    """
+    The values a list or tuple iterator has left, without consuming them
+    """
+    _, (sequence, *_), *position = cast(tuple, iterator.__reduce__())
+    return tuple(sequence[position[0] if position else 0 :])
+
+
+class _MockBaseline:
+    """
+    The configured return values, side effects, assigned attributes and child mocks
+    of a tree of mocks, so that the tree can be reset to this state later on
+    """
+
+    def __init__(self, root: Any) -> None:
+        self._roots = [node for node in [_legacy_mock(root)] if node is not None]
+        # id of the mock -> (mock, return value, side effect, attributes, children)
+        self._values: dict[int, tuple[Any, Any, Any, dict, dict]] = {}
+        # iterators other than those over a list or tuple may be endless or
+        # single use, so they cannot be copied without changing them
+        self.restorable = True
+        for node in self._nodes():
+            side_effect = node.side_effect
+            if isinstance(side_effect, mock._MockIter):  # type: ignore
+                side_effect = side_effect.obj
+            if isinstance(side_effect, _SEQUENCE_ITERATORS):
+                side_effect = _remaining_values(side_effect)
+            elif isinstance(side_effect, Iterator):
+                self.restorable = False
+            self._values[id(node)] = (
+                node,
+                _raw_return_value(node),
+                side_effect,
+                _assigned_attributes(node),
+                dict(node._mock_children),
+            )
+
+    def _nodes(self) -> list[mock.NonCallableMock]:
+        nodes = []
+        seen: set[int] = set()
+        stack = list(self._roots)
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            nodes.append(node)
+            for child in [*node._mock_children.values(), _raw_return_value(node)]:
+                if (legacy_child := _legacy_mock(child)) is not None:
+                    stack.append(legacy_child)
+        return nodes
+
+    def restore(self) -> None:
+        # put back the attributes first, so mocks added since are left out below
+        for node, _, _, attributes, children in self._values.values():
+            for name in _assigned_attributes(node).keys() - attributes.keys():
+                del node.__dict__[name]
+            node.__dict__.update(attributes)
+            node._mock_children.clear()
+            node._mock_children.update(children)
+        for node in self._nodes():
+            _reset_call_history(node)
+            if (values := self._values.get(id(node))) is not None:
+                _, return_value, side_effect, _, _ = values
+            else:
+                return_value, side_effect = mock.DEFAULT, None
+            node.return_value = return_value
+            node.side_effect = side_effect
+
+
+def _assigned_attributes(node: mock.NonCallableMock) -> dict[str, Any]:
+    """
+    The attributes assigned to a mock, by a test or when it was autospecced
+    """
+    return {
+        name: value
+        for name, value in node.__dict__.items()
+        if not name.startswith("_") and name != "method_calls"
+    }
+
+
+def _legacy_mock(value: Any) -> mock.NonCallableMock | None:
+    """
+    Get the unittest.mock object that holds the state of a mock value
+    """
+    if isinstance(value, _MegaMockMixin):
+        return cast(mock.NonCallableMock, value._wrapped_legacy_mock or value)
+    if isinstance(value, mock.NonCallableMock):
+        return value
+    # autospec'ed functions keep the mock as an attribute
+    if inspect.isfunction(value) and isinstance(
+        mocked := getattr(value, "mock", None), mock.NonCallableMock
+    ):
+        return mocked
+    return None
+
+
+def _reset_call_history(node: mock.NonCallableMock) -> None:
+    """
+    Reset the calls of a single mock. Unlike reset_mock, this does not recurse
+    """
+    node.called = False
+    node.call_args = None
+    node.call_count = 0
+    node.mock_calls = mock._CallList()
+    node.call_args_list = mock._CallList()
+    node.method_calls = mock._CallList()
+
+
+def _raw_return_value(node: mock.NonCallableMock) -> Any:
+    """
+    Get the return value of a mock without creating one if it is not set
+    """
+    if (delegate := node.__dict__.get("_mock_delegate")) is not None:
+        return delegate.return_value
+    return node.__dict__.get("_mock_return_value", mock.DEFAULT)
+
+
+_Patch = Union[mock._patch, "_ScopedPatch", "_MockerPatch"]
+
+# the values of scoped patches for the current thread or task, by patched path
+_scoped_values: ContextVar[dict[str, tuple[Any, ...]]] = ContextVar(
+    "megapatch_scoped_values", default={}
+)
+_scoped_lock = threading.Lock()
+
+
+class _ScopedProxy:
+    """
+    Stands in for a patched attribute and dispatches to the value patched in by the
+    current thread or task, or to the original value everywhere else
+    """
+
+    __slots__ = ("_path", "_original")
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._original: Any = None
+
+    def _resolve(self) -> Any:
+        if (values := _scoped_values.get().get(self._path)) is None:
+            return self._original
+        return values[-1]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        # inlined _resolve, as this is the hot path
+        if (values := _scoped_values.get().get(self._path)) is None:
+            return self._original(*args, **kwargs)
+        return values[-1](*args, **kwargs)
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        # behave like the value would if it were set on the class directly
+        target = self._resolve()
+        if (get := getattr(type(target), "__get__", None)) is None:
+            return target
+        return get(target, obj, owner)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<scoped patch of {self._path}: {self._resolve()!r}>"
+
+
+class _ScopedTarget:
+    """
+    The proxy patched into a path, which is shared by all scoped patches of that path
+    """
+
+    # path -> target, guarded by _scoped_lock
+    _targets: dict[str, _ScopedTarget] = {}
+
+    def __init__(self, path: str, patcher: Any, kwargs: dict) -> None:
+        self.proxy = _ScopedProxy(path)
+        self.patch = patcher(path, self.proxy, **kwargs)
+        self.proxy._original = self.patch.get_original()[0]
+        self.kwargs = kwargs
+        # the scoped patches using the proxy, from any thread or task
+        self.owners: set[_ScopedPatch] = set()
+        # module attributes are not descriptors, so only calls can be dispatched
+        if isinstance(self.patch.getter(), ModuleType) and not callable(
+            self.proxy._original
+        ):
+            raise ValueError(
+                f"Scoped patches of module attributes must be callable: {path}"
+            )
+
+    def same_kwargs(self, kwargs: dict) -> bool:
+        return self.kwargs.keys() == kwargs.keys() and all(
+            value is self.kwargs[key] or value == self.kwargs[key]
+            for key, value in kwargs.items()
+        )
+
+    @staticmethod
+    def acquire(path: str, patcher: Any, kwargs: dict, owner: _ScopedPatch) -> None:
+        with _scoped_lock:
+            if (target := _ScopedTarget._targets.get(path)) is None:
+                target = _ScopedTarget(path, patcher, kwargs)
+                target.patch.start()
+                _ScopedTarget._targets[path] = target
+            elif not target.same_kwargs(kwargs):
+                # the proxy is patched in once, so only one set of arguments applies
+                raise ValueError(
+                    f"{path} already has scoped patches made with {target.kwargs!r}, "
+                    f"which conflict with {kwargs!r}"
+                )
+            target.owners.add(owner)
+
+    @staticmethod
+    def release(path: str, owner: _ScopedPatch) -> None:
+        with _scoped_lock:
+            target = _ScopedTarget._targets.get(path)
+            if target is None or owner not in target.owners:
+                return
+            target.owners.remove(owner)
+            if not target.owners:
+                target.patch.stop()
+                del _ScopedTarget._targets[path]
+
+
+class _ScopedPatch:
+    """
+    Patch that is only visible to the thread or asyncio task that started it,
+    along with the tasks it creates afterwards
+    """
+
+    def __init__(self, path: str, new: Any, patcher: Any, kwargs: dict) -> None:
+        self.path = path
+        self.new = new
+        self._patcher = patcher
+        self._kwargs = kwargs
+
+    def start(self) -> Any:
+        _ScopedTarget.acquire(self.path, self._patcher, self._kwargs, self)
+        values = _scoped_values.get()
+        stack = values.get(self.path, ())
+        _scoped_values.set({**values, self.path: stack + (self.new,)})
+        return self.new
+
+    def stop(self) -> None:
+        values = _scoped_values.get()
+        stack = values.get(self.path, ())
+        # when stopped from another thread or task, the owner's values are left as-is
+        for index in reversed(range(len(stack))):
+            if stack[index] is self.new:
+                values = dict(values)
+                if remaining := stack[:index] + stack[index + 1 :]:
+                    values[self.path] = remaining
+                else:
+                    del values[self.path]
+                _scoped_values.set(values)
+                break
+        _ScopedTarget.release(self.path, self)
+
+
+def _order_for_stopping(megapatches: list[MegaPatch]) -> None:
+    """
+    Move the started patches of the MegaPatches to the front of the lists that
+    mock.patch.stopall() and pytest-mock style mockers use, in the order they are
+    about to be stopped.
+
+    Stopping a patch removes it from these lists, which is a linear search, so
+    stopping many patches would otherwise take quadratic time.
+    """
+    # id of the list -> (list, patches in the order they are stopped)
+    registries: dict[int, tuple[list, list]] = {}
+    # id of the mocker's list -> (its _MockerRegistry, mocks in the order they are
+    # stopped)
+    mocker_registries: dict[int, tuple[_MockerRegistry, list]] = {}
+    for megapatch in megapatches:
+        if not isinstance(patches := megapatch.patches, list):
+            continue  # a mocked MegaPatch
+        for patch in reversed(patches):
+            if isinstance(patch, _MockerPatch):
+                if patch._started and (
+                    mocker_registry := _MockerRegistry.of(patch._mocker)
+                ):
+                    mocker_registries.setdefault(
+                        id(mocker_registry.entries), (mocker_registry, [])
+                    )[1].append(patch._mocked)
+                continue
+            registry = getattr(type(patch), "_active_patches", None)
+            if isinstance(registry, list):
+                registries.setdefault(id(registry), (registry, []))[1].append(patch)
+    for mocker_registry, mocks in mocker_registries.values():
+        for patcher in mocker_registry.move_to_front(mocks):
+            # the mocker stops its patchers, which are in mock.patch's list too
+            registry = getattr(type(patcher), "_active_patches", None)
+            if isinstance(registry, list):
+                registries.setdefault(id(registry), (registry, []))[1].append(
+                    patcher
+                )
+    for registry, patches in registries.values():
+        _move_to_front(registry, patches, lambda patch: patch)
+
+
+def _move_to_front(entries: list, keys: list, key: Callable[[Any], Any]) -> list:
+    """
+    Move the entries with the keys to the front of the list, in the order of the
+    keys. Returns the moved entries
+    """
+    order = {id(k): index for index, k in enumerate(keys)}
+    moved = sorted(
+        (entry for entry in entries if id(key(entry)) in order),
+        key=lambda entry: order[id(key(entry))],
+    )
+    entries[:] = moved + [entry for entry in entries if id(key(entry)) not in order]
+    return moved
+
+
+class _MockerRegistry:
+    """
+    The list a pytest-mock style mocker keeps its started patches in
+    """
+
+    def __init__(
+        self,
+        entries: list,
+        mock_of: Callable[[Any], Any],
+        patcher_of: Callable[[Any], Any],
+    ) -> None:
+        self.entries = entries
+        self._mock_of = mock_of
+        self._patcher_of = patcher_of
+
+    @staticmethod
+    def of(mocker: Any) -> _MockerRegistry | None:
+        # pytest-mock before 3.12
+        entries = getattr(mocker, "_patches_and_mocks", None)
+        if isinstance(entries, list):
+            return _MockerRegistry(entries, itemgetter(1), itemgetter(0))
+        # pytest-mock 3.12 and later
+        entries = getattr(getattr(mocker, "_mock_cache", None), "cache", None)
+        if isinstance(entries, list):
+            return _MockerRegistry(entries, attrgetter("mock"), attrgetter("patch"))
+        return None
+
+    def move_to_front(self, mocks: list) -> list:
+        """
+        Move the patches of the mocks to the front, in the order of the mocks.
+        Returns their patchers
+        """
+        moved = _move_to_front(self.entries, mocks, self._mock_of)
+        return [self._patcher_of(entry) for entry in moved]
+
+
+class _MockerPatch:
+    """
+    Patch made by pytest-mock or a similar mocker. These mockers start patches as
+    they are made and keep track of them, so mocker.stopall() undoes them too
+    """
+
+    def __init__(self, mocker: Any, path: str, new: Any, kwargs: dict) -> None:
+        self._mocker = mocker
+        self._path = path
+        self._new = new
+        self._kwargs = kwargs
+        self._mocked: Any = None
+        self._started = False
+
+    def start(self) -> Any:
+        self._mocked = self._mocker.patch(self._path, self._new, **self._kwargs)
+        self._started = True
+        return self._mocked
+
+    def stop(self) -> None:
+        if not self._started:
+            return
+        self._started = False
+        if not hasattr(self._mocker, "stop"):
+            # older versions of pytest-mock can only undo every patch
+            self._mocker.stopall()
+            return
+        try:
+            self._mocker.stop(self._mocked)
+        except ValueError:
+            pass  # already undone by mocker.stopall()
+
+
 class MegaPatchContext:
-    _active_patches: set[MegaPatch]
+    # dictionary is used as an ordered set so patches can be stopped in reverse order
+    _active_patches: dict[MegaPatch, None]
 
     def __init__(self) -> None:
-        self._active_patches = set()
+        self._active_patches = {}
 
     def active_patches(self) -> list[MegaPatch]:
         return list(self._active_patches)
 
     def add(self, megapatch: MegaPatch) -> None:
-        self._active_patches.add(megapatch)
+        self._active_patches[megapatch] = None
+
+    def add_all(self, megapatches: Iterable[MegaPatch]) -> None:
+        self._active_patches.update(dict.fromkeys(megapatches))
 
     def remove(self, megapatch: MegaPatch) -> None:
-        self._active_patches.remove(megapatch)
+        del self._active_patches[megapatch]
+
+    def remove_all(self, megapatches: Iterable[MegaPatch]) -> None:
+        for megapatch in megapatches:
+            self._active_patches.pop(megapatch, None)
 
     def stop_all(self) -> None:
-        for megapatch in self.active_patches():
+        # stop the most recent patches first so stacked patches restore correctly
+        megapatches = self.active_patches()[::-1]
+        _order_for_stopping(megapatches)
+        for megapatch in megapatches:
             megapatch.stop()
 
     def __del__(self) -> None:
@@ -77,18 +624,122 @@ class MegaPatchContext:
     def __enter__(self) -> MegaPatchContext:
         # with MegaPatch.new_context(): already adds to the stack
         if self not in MegaPatch.context_stack:
-            MegaPatch.context_stack.append(self)
+            MegaPatch._push_context(self)
         return self
 
     def __exit__(self, *args, **kwargs) -> None:
         self.stop_all()
-        top_of_stack = MegaPatch.context_stack.pop()
+        top_of_stack = MegaPatch._pop_context()
         assert top_of_stack is self
 
 
+class _ContextStackView(MutableSequence[MegaPatchContext]):
+    """
+    List-like view of the context stack of the current thread or asyncio task.
+    Changes replace the stack of the current thread or task only
+    """
+
+    def __getitem__(self, index: Any) -> Any:
+        return _context_stack.get()[index]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        stack = list(_context_stack.get())
+        stack[index] = value
+        _context_stack.set(tuple(stack))
+
+    def __delitem__(self, index: Any) -> None:
+        stack = list(_context_stack.get())
+        del stack[index]
+        _context_stack.set(tuple(stack))
+
+    def __len__(self) -> int:
+        return len(_context_stack.get())
+
+    def insert(self, index: int, value: MegaPatchContext) -> None:
+        stack = list(_context_stack.get())
+        stack.insert(index, value)
+        _context_stack.set(tuple(stack))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _ContextStack:
+    """
+    The context stack of the current thread or asyncio task, as a list-like view
+    """
+
+    def __get__(self, obj: Any, owner: Any = None) -> _ContextStackView:
+        return _ContextStackView()
+
+
+class MegaPatchGroup:
+    """
+    A group of MegaPatch objects that are started and stopped as a single unit.
+
+    Created using MegaPatch.many(...)
+    """
+
+    def __init__(
+        self, megapatches: list[MegaPatch], context: MegaPatchContext | None = None
+    ) -> None:
+        self._megapatches = megapatches
+        self._context = context or MegaPatch.current_context()
+
+    @property
+    def megapatches(self) -> list[MegaPatch]:
+        return list(self._megapatches)
+
+    def __iter__(self) -> Iterator[MegaPatch]:
+        return iter(self._megapatches)
+
+    def __len__(self) -> int:
+        return len(self._megapatches)
+
+    def __getitem__(self, index: int) -> MegaPatch:
+        return self._megapatches[index]
+
+    def start(self) -> None:
+        started: list[MegaPatch] = []
+        try:
+            for megapatch in self._megapatches:
+                if not megapatch._started:
+                    megapatch._start_patches()
+                    started.append(megapatch)
+        except BaseException:
+            # the started patches are not registered yet, so nothing else undoes them
+            for megapatch in reversed(started):
+                megapatch._stop_patches()
+            raise
+        self._context.add_all(started)
+        MegaPatch.root_context.add_all(started)
+
+    def stop(self) -> None:
+        stopped = [mp for mp in reversed(self._megapatches) if mp._started]
+        _order_for_stopping(stopped)
+        for megapatch in stopped:
+            megapatch._stop_patches()
+        self._context.remove_all(stopped)
+        MegaPatch.root_context.remove_all(stopped)
+
+    def __enter__(self) -> MegaPatchGroup:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
 class MegaPatch(Generic[T, U]):
     root_context = MegaPatchContext()
-    context_stack = [root_context]
+    # each thread and asyncio task has its own stack, so concurrently running tests
+    # register their patches with their own context
+    context_stack = _ContextStack()
 
     default_mocker: ModuleType | object = mock
 
@@ -96,23 +747,28 @@ class MegaPatch(Generic[T, U]):
         self,
         *,
         thing: Any,
-        patches: list[mock._patch],
+        patches: list[_Patch],
         new_value: MegaMock | Any,
         return_value: Any,
         mocker: ModuleType | object,
         context: MegaPatchContext | None = None,
+        reusable: bool = False,
     ) -> None:
         self._patches = patches
         self._thing: Any | None = thing
         self._new_value: MegaMock = new_value
         self._return_value = return_value
         self._mocker = mocker
-        self._context = context or MegaPatch.context_stack[-1]
+        self._context = context or MegaPatch.current_context()
+        self._passed_in_name = ""
+        self._reusable = reusable
+        self._baseline: _MockBaseline | None = None
+        self._target = ""
 
         self._started = False
 
     @property
-    def patches(self) -> list[mock._patch]:
+    def patches(self) -> list[_Patch]:
         return list(self._patches)
 
     @property
@@ -183,29 +839,80 @@ class MegaPatch(Generic[T, U]):
         except AttributeError:
             raise ValueError("Not a context manager")
 
+    @property
+    def reusable(self) -> bool:
+        return self._reusable
+
+    def mark_baseline(self) -> None:
+        """
+        Record the current return values, side effects, assigned attributes and
+        child mocks of the mock as the state to go back to when calling `reset`
+
+        Side effects that are iterators over anything but a list or tuple cannot
+        be recorded, and make the patch no longer reusable
+        """
+        self._baseline = _MockBaseline(self._new_value)
+        if not self._baseline.restorable:
+            # the side effect iterator can't be restored, so the patch can't
+            # be reset between tests
+            self._reusable = False
+
+    def reset(self) -> None:
+        """
+        Reset the mock back to the recorded baseline. This clears the call history
+        and restores the return values, side effects, assigned attributes and child
+        mocks. The patch stays in place.
+
+        If a baseline has not been recorded, the current state is used.
+        """
+        if self._baseline is None:
+            self.mark_baseline()
+        assert self._baseline is not None
+        if not self._baseline.restorable:
+            raise ValueError(
+                "Cannot reset a mock with a side effect iterator that is not "
+                "a list or tuple"
+            )
+        self._baseline.restore()
+
     def start(self) -> None:
         if self._started:
             return
-        # support for pytest-mock and similar
-        if not hasattr(self._mocker, "stopall"):
-            # built-in mock
-            for patch in self._patches:
-                patch.start()
+        self._start_patches()
         self._context.add(self)
         MegaPatch.root_context.add(self)
-        self._started = True
 
     def stop(self) -> None:
-        # support for pytest-mock and similar
-        if hasattr(self._mocker, "stopall"):
-            self._mocker.stopall()  # type: ignore
-        else:
-            # built-in mock
-            for patch in self._patches:
-                patch.stop()
-        self._context.remove(self)
+        self._stop_patches()
+        # patches made in a new thread or task are added to the root context only
+        if self._context is not MegaPatch.root_context:
+            self._context.remove(self)
         MegaPatch.root_context.remove(self)
+
+    def _start_patches(self) -> None:
+        timer = PatchTimings.timer()
+        for index, patch in enumerate(self._patches):
+            try:
+                patch.start()
+            except BaseException:
+                for started in reversed(self._patches[:index]):
+                    started.stop()
+                raise
+        self._started = True
+        timer.lap("start")
+        PatchTimings.add(self._target, timer)
+
+    def _stop_patches(self) -> None:
+        if not self._started:
+            return
+        # only undo the patches owned by this MegaPatch, even when the mocker
+        # is able to stop everything at once
+        timer = PatchTimings.timer()
+        for patch in reversed(self._patches):
+            patch.stop()
         self._started = False
+        timer.lap("stop")
+        PatchTimings.add(self._target, timer)
 
     def __enter__(self) -> MegaPatch[T, U]:
         self.start()
@@ -232,18 +939,55 @@ class MegaPatch(Generic[T, U]):
     @staticmethod
     def new_context() -> MegaPatchContext:
         context = MegaPatchContext()
-        MegaPatch.context_stack.append(context)
+        MegaPatch._push_context(context)
         return context
 
+    @staticmethod
+    def current_context() -> MegaPatchContext:
+        """
+        The context that new patches are added to in the current thread or task
+        """
+        return _context_stack.get()[-1]
+
+    @staticmethod
+    def _push_context(context: MegaPatchContext) -> None:
+        _context_stack.set(_context_stack.get() + (context,))
+
+    @staticmethod
+    def _pop_context() -> MegaPatchContext:
+        *rest, top_of_stack = _context_stack.get()
+        _context_stack.set(tuple(rest))
+        return top_of_stack
+
     @staticmethod
     def active_patches(context: MegaPatchContext | None = None) -> list[MegaPatch]:
         return (context or MegaPatch.root_context).active_patches()
 
     @staticmethod
     def stop_all(context: MegaPatchContext | None = None) -> None:
-        for megapatch in list((context or MegaPatch).active_patches()):
+        megapatches = (context or MegaPatch).active_patches()[::-1]
+        _order_for_stopping(megapatches)
+        for megapatch in megapatches:
             megapatch.stop()
 
+    @staticmethod
+    def mark_reusable_baselines() -> None:
+        """
+        Record the baseline for active reusable patches that do not have one yet
+        """
+        for megapatch in MegaPatch.active_patches():
+            if megapatch._reusable and megapatch._baseline is None:
+                megapatch.mark_baseline()
+
+    @staticmethod
+    def reset_reusable() -> None:
+        """
+        Reset active reusable patches back to their baseline
+        """
+        for megapatch in MegaPatch.active_patches():
+            if megapatch._reusable:
+                megapatch.reset()
+
     @staticmethod
     def _get_new_and_return_value_with_autospec(
         behavior: MegaPatchBehavior,
@@ -253,7 +997,9 @@ class MegaPatch(Generic[T, U]):
         side_effect: Iterable | Exception | None,
     ) -> tuple[Any, Any]:
         if behavior.autospec:
-            autospeced = mock.create_autospec(thing, spec_set=spec_set)
+            autospeced = create_autospec(
+                thing, spec_set=spec_set, lazy=behavior.lazy
+            )
             if inspect.isfunction(autospeced):
                 assert hasattr(autospeced, "return_value")
                 if return_value is not _MISSING:
@@ -282,6 +1028,8 @@ class MegaPatch(Generic[T, U]):
         mocker: ModuleType | object | None = None,
         new_callable: Callable | None = None,
         side_effect: Any | None = None,
+        reusable: bool = False,
+        scoped: bool = False,
         **kwargs: Any,
     ) -> MegaPatch[T, MegaMock[T, MegaMock | T] | T]:
         """
@@ -298,7 +1046,149 @@ class MegaPatch(Generic[T, U]):
             This is mainly for legacy support and is not recommended since it can't be
             combined with autospec.
         :param side_effect: The side-effect to use
+        :param reusable: If true, the patch is meant to stay in place across tests.
+            Instead of re-patching, the mock is reset back to a baseline between
+            tests. With the pytest plugin, the baseline is recorded when the next
+            test starts, so patches can be configured in session or module fixtures
+        :param scoped: If true, the patch is only visible to the thread or asyncio
+            task that started it, and the tasks it creates afterwards. Everywhere
+            else sees the original. The patched attribute is a proxy that dispatches
+            to the right value, so identity and isinstance checks against it will
+            not work as usual
         """
+        MegaPatch._scoped_check(scoped, new_callable)
+        timer = PatchTimings.timer()
+        mocker = MegaPatch._resolve_mocker(mocker, autostart)
+        thing, parent_mock, new, return_value = MegaPatch._prepare_new_value(
+            thing, new, spec_set, behavior, new_callable, side_effect, kwargs
+        )
+        timer.lap("autospec")
+
+        # if object has qualified name, use that instead of passed in name
+        if (passed_in_name := getattr(thing, "__qualname__", None)) is None:
+            passed_in_name = argname("thing", func=MegaPatch.it, vars_only=False)
+        timer.lap("argname")
+
+        mega_patch = MegaPatch._create(
+            thing,
+            passed_in_name,
+            sys._getframe(1),
+            new,
+            return_value,
+            mocker,
+            kwargs,
+            reusable=reusable,
+            scoped=scoped,
+            timer=timer,
+        )
+        PatchTimings.add(mega_patch._target, timer)
+        if autostart:
+            mega_patch.start()
+
+        MegaPatch._maybe_assign_link(
+            parent_mock, mega_patch._passed_in_name, mega_patch
+        )
+
+        return mega_patch
+
+    @no_type_check
+    @staticmethod
+    def many(
+        *things: Any,
+        spec_set: bool = True,
+        autostart: bool = True,
+        mocker: ModuleType | object | None = None,
+        reusable: bool = False,
+        scoped: bool = False,
+        **kwargs: Any,
+    ) -> MegaPatchGroup:
+        """
+        MegaPatch many things at once.
+
+        The targets are resolved in a single pass and the resulting patches are
+        started and stopped together as a MegaPatchGroup. Patches are stopped in
+        reverse order. Passing the same thing more than once patches it once.
+
+            patches = MegaPatch.many(Foo, Bar.some_method, some_func)
+            patches[0].megainstance.some_method.return_value = "val"
+
+        :param things: The things to patch
+        :param spec_set: If true, then raise an attribute error when setting an
+            attribute that doesn't exist on a class
+        :param autostart: If true, then start the patches immediately
+        :param mocker: The object to use for patching. If None, then use the default
+        :param reusable: If true, the patches are reset between tests rather than
+            re-patched, see MegaPatch.it
+        :param scoped: If true, the patches are only visible to the current thread or
+            asyncio task, see MegaPatch.it
+        :param kwargs: Additional arguments applied to every patch, see MegaPatch.it
+        """
+        MegaPatch._scoped_check(scoped, kwargs.get("new_callable"))
+        mocker = MegaPatch._resolve_mocker(mocker, autostart)
+        caller_frame = sys._getframe(1)
+        context = MegaPatch.current_context()
+        arg_names: tuple[str, ...] | None = None
+
+        megapatches: list[MegaPatch] = []
+        links: list[tuple[_MegaMockMixin | None, MegaPatch]] = []
+        seen: set[int] = set()
+        for index, thing in enumerate(things):
+            if id(thing) in seen:
+                continue
+            seen.add(id(thing))
+
+            timer = PatchTimings.timer()
+            thing_kwargs = dict(kwargs)
+            thing, parent_mock, new, return_value = MegaPatch._prepare_new_value(
+                thing,
+                thing_kwargs.pop("new", None),
+                spec_set,
+                thing_kwargs.pop("behavior", None),
+                thing_kwargs.pop("new_callable", None),
+                thing_kwargs.pop("side_effect", None),
+                thing_kwargs,
+            )
+            timer.lap("autospec")
+            if (passed_in_name := getattr(thing, "__qualname__", None)) is None:
+                if arg_names is None:
+                    arg_names = argname(
+                        "*things", func=MegaPatch.many, vars_only=False
+                    )
+                passed_in_name = arg_names[index]
+            timer.lap("argname")
+
+            megapatch = MegaPatch._create(
+                thing,
+                passed_in_name,
+                caller_frame,
+                new,
+                return_value,
+                mocker,
+                thing_kwargs,
+                context=context,
+                reusable=reusable,
+                scoped=scoped,
+                timer=timer,
+            )
+            PatchTimings.add(megapatch._target, timer)
+            megapatches.append(megapatch)
+            links.append((parent_mock, megapatch))
+
+        group = MegaPatchGroup(megapatches, context=context)
+        if autostart:
+            group.start()
+
+        for parent_mock, megapatch in links:
+            MegaPatch._maybe_assign_link(
+                parent_mock, megapatch._passed_in_name, megapatch
+            )
+
+        return group
+
+    @staticmethod
+    def _resolve_mocker(
+        mocker: ModuleType | object | None, autostart: bool
+    ) -> ModuleType | object:
         if mocker is None:
             mocker = MegaPatch.default_mocker
         else:
@@ -306,19 +1196,52 @@ class MegaPatch(Generic[T, U]):
                 mocker, "patch"
             ), "mocker does not appear to be a Mocker object"
 
-        if autostart is False and not hasattr(mocker.patch, "start"):  # type: ignore
+        if autostart is False and not hasattr(
+            MegaPatch._get_patcher(mocker), "start"
+        ):
             logger.warning(
                 "Disabling autostart doesn't appear to be supported by mocker. "
                 "Falling back to built in mock"
             )
             mocker = mock
+        return mocker
+
+    @staticmethod
+    def _get_patcher(mocker: ModuleType | object) -> Any:
+        """
+        Get the function used to create patches that are started and stopped
+        separately.
+
+        pytest-mock and similar mockers start patches as they are created, so the
+        underlying mock module is used for those.
+        """
+        if hasattr(mocker, "stopall"):
+            return getattr(mocker, "mock_module", mock).patch
+        return mocker.patch  # type: ignore
 
+    @staticmethod
+    def _prepare_new_value(
+        thing: Any,
+        new: Any | None,
+        spec_set: bool,
+        behavior: MegaPatchBehavior | None,
+        new_callable: Callable | None,
+        side_effect: Any | None,
+        kwargs: dict,
+    ) -> tuple[Any, _MegaMockMixin | None, Any, Any]:
+        """
+        Determine the value to patch in and its return value. The kwargs are
+        modified in-place so that they can be passed along to the mocker.
+        """
         if isinstance(thing, _MegaMockMixin):
             parent_mock = thing.megamock.parent
             assert thing.megamock.spec is not None
             thing = thing.megamock.spec
         else:
             parent_mock = None
+        if isinstance(thing, _ScopedProxy):
+            # patching something that already has a scoped patch
+            thing = thing._original
 
         if side_effect is not None:
             kwargs["side_effect"] = side_effect  # this may get popped later
@@ -342,47 +1265,70 @@ class MegaPatch(Generic[T, U]):
 
             if (autospec := kwargs.pop("autospec", None)) in (True, False):
                 behavior.autospec = autospec
+            if (lazy := kwargs.pop("lazy", None)) in (True, False):
+                behavior.lazy = lazy
             new, return_value = MegaPatch._new_return_value(
                 thing, spec_set, new, kwargs, behavior
             )
         if isinstance(thing, cached_property):
             thing = thing.func  # type: ignore
 
-        # if object has qualified name, use that instead of passed in name
-        passed_in_name = getattr(
-            thing, "__qualname__", argname("thing", func=MegaPatch.it, vars_only=False)
-        )
+        return thing, parent_mock, new, return_value
+
+    @staticmethod
+    def _create(
+        thing: Any,
+        passed_in_name: str,
+        caller_frame: FrameType,
+        new: Any,
+        return_value: Any,
+        mocker: ModuleType | object,
+        kwargs: dict,
+        context: MegaPatchContext | None = None,
+        reusable: bool = False,
+        scoped: bool = False,
+        timer: _PhaseTimer | _NullTimer = _NULL_TIMER,
+    ) -> MegaPatch:
         corrected_passed_in_name = MegaPatch._correct_for_renamed_import(
-            passed_in_name, thing
+            passed_in_name, thing, caller_frame
         )
 
         name_to_patch, module_path = MegaPatch._determine_module_path_and_name(
-            thing, passed_in_name, corrected_passed_in_name
+            thing, passed_in_name, corrected_passed_in_name, caller_frame
         )
+        timer.lap("resolve_path")
 
         patches = MegaPatch._build_patches(
-            mocker, module_path, name_to_patch, corrected_passed_in_name, new, kwargs
+            mocker,
+            module_path,
+            name_to_patch,
+            corrected_passed_in_name,
+            new,
+            kwargs,
+            scoped=scoped,
         )
+        timer.lap("build_patches")
 
-        mega_patch = MegaPatch(
+        mega_patch: MegaPatch = MegaPatch(
             thing=thing,
             patches=patches,
             new_value=new,
             return_value=return_value,
             mocker=mocker,
+            context=context,
+            reusable=reusable,
         )
-        if autostart:
-            mega_patch.start()
-
-        MegaPatch._maybe_assign_link(parent_mock, corrected_passed_in_name, mega_patch)
-
+        mega_patch._passed_in_name = corrected_passed_in_name
+        mega_patch._target = f"{module_path}.{name_to_patch}"
         return mega_patch
 
     @staticmethod
-    def _correct_for_renamed_import(passed_in_name: str, thing: Any) -> str:
+    def _correct_for_renamed_import(
+        passed_in_name: str, thing: Any, caller_frame: FrameType
+    ) -> str:
         qualname = getattr(thing, "__qualname__", None)
         if qualname is None:
-            module_name = MegaPatch._get_module_path_for_nonclass()
+            module_name = MegaPatch._get_module_path_for_nonclass(caller_frame)
             return References.get_original_name(module_name, passed_in_name)
         return qualname
 
@@ -441,6 +1387,12 @@ class MegaPatch(Generic[T, U]):
 
         return new, return_value
 
+    @staticmethod
+    def _scoped_check(scoped: bool, new_callable: Callable | None) -> None:
+        # the new value is created when the patch starts, so it can't be scoped
+        if scoped and new_callable is not None:
+            raise ValueError("new_callable is not supported for scoped patches")
+
     @staticmethod
     def _gotcha_check(return_value: Any, behavior: MegaPatchBehavior) -> None:
         # autospec does not use the MegaMock code path when building return values
@@ -453,14 +1405,17 @@ class MegaPatch(Generic[T, U]):
 
     @staticmethod
     def _determine_module_path_and_name(
-        thing: Any, passed_in_name: str, corrected_passed_in_name: str
+        thing: Any,
+        passed_in_name: str,
+        corrected_passed_in_name: str,
+        caller_frame: FrameType,
     ) -> tuple[str, str]:
         if not (module_path := getattr(thing, "__module__", None)):
             owning_class = MegaPatch._get_owning_class(passed_in_name)
             if owning_class:
                 return corrected_passed_in_name, owning_class.__module__
         if module_path is None:
-            module_path = MegaPatch._get_module_path_for_nonclass()
+            module_path = MegaPatch._get_module_path_for_nonclass(caller_frame)
             if module_path is None:
                 raise Exception(f"Unable to determine module path for: {thing!r}")
             return passed_in_name, module_path
@@ -474,8 +1429,9 @@ class MegaPatch(Generic[T, U]):
         corrected_passed_in_name: str,
         new: Any,
         kwargs: dict,
-    ) -> list[mock._patch]:  # type: ignore  # mypy bug?
-        patches = []
+        scoped: bool = False,
+    ) -> list[_Patch]:
+        patches: list[_Patch] = []
         paths_and_names = {ModAndName(module_path, name_to_patch)}
 
         # if the passed in name is a nested name in a module, then only patch once.
@@ -485,17 +1441,21 @@ class MegaPatch(Generic[T, U]):
             paths_and_names |= References.get_references(
                 module_path, corrected_passed_in_name
             ) | References.get_reverse_references(module_path, corrected_passed_in_name)
+        patcher = MegaPatch._get_patcher(mocker)
         for path, named_as in paths_and_names:
             mock_path = f"{path}.{named_as}"
-            p = mocker.patch(mock_path, new, **kwargs)
-            patches.append(p)
+            if scoped:
+                patches.append(_ScopedPatch(mock_path, new, patcher, kwargs))
+            elif hasattr(mocker, "stopall"):
+                patches.append(_MockerPatch(mocker, mock_path, new, kwargs))
+            else:
+                patches.append(patcher(mock_path, new, **kwargs))
 
         return patches
 
     @staticmethod
-    def _get_module_path_for_nonclass() -> str:
-        stack = inspect.stack()
-        module = inspect.getmodule(stack[3][0])
+    def _get_module_path_for_nonclass(caller_frame: FrameType) -> str:
+        module = inspect.getmodule(caller_frame)
         assert module
         return module.__name__
 
@@ -506,3 +1466,9 @@ class MegaPatch(Generic[T, U]):
         owning_class_name, attr_name = name.rsplit(".", 1)
         calling_frame = sys._getframe(1)
         return calling_frame.f_locals.get(owning_class_name, None)
+
+
+# immutable so that a copy of the context in a new task can't modify the original
+_context_stack: ContextVar[tuple[MegaPatchContext, ...]] = ContextVar(
+    "megapatch_context_stack", default=(MegaPatch.root_context,)
+)
@@ -1,9 +1,73 @@
-from typing import Callable, Sequence, cast
+import asyncio
+import time
+from types import FunctionType
+from typing import Any, Callable, Sequence, cast
+from unittest import mock
+from unittest.util import safe_repr
 
-from megamock.megamocks import MegaMock, UseRealLogic
+from megamock.megamocks import (
+    CallIndex,
+    CallTimings,
+    CallWaiters,
+    MegaMock,
+    UseRealLogic,
+    _MegaMockMixin,
+    trimmed_calls,
+)
 from megamock.type_util import Call
 
 
+class MegaAssertionError(AssertionError):
+    """
+    The AssertionError stored in Mega.last_assertion_error. The message is only
+    formatted when the error is displayed, so failed checks stay cheap.
+    """
+
+    def __init__(self, format_message: Callable[[], str]) -> None:
+        super().__init__()
+        self._format_message = format_message
+        self._message: str | None = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = self._format_message()
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+
+class _CallsSnapshot:
+    """
+    The calls of a mock at some point in time. Calls are appended to the list and,
+    when recording is limited, trimmed from the front. Resetting the mock replaces
+    it, so the length and trim count are enough to snapshot it.
+    """
+
+    __slots__ = ("calls", "length", "trimmed")
+
+    def __init__(self, calls: list) -> None:
+        self.calls = calls
+        self.length = len(calls)
+        self.trimmed = trimmed_calls(calls)
+
+    def __call__(self) -> list:
+        # calls trimmed since the snapshot are gone, the rest moved to the front
+        end = max(self.length - (trimmed_calls(self.calls) - self.trimmed), 0)
+        return mock._CallList(self.calls[:end])  # type: ignore[attr-defined]
+
+    def repr(self, prefix: str = "Calls") -> str:
+        # same as NonCallableMock._calls_repr
+        if not (calls := self()):
+            return ""
+        return f"\n{prefix}: {safe_repr(calls)}."
+
+
+# how long to wait at first, to catch a call that was in progress when the waiting
+# started and isn't notified
+_IN_PROGRESS_CALL_WAIT = 0.01
+
+
 class Mega:
     """
     Wrapper class around callable MegaMock objects. This provides
@@ -30,6 +94,11 @@ class Mega:
             return False
         return True
 
+    @staticmethod
+    def _fail(format_message: Callable[[], str]) -> bool:
+        Mega.last_assertion_error = MegaAssertionError(format_message)
+        return False
+
     @property
     def _mm(self) -> MegaMock:
         """
@@ -37,20 +106,64 @@ class Mega:
         """
         return cast(MegaMock, self._func)
 
+    @property
+    def _mock(self) -> Any:
+        """
+        The mock that records the calls, or None if the checks should be left to
+        the assert methods
+        """
+        func: Any = self._func
+        if isinstance(func, _MegaMockMixin):
+            func = func._wrapped_legacy_mock
+            if func is None:
+                func = self._func
+            elif type(func) is FunctionType:
+                # autospecced functions call the mock they wrap
+                func = getattr(func, "mock", func)
+        if isinstance(func, mock.NonCallableMock):
+            return func
+        return None
+
+    @property
+    def _call_index(self) -> CallIndex | None:
+        if isinstance(self._func, _MegaMockMixin):
+            return self._func.megamock.call_index
+        return None
+
     def called_once_with(self, *args, **kwargs) -> bool:
         """
         Return true if the mock was called exactly once and with the specified
         arguments
         """
-        return self._check_mock_assertion(
-            lambda: self._mm.assert_called_once_with(*args, **kwargs)
-        )
+        if (target := self._mock) is None:
+            return self._check_mock_assertion(
+                lambda: self._mm.assert_called_once_with(*args, **kwargs)
+            )
+        if (call_count := target.call_count) != 1:
+            calls = _CallsSnapshot(target.mock_calls)
+            return self._fail(
+                lambda: (
+                    f"Expected '{target._mock_name or 'mock'}' to be called once. "
+                    f"Called {call_count} times.{calls.repr()}"
+                )
+            )
+        return self.called_with(*args, **kwargs)
 
     def called_once(self) -> bool:
         """
         Return true if the mock was called exactly once
         """
-        return self._check_mock_assertion(lambda: self._mm.assert_called_once())
+        if (target := self._mock) is None:
+            return self._check_mock_assertion(lambda: self._mm.assert_called_once())
+        if (call_count := target.call_count) != 1:
+            calls = _CallsSnapshot(target.mock_calls)
+            return self._fail(
+                lambda: (
+                    f"Expected '{target._mock_name or 'mock'}' to have been called "
+                    f"once. Called {call_count} times.{calls.repr()}"
+                )
+            )
+        return True
 
     def called(self) -> bool:
         """
@@ -62,25 +175,73 @@ class Mega:
         """
         Return true if the mock was not called
         """
-        return self._check_mock_assertion(lambda: self._mm.assert_not_called())
+        if (target := self._mock) is None:
+            return self._check_mock_assertion(lambda: self._mm.assert_not_called())
+        if (call_count := target.call_count) != 0:
+            calls = _CallsSnapshot(target.mock_calls)
+            return self._fail(
+                lambda: (
+                    f"Expected '{target._mock_name or 'mock'}' to not have been "
+                    f"called. Called {call_count} times.{calls.repr()}"
+                )
+            )
+        return True
 
     def called_with(self, *args, **kwargs) -> bool:
         """
         Return true if the last call made to the mock was with the specified
         arguments
         """
-        return self._check_mock_assertion(
-            lambda: self._mm.assert_called_with(*args, **kwargs)
-        )
+        if (target := self._mock) is None:
+            return self._check_mock_assertion(
+                lambda: self._mm.assert_called_with(*args, **kwargs)
+            )
+        if (call_args := target.call_args) is None:
+            return self._fail(
+                lambda: (
+                    "expected call not found.\n"
+                    f"Expected: {target._format_mock_call_signature(args, kwargs)}\n"
+                    "  Actual: not called."
+                )
+            )
+        expected = target._call_matcher(mock._Call((args, kwargs), two=True))
+        if target._call_matcher(call_args) != expected:
+            return self._fail(
+                lambda: (
+                    "expected call not found.\n"
+                    f"Expected: {target._format_mock_call_signature(args, kwargs)}\n"
+                    f"  Actual: {target._format_mock_call_signature(*call_args)}"
+                )
+            )
+        return True
 
     def any_call(self, *args, **kwargs) -> bool:
         """
         Return true if the mock was called with the specified arguments
         at any point in time
         """
-        return self._check_mock_assertion(
-            lambda: self._mm.assert_any_call(*args, **kwargs)
-        )
+        found: bool | None = None
+        if (index := self._call_index) is not None:
+            found = index.any_call(args, kwargs)
+        if found is None:
+            if (target := self._mock) is None:
+                return self._check_mock_assertion(
+                    lambda: self._mm.assert_any_call(*args, **kwargs)
+                )
+            expected = target._call_matcher(mock._Call((args, kwargs), two=True))
+            found = not isinstance(expected, Exception) and expected in (
+                mock._AnyComparer(  # type: ignore[attr-defined]
+                    [target._call_matcher(kall) for kall in target.call_args_list]
+                )
+            )
+        if not found:
+            return self._fail(
+                lambda: (
+                    f"{self._mm._format_mock_call_signature(args, kwargs)} "
+                    "call not found"
+                )
+            )
+        return True
 
     def has_calls(self, calls: Sequence[Call], any_order=False) -> bool:
         """
@@ -94,9 +255,182 @@ class Mega:
             iter(calls)
         except TypeError:
             raise TypeError("First argument must be an iterable of call objects")
-        return self._check_mock_assertion(
-            lambda: self._mm.assert_has_calls(calls, any_order)
-        )
+        if (target := self._mock) is None:
+            return self._check_mock_assertion(
+                lambda: self._mm.assert_has_calls(calls, any_order)
+            )
+        mock_calls = _CallsSnapshot(target.mock_calls)
+        if (
+            any_order
+            and (index := self._call_index) is not None
+            and (missing := index.missing_calls(calls)) is not None
+        ):
+            not_found = missing
+        else:
+            expected = [target._call_matcher(kall) for kall in calls]
+            all_calls = mock._CallList(  # type: ignore[attr-defined]
+                target._call_matcher(kall) for kall in target.mock_calls
+            )
+            if not any_order:
+                if expected not in all_calls:
+                    return self._fail(
+                        lambda: (
+                            "Calls not found.\n"
+                            f"Expected: {mock._CallList(calls)}"  # type: ignore
+                            f"{mock_calls.repr(prefix='  Actual').rstrip('.')}"
+                        )
+                    )
+                return True
+            remaining = list(all_calls)
+            not_found = []
+            for kall in expected:
+                try:
+                    remaining.remove(kall)
+                except ValueError:
+                    not_found.append(kall)
+        if not_found:
+            return self._fail(
+                lambda: (
+                    f"{target._mock_name or 'mock'!r} does not contain all of "
+                    f"{tuple(not_found)!r} in its call list, "
+                    f"found {[target._call_matcher(c) for c in mock_calls()]!r} "
+                    "instead"
+                )
+            )
+        return True
+
+    @property
+    def call_timings(self) -> CallTimings:
+        """
+        When each call was made, for mocks created with time_calls=True
+        """
+        if (
+            not isinstance(self._func, _MegaMockMixin)
+            or (timings := self._func.megamock.call_timings) is None
+        ):
+            raise Exception("Call timings require a MegaMock with time_calls=True")
+        return timings
+
+    def call_rate(self) -> float:
+        """
+        Calls per second, between the first and the last call
+        """
+        return self.call_timings.call_rate()
+
+    def timing_histogram(
+        self, bucket_ns: int = 1_000_000, awaits: bool = False
+    ) -> dict[int, int]:
+        """
+        How many intervals between calls fall in each bucket, keyed by the start of
+        the bucket in nanoseconds
+
+        :param bucket_ns: The size of the buckets, in nanoseconds
+        :param awaits: Use how long async calls were awaited for instead
+        """
+        return self.call_timings.histogram(bucket_ns, awaits)
+
+    def wait_until_called(
+        self, timeout: float = 5.0, count: int = 1, with_args: Call | None = None
+    ) -> bool:
+        """
+        Wait until the mock is called, for code running in other threads. Returns
+        false if it wasn't called in time.
+
+        The wait ends as soon as the call is made, rather than polling.
+
+        :param timeout: How many seconds to wait for
+        :param count: How many calls to wait for, in total
+        :param with_args: Also wait for a call with these arguments, as in any_call
+        """
+        target = self._waitable_mock()
+        satisfied = self._wait_condition(target, count, with_args)
+        waiters = CallWaiters.of(target)
+        deadline = time.monotonic() + timeout
+        # a call that was in progress when hooking into the calls doesn't notify
+        next_wait: float | None = _IN_PROGRESS_CALL_WAIT
+        with waiters.condition:
+            while not satisfied():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return self._wait_failed(target, timeout, count, with_args)
+                waiters.condition.wait(min(remaining, next_wait or remaining))
+                next_wait = None
+        return True
+
+    async def until_called(
+        self, timeout: float = 5.0, count: int = 1, with_args: Call | None = None
+    ) -> bool:
+        """
+        Same as wait_until_called, but waits without blocking the event loop.
+
+        :param timeout: How many seconds to wait for
+        :param count: How many calls to wait for, in total
+        :param with_args: Also wait for a call with these arguments, as in any_call
+        """
+        target = self._waitable_mock()
+        satisfied = self._wait_condition(target, count, with_args)
+        waiters = CallWaiters.of(target)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        waiter = (loop, asyncio.Event())
+        waiters.events.add(waiter)
+        try:
+            next_wait: float | None = _IN_PROGRESS_CALL_WAIT
+            while True:
+                # cleared before checking, so a call made in between isn't missed
+                waiter[1].clear()
+                if satisfied():
+                    return True
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return self._wait_failed(target, timeout, count, with_args)
+                try:
+                    await asyncio.wait_for(
+                        waiter[1].wait(), min(remaining, next_wait or remaining)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                next_wait = None
+        finally:
+            waiters.events.discard(waiter)
+
+    def _waitable_mock(self) -> Any:
+        if (target := self._mock) is None:
+            raise TypeError(f"Can't wait for calls to {self._func!r}, not a mock")
+        return target
+
+    def _wait_condition(
+        self, target: Any, count: int, with_args: Call | None
+    ) -> Callable[[], bool]:
+        def satisfied() -> bool:
+            if target.call_count < count:
+                return False
+            return with_args is None or self.any_call(
+                *with_args.args, **with_args.kwargs
+            )
+
+        return satisfied
+
+    def _wait_failed(
+        self, target: Any, timeout: float, count: int, with_args: Call | None
+    ) -> bool:
+        call_count = target.call_count
+        calls = _CallsSnapshot(target.mock_calls)
+
+        def format_message() -> str:
+            expected = f"at least {count} times" if count != 1 else ""
+            if with_args is not None:
+                signature = target._format_mock_call_signature(
+                    with_args.args, with_args.kwargs
+                )
+                expected = f"{expected} with {signature}".lstrip()
+            return (
+                f"Expected '{target._mock_name or 'mock'}' to be called "
+                f"{expected + ' ' if expected else ''}within {timeout} seconds. "
+                f"Called {call_count} times.{calls.repr()}"
+            )
+
+        return self._fail(format_message)
 
     @property
     def call_args(self) -> Call:
@@ -2,7 +2,39 @@ from typing import Iterable
 
 import pytest
 
-from megamock.megapatches import MegaPatch
+from megamock.megamocks import AttributeTrackingBase, Tracking
+from megamock.megapatches import MegaPatch, PatchTimings
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("megamock")
+    group.addoption(
+        "--megamock-patch-timings",
+        action="store_true",
+        default=False,
+        help="Time each phase of MegaPatch.it and MegaPatch.stop "
+        "and report the slowest patches",
+    )
+    group.addoption(
+        "--megamock-patch-timings-json",
+        default=None,
+        metavar="PATH",
+        help="Time each phase of MegaPatch.it and MegaPatch.stop "
+        "and write the timings per target to a JSON file",
+    )
+    parser.addini(
+        "megamock_tracking",
+        default=None,
+        help="How much attribute assignment and spy access history MegaMocks keep: "
+        'one of "full", "last:N", "count" or "off"',
+    )
+    parser.addini(
+        "megamock_reusable_patches",
+        type="bool",
+        default=False,
+        help="Reset reusable MegaPatches after each test and stop patches created "
+        "in module scoped fixtures at the end of the module",
+    )
 
 
 def pytest_load_initial_conftests(*args, **kwargs) -> None:
@@ -11,8 +43,48 @@ def pytest_load_initial_conftests(*args, **kwargs) -> None:
     megamock.start_import_mod()
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    if tracking := config.getini("megamock_tracking"):
+        Tracking(tracking)  # fail early when invalid
+        AttributeTrackingBase.default_tracking = tracking
+    if config.getoption("megamock_patch_timings") or config.getoption(
+        "megamock_patch_timings_json"
+    ):
+        PatchTimings.enable()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    if config.getoption("megamock_patch_timings"):
+        terminalreporter.write_sep("=", "megamock slowest patches")
+        for line in PatchTimings.report():
+            terminalreporter.write_line(line)
+    if json_path := config.getoption("megamock_patch_timings_json"):
+        PatchTimings.write_json(json_path)
+
+
+def _reusable_patches(request: pytest.FixtureRequest) -> bool:
+    return bool(request.config.getini("megamock_reusable_patches"))
+
+
 @pytest.fixture(autouse=True)
-def megapatch_contexts() -> Iterable:
+def megapatch_contexts(request: pytest.FixtureRequest) -> Iterable:
+    if not _reusable_patches(request):
+        with MegaPatch.new_context():
+            yield
+        return
+    # broader scoped fixtures are set up before this one, so reusable patches
+    # are fully configured at this point
+    MegaPatch.mark_reusable_baselines()
+    with MegaPatch.new_context():
+        yield
+    MegaPatch.reset_reusable()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def megapatch_module_contexts(request: pytest.FixtureRequest) -> Iterable:
+    if not _reusable_patches(request):
+        yield
+        return
     with MegaPatch.new_context():
         yield
 
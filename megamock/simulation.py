@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import random
+import threading
+import time
+from typing import Callable
+
+
+class Distribution:
+    """
+    Random durations, in seconds, for simulated latency. The random number generator
+    is seeded, so the same durations are drawn on each run.
+
+        Distribution.fixed(0.05)
+        Distribution.uniform(0.01, 0.1)
+        Distribution.normal(0.05, 0.01)
+        Distribution.exponential(0.05)
+    """
+
+    def __init__(
+        self, sample: Callable[[random.Random], float], seed: int | None = 0
+    ) -> None:
+        """
+        :param sample: Draws a duration using the given random number generator
+        :param seed: The seed of the random number generator, None for a random seed
+        """
+        self._sample = sample
+        self._random = random.Random(seed)
+
+    @staticmethod
+    def fixed(seconds: float) -> Distribution:
+        return Distribution(lambda _: seconds)
+
+    @staticmethod
+    def uniform(low: float, high: float, seed: int | None = 0) -> Distribution:
+        return Distribution(lambda rng: rng.uniform(low, high), seed)
+
+    @staticmethod
+    def normal(mean: float, stddev: float, seed: int | None = 0) -> Distribution:
+        return Distribution(lambda rng: rng.gauss(mean, stddev), seed)
+
+    @staticmethod
+    def exponential(mean: float, seed: int | None = 0) -> Distribution:
+        return Distribution(lambda rng: rng.expovariate(1 / mean), seed)
+
+    def sample(self) -> float:
+        # negative latency does not make sense, values are clamped to 0
+        return max(0.0, self._sample(self._random))
+
+
+class Clock:
+    """
+    The clock simulated calls wait on, which is the real, monotonic, time
+    """
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep_until(self, deadline: float) -> None:
+        if (remaining := deadline - self.now()) > 0:
+            time.sleep(remaining)
+
+    async def async_sleep_until(self, deadline: float) -> None:
+        if (remaining := deadline - self.now()) > 0:
+            await asyncio.sleep(remaining)
+
+
+class VirtualClock(Clock):
+    """
+    A clock where waiting takes no time. The time jumps ahead to when the wait
+    ends instead, so simulations are fast and deterministic.
+
+    Async waits let the other tasks that are ready run first, so calls made at
+    the same time overlap as they would with a real clock.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        with self._lock:
+            self._now += seconds
+
+    def sleep_until(self, deadline: float) -> None:
+        with self._lock:
+            self._now = max(self._now, deadline)
+
+    async def async_sleep_until(self, deadline: float) -> None:
+        await asyncio.sleep(0)
+        self.sleep_until(deadline)
+
+
+class Simulation:
+    """
+    Makes the calls of a mock behave like calls to a remote service. Each call
+    takes some time, at most max_concurrency calls are handled at once and calls
+    start at most throughput times per second. Calls beyond the limits queue up.
+
+    A simulation passed to MegaMock is shared by its attribute mocks, so the limits
+    apply to the service as a whole.
+
+        simulation = Simulation(
+            latency=Distribution.normal(0.05, 0.01),
+            max_concurrency=4,
+            clock=VirtualClock(),
+        )
+        client = MegaMock.it(HttpClient, simulation=simulation)
+    """
+
+    def __init__(
+        self,
+        latency: Distribution | float = 0.0,
+        max_concurrency: int | None = None,
+        throughput: float | None = None,
+        clock: Clock | None = None,
+    ) -> None:
+        """
+        :param latency: How long each call takes, in seconds
+        :param max_concurrency: How many calls are handled at once, no limit if None
+        :param throughput: How many calls may start per second, no limit if None
+        :param clock: The clock to wait on, the real time if None
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if throughput is not None and throughput <= 0:
+            raise ValueError("throughput must be positive")
+        if not isinstance(latency, Distribution):
+            latency = Distribution.fixed(latency)
+        self.latency = latency
+        self.max_concurrency = max_concurrency
+        self.throughput = throughput
+        self.clock = clock or Clock()
+        # when each of the concurrent slots is free again
+        self._slots: list[float] = [float("-inf")] * (max_concurrency or 0)
+        self._next_start = float("-inf")
+        self._lock = threading.Lock()
+
+    def schedule(self) -> float:
+        """
+        Reserve the next free slot for a call made now. Returns when the call ends
+        """
+        with self._lock:
+            start = self.clock.now()
+            if self._slots:
+                start = max(start, heapq.heappop(self._slots))
+            if self.throughput is not None:
+                start = max(start, self._next_start)
+                self._next_start = start + 1 / self.throughput
+            end = start + self.latency.sample()
+            if self.max_concurrency is not None:
+                heapq.heappush(self._slots, end)
+        return end
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import inspect
+import types
+import weakref
+from types import CodeType
+from typing import Any, Callable
+
+from megamock.autospec import spec_fingerprint
+
+_METHOD = "method"
+_CLASS_METHOD = "classmethod"
+_STATIC_METHOD = "staticmethod"
+
+
+# builtin method types -> the kind of method they are looked up as
+_BUILTIN_METHOD_KINDS: dict[type, str] = {
+    types.MethodDescriptorType: _METHOD,
+    types.WrapperDescriptorType: _METHOD,
+    types.ClassMethodDescriptorType: _CLASS_METHOD,
+    types.BuiltinFunctionType: _STATIC_METHOD,
+}
+
+
+def _any_arguments(*args, **kwargs) -> None:
+    """
+    Stands in for builtin methods, which mostly don't have a signature
+    """
+
+
+class _Source(str):
+    """
+    A string that is its own repr, to put names in the source of a signature
+    """
+
+    def __repr__(self) -> str:
+        return self
+
+
+class _StubTemplate:
+    """
+    The compiled functions of the stubs of a spec, along with what is needed to
+    create a stub from them
+    """
+
+    __slots__ = ("code", "defaults", "methods", "values", "return_names")
+
+    def __init__(
+        self,
+        code: CodeType,
+        defaults: dict[str, Any],
+        methods: dict[str, str],
+        values: frozenset[str],
+        return_names: dict[str, str],
+    ) -> None:
+        self.code = code
+        # source name -> default value of a parameter
+        self.defaults = defaults
+        # method name -> _METHOD, _CLASS_METHOD or _STATIC_METHOD
+        self.methods = methods
+        self.values = values
+        # method name -> name of the global it returns
+        self.return_names = return_names
+
+
+# spec -> (fingerprint, template)
+_stub_templates: weakref.WeakKeyDictionary[Any, tuple[tuple | None, _StubTemplate]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def create_stub(spec: Any, returns: dict[str, Any]) -> Any:
+    """
+    Create a stub of a class instance or of a function, see MegaMock.stub
+    """
+    template = _stub_template(spec)
+    for name in returns:
+        if name not in template.methods and name not in template.values:
+            raise AttributeError(f"{spec!r} has no attribute {name!r}")
+    namespace = dict(template.defaults)
+    namespace["__name__"] = getattr(spec, "__module__", None) or __name__
+    for name, return_name in template.return_names.items():
+        namespace[return_name] = returns.get(name)
+    exec(template.code, namespace)
+
+    if not isinstance(spec, type):
+        return namespace["_megamock_function"]
+
+    attributes: dict[str, Any] = {name: returns.get(name) for name in template.values}
+    for name, kind in template.methods.items():
+        func = namespace[f"_megamock_method_{name}"]
+        func.__qualname__ = f"{spec.__qualname__}.{name}"
+        if kind == _CLASS_METHOD:
+            func = classmethod(func)
+        elif kind == _STATIC_METHOD:
+            func = staticmethod(func)
+        attributes[name] = func
+    names = frozenset(attributes)
+    attributes["__class__"] = property(lambda _: spec)  # for isinstance
+    attributes["__setattr__"] = _stub_setattr
+    attributes["__repr__"] = lambda _: f"<Stub of {spec.__qualname__}>"
+    attributes["_stub_names"] = names
+    stub_class = type(f"{spec.__name__}Stub", (), attributes)
+    return stub_class()
+
+
+def _stub_setattr(self: Any, name: str, value: Any) -> None:
+    if name not in self._stub_names:
+        raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+    object.__setattr__(self, name, value)
+
+
+def _stub_template(spec: Any) -> _StubTemplate:
+    fingerprint = spec_fingerprint(spec)
+    try:
+        cached = _stub_templates.get(spec)
+    except TypeError:
+        cached = None  # can't be weakly referenced
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    defaults: dict[str, Any] = {}
+    return_names: dict[str, str] = {}
+    methods: dict[str, str] = {}
+    values: set[str] = set()
+    lines = []
+    if isinstance(spec, type):
+        for name in _stub_names(spec):
+            # only annotated attributes are missing until __init__ sets them
+            attr = inspect.getattr_static(spec, name, None)
+            if isinstance(attr, staticmethod):
+                kind, func = _STATIC_METHOD, attr.__func__
+            elif isinstance(attr, classmethod):
+                kind, func = _CLASS_METHOD, attr.__func__
+            elif inspect.isfunction(attr):
+                kind, func = _METHOD, attr
+            elif (builtin_kind := _BUILTIN_METHOD_KINDS.get(type(attr))) is not None:
+                # methods inherited from builtins, such as dict.get
+                kind, func = builtin_kind, _any_arguments
+            else:
+                values.add(name)
+                continue
+            methods[name] = kind
+            return_names[name] = f"_megamock_return_{len(return_names)}"
+            lines.append(
+                _function_source(
+                    func, f"_megamock_method_{name}", return_names[name], defaults
+                )
+            )
+    elif callable(spec):
+        methods["return_value"] = _STATIC_METHOD
+        return_names["return_value"] = "_megamock_return_0"
+        lines.append(
+            _function_source(spec, "_megamock_function", "_megamock_return_0", defaults)
+        )
+        lines.append(f"_megamock_function.__name__ = {spec.__name__!r}")
+        lines.append(f"_megamock_function.__qualname__ = {spec.__qualname__!r}")
+    else:
+        raise TypeError(f"Can only stub classes and functions, not {spec!r}")
+
+    code = compile("\n".join(lines), f"<stub of {spec!r}>", "exec")
+    template = _StubTemplate(code, defaults, methods, frozenset(values), return_names)
+    try:
+        _stub_templates[spec] = (fingerprint, template)
+    except TypeError:
+        pass  # can't be weakly referenced
+    return template
+
+
+def _stub_names(spec: type) -> list[str]:
+    names = [name for name in dir(spec) if not name.startswith("__")]
+    # attributes that are only annotated are set by __init__
+    for klass in reversed(spec.__mro__):
+        for name in getattr(klass, "__annotations__", {}):
+            if not name.startswith("__") and name not in names:
+                names.append(name)
+    if inspect.isfunction(inspect.getattr_static(spec, "__call__", None)):
+        names.append("__call__")
+    return names
+
+
+def _function_source(
+    func: Callable, name: str, return_name: str, defaults: dict[str, Any]
+) -> str:
+    """
+    The source of a function with the same signature as func, that returns the
+    global named return_name
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        parameters = "(*args, **kwargs)"
+    else:
+        params = []
+        for param in signature.parameters.values():
+            if param.default is not param.empty:
+                default_name = f"_megamock_default_{len(defaults)}"
+                defaults[default_name] = param.default
+                param = param.replace(default=_Source(default_name))
+            params.append(param.replace(annotation=param.empty))
+        parameters = str(
+            signature.replace(parameters=params, return_annotation=signature.empty)
+        )
+    prefix = "async def" if inspect.iscoroutinefunction(func) else "def"
+    return f"{prefix} {name}{parameters}:\n    return {return_name}\n"
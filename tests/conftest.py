@@ -0,0 +1,47 @@
+from typing import Any
+from unittest import mock
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+
+class PytestMockStyleMocker:
+    """
+    Mimics pytest-mock, where patches are started as they are created and are undone
+    one at a time with stop() or all at once with stopall(). Like pytest-mock, the
+    started patches are kept in _patches_and_mocks
+    """
+
+    mock_module = mock
+
+    def __init__(self) -> None:
+        self._patches_and_mocks: list[tuple[Any, Any]] = []
+        self.stop_calls = 0
+        self.stopall_calls = 0
+
+    def patch(self, *args, **kwargs) -> Any:
+        p = mock.patch(*args, **kwargs)
+        mocked = p.start()
+        self._patches_and_mocks.append((p, mocked))
+        return mocked
+
+    def stop(self, mocked: Any) -> None:
+        self.stop_calls += 1
+        for index, (p, started_mock) in enumerate(self._patches_and_mocks):
+            if started_mock is mocked:
+                p.stop()
+                del self._patches_and_mocks[index]
+                return
+        raise ValueError("This mock object is not registered")
+
+    def stopall(self) -> None:
+        self.stopall_calls += 1
+        for p, _ in reversed(self._patches_and_mocks):
+            p.stop()
+        self._patches_and_mocks.clear()
+
+
+@pytest.fixture
+def stopall_mocker() -> PytestMockStyleMocker:
+    return PytestMockStyleMocker()
@@ -0,0 +1,57 @@
+import time
+from typing import Optional, get_type_hints
+
+import pytest
+
+from megamock import MegaMock
+
+pytestmark = pytest.mark.perf
+
+CHECKS = 2_000
+
+
+class Base:
+    id: "int"
+    name: "Optional[str]"
+    tags: "list[str]"
+
+
+class Record(Base):
+    value: "float"
+    labels: "dict[str, str]"
+    children: "list[Record]"
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.labels = {}
+        self.children = []
+
+
+def time_checks() -> float:
+    mega_mock: MegaMock = MegaMock.this(Record, spec_set=True)
+    start_time = time.perf_counter()
+    for i in range(CHECKS):
+        mega_mock._set_attr_annotations_check("labels", {"i": str(i)})
+    return time.perf_counter() - start_time
+
+
+def time_get_type_hints() -> float:
+    # what each check used to cost
+    start_time = time.perf_counter()
+    for _ in range(CHECKS):
+        get_type_hints(Record)["labels"]
+    return time.perf_counter() - start_time
+
+
+def test_annotation_checks_do_not_resolve_type_hints() -> None:
+    checks = time_checks()
+    type_hints = time_get_type_hints()
+
+    assert (
+        checks < type_hints / 5
+    ), f"Checks took {checks:.4f}s, get_type_hints took {type_hints:.4f}s"
+
+
+if __name__ == "__main__":
+    print(f"annotation check: {time_checks() / CHECKS * 1_000_000:.2f}us")
+    print(f"get_type_hints: {time_get_type_hints() / CHECKS * 1_000_000:.2f}us")
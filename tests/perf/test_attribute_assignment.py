@@ -0,0 +1,42 @@
+import time
+import traceback
+
+import pytest
+
+from megamock import MegaMock
+
+pytestmark = pytest.mark.perf
+
+ITERATIONS = 2_000
+
+
+def time_assignments() -> float:
+    mega_mock: MegaMock = MegaMock()
+    start_time = time.perf_counter()
+    for i in range(ITERATIONS):
+        mega_mock.foo = i
+    return time.perf_counter() - start_time
+
+
+def time_extract_stack() -> float:
+    # what capturing the stack used to cost for each assignment
+    start_time = time.perf_counter()
+    for _ in range(ITERATIONS):
+        traceback.extract_stack()
+    return time.perf_counter() - start_time
+
+
+def test_assignments_do_not_extract_the_stack() -> None:
+    assignments = time_assignments()
+    extract_stack = time_extract_stack()
+
+    assert (
+        assignments < extract_stack / 2
+    ), f"Assignments took {assignments:.4f}s, extract_stack took {extract_stack:.4f}s"
+
+
+if __name__ == "__main__":
+    elapsed = time_assignments()
+    print(f"assignment: {elapsed / ITERATIONS * 1_000_000:.2f}us")
+    elapsed = time_extract_stack()
+    print(f"extract_stack: {elapsed / ITERATIONS * 1_000_000:.2f}us")
@@ -0,0 +1,49 @@
+import time
+
+import pytest
+
+from megamock.autospec import AutospecCache, SpecIndex
+
+pytestmark = pytest.mark.perf
+
+NUM_METHODS = 200
+REPEATS = 1_000
+
+
+def make_large_class() -> type:
+    namespace: dict = {}
+    methods = "".join(
+        f"    def method_{i}(self, a: int, b: str = 'b') -> int:\n        return a\n"
+        for i in range(NUM_METHODS)
+    )
+    exec(f"class LargeClass:\n{methods}", namespace)
+    return namespace["LargeClass"]
+
+
+def time_spec_index(large_class: type, cached: bool) -> float:
+    start_time = time.perf_counter()
+    for _ in range(REPEATS):
+        if cached:
+            AutospecCache.spec_index(large_class)
+        else:
+            SpecIndex(large_class)
+    return time.perf_counter() - start_time
+
+
+def test_repeat_spec_index_is_faster() -> None:
+    large_class = make_large_class()
+    AutospecCache.spec_index(large_class)  # warm up the cache
+
+    uncached = min(time_spec_index(large_class, cached=False) for _ in range(3))
+    cached = min(time_spec_index(large_class, cached=True) for _ in range(3))
+
+    assert cached < uncached / 5, (
+        f"Cached index took {cached:.4f}s, uncached took {uncached:.4f}s"
+    )
+
+
+if __name__ == "__main__":
+    large_class = make_large_class()
+    for cached in (True, False):
+        elapsed = time_spec_index(large_class, cached=cached) / REPEATS
+        print(f"cached={cached}: {elapsed * 1_000_000:.2f}us per spec index")
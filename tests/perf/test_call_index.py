@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from megamock import Mega, MegaMock
+from megamock.type_util import call
+
+pytestmark = pytest.mark.perf
+
+CALLS = 5_000
+ASSERTIONS = 100
+
+
+def make_called_mock(index_calls: bool) -> MegaMock:
+    mega_mock: MegaMock = MegaMock(index_calls=index_calls)
+    for i in range(CALLS):
+        mega_mock(i, name=str(i))
+    return mega_mock
+
+
+def time_assertions(mega_mock: MegaMock) -> float:
+    start_time = time.perf_counter()
+    for i in range(ASSERTIONS):
+        Mega(mega_mock).any_call(i, name=str(i))
+        Mega(mega_mock).any_call(-1, name="missing")
+    Mega(mega_mock).has_calls([call(i, name=str(i)) for i in range(100)], any_order=True)
+    return time.perf_counter() - start_time
+
+
+def test_indexed_assertions_are_faster() -> None:
+    scanned = time_assertions(make_called_mock(index_calls=False))
+    indexed = time_assertions(make_called_mock(index_calls=True))
+
+    assert indexed < scanned / 20, f"Indexed took {indexed:.4f}s, scan {scanned:.4f}s"
+
+
+if __name__ == "__main__":
+    for index_calls in (False, True):
+        mega_mock = make_called_mock(index_calls)
+        elapsed = time_assertions(mega_mock)
+        print(f"index_calls={index_calls}: {elapsed * 1000:.2f}ms")
@@ -0,0 +1,36 @@
+import gc
+import tracemalloc
+
+import pytest
+
+from megamock import MegaMock
+from tests.unit.simple_app.foo import Foo
+
+pytestmark = pytest.mark.perf
+
+CALLS = 10_000
+
+
+def measure_memory(record: str) -> int:
+    mega_mock = MegaMock.it(Foo, record=record)
+    mega_mock.takes_args.return_value = None
+    tracemalloc.start()
+    try:
+        for i in range(CALLS):
+            mega_mock.takes_args(i, i)
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_bounded_recording_keeps_memory_bounded() -> None:
+    everything = measure_memory("all")
+    last = measure_memory("last:10")
+
+    assert last < everything / 20, f"last:10 used {last} bytes, all used {everything}"
+
+
+if __name__ == "__main__":
+    for record in ("all", "last:10", "count", "none"):
+        print(f"{record}: {measure_memory(record) / 1024:.1f}KiB")
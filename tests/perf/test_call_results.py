@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from megamock import MegaMock
+from tests.unit.simple_app.foo import Foo
+
+pytestmark = pytest.mark.perf
+
+CALLS = 200
+
+
+def time_calls(clear_cache: bool) -> float:
+    mega_mock = MegaMock.it(Foo)
+    method = mega_mock.get_a_manager
+    start_time = time.perf_counter()
+    for _ in range(CALLS):
+        if clear_cache:
+            # what each call used to do
+            method.__dict__.pop("_call_spec_cache", None)
+        method()
+    return time.perf_counter() - start_time
+
+
+def test_call_spec_is_reused() -> None:
+    cached = time_calls(clear_cache=False)
+    uncached = time_calls(clear_cache=True)
+
+    assert (
+        cached < uncached / 2
+    ), f"Calls took {cached:.4f}s, without the cache {uncached:.4f}s"
+
+
+if __name__ == "__main__":
+    print(f"cached: {time_calls(clear_cache=False) / CALLS * 1_000_000:.2f}us")
+    print(f"uncached: {time_calls(clear_cache=True) / CALLS * 1_000_000:.2f}us")
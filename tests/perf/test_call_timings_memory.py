@@ -0,0 +1,47 @@
+import gc
+import time
+import tracemalloc
+
+import pytest
+
+from megamock import MegaMock
+from tests.unit.simple_app.foo import Foo
+
+pytestmark = pytest.mark.perf
+
+CALLS = 5_000
+
+
+def measure_memory(time_calls: bool) -> int:
+    mega_mock = MegaMock.it(Foo, record="count", time_calls=time_calls)
+    mega_mock.takes_args.return_value = None
+    tracemalloc.start()
+    try:
+        for i in range(CALLS):
+            mega_mock.takes_args(i, i)
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_float_list_memory() -> int:
+    # timestamps kept as a list of floats
+    tracemalloc.start()
+    try:
+        timestamps = [time.perf_counter() for _ in range(CALLS)]
+        return tracemalloc.get_traced_memory()[0] if timestamps else 0
+    finally:
+        tracemalloc.stop()
+
+
+def test_call_timings_are_compact() -> None:
+    timed = measure_memory(time_calls=True) - measure_memory(time_calls=False)
+
+    assert timed < CALLS * 12, f"Timing {CALLS} calls used {timed} bytes"
+
+
+if __name__ == "__main__":
+    timed = measure_memory(time_calls=True) - measure_memory(time_calls=False)
+    print(f"time_calls: {timed / CALLS:.1f} bytes per call")
+    print(f"list of floats: {measure_float_list_memory() / CALLS:.1f} bytes per call")
@@ -0,0 +1,43 @@
+import time
+
+import pytest
+
+from megamock import MegaMock
+from megamock.cassettes import Cassette
+
+pytestmark = pytest.mark.perf
+
+CALLS = 200
+SLOW_CALL = 0.001
+
+
+class SlowModel:
+    def predict(self, value: int) -> int:
+        time.sleep(SLOW_CALL)
+        return value * 2
+
+
+def time_calls(model: SlowModel) -> float:
+    start_time = time.perf_counter()
+    for i in range(CALLS):
+        model.predict(i)
+    return time.perf_counter() - start_time
+
+
+def record_and_replay() -> tuple[float, float]:
+    cassette = Cassette()
+    recorded = time_calls(MegaMock.this(spy=SlowModel(), cassette=cassette))
+    replayed = time_calls(MegaMock.replay(SlowModel, cassette))
+    return recorded, replayed
+
+
+def test_replay_does_not_call_the_real_object() -> None:
+    recorded, replayed = record_and_replay()
+
+    assert replayed < CALLS * SLOW_CALL / 2, f"Replaying took {replayed:.4f}s"
+
+
+if __name__ == "__main__":
+    recorded, replayed = record_and_replay()
+    print(f"record: {recorded / CALLS * 1_000_000:.2f}us per call")
+    print(f"replay: {replayed / CALLS * 1_000_000:.2f}us per call")
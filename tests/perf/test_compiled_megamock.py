@@ -0,0 +1,36 @@
+import time
+from typing import Any
+
+import pytest
+
+from megamock import MegaMock
+from tests.unit.simple_app.foo import Foo
+
+pytestmark = pytest.mark.perf
+
+ITERATIONS = 2_000
+
+
+def time_hot_loop(mock_instance: Any) -> float:
+    start_time = time.perf_counter()
+    for _ in range(ITERATIONS):
+        mock_instance.some_method()
+    return time.perf_counter() - start_time
+
+
+def test_compiled_mock_is_faster_in_hot_loops() -> None:
+    regular = time_hot_loop(MegaMock.it(Foo))
+    compiled = time_hot_loop(MegaMock.compiled(Foo))
+
+    assert (
+        compiled < regular / 3
+    ), f"Compiled mock took {compiled:.4f}s, regular took {regular:.4f}s"
+
+
+if __name__ == "__main__":
+    for name, mock_instance in (
+        ("it", MegaMock.it(Foo)),
+        ("compiled", MegaMock.compiled(Foo)),
+    ):
+        elapsed = time_hot_loop(mock_instance)
+        print(f"{name}: {elapsed / ITERATIONS * 1_000_000:.2f}us per call")
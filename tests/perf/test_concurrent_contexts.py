@@ -0,0 +1,43 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from megamock import MegaPatch
+from tests.unit.simple_app.bar import Bar, some_func
+from tests.unit.simple_app.foo import Foo
+
+pytestmark = pytest.mark.perf
+
+IO_TIME = 0.1
+TARGETS = [Foo.some_method, Foo.takes_args, Bar, some_func]
+
+
+async def scenario(thing: Any) -> None:
+    with MegaPatch.new_context() as context:
+        MegaPatch.it(thing)
+        await asyncio.sleep(IO_TIME)  # stands in for I/O bound test code
+        assert len(context.active_patches()) == 1
+
+
+async def run_scenarios(num_scenarios: int) -> float:
+    start_time = time.perf_counter()
+    await asyncio.gather(*(scenario(thing) for thing in TARGETS[:num_scenarios]))
+    return time.perf_counter() - start_time
+
+
+def test_concurrent_scenarios_take_about_as_long_as_one() -> None:
+    single = asyncio.run(run_scenarios(1))
+    concurrent = asyncio.run(run_scenarios(len(TARGETS)))
+
+    assert concurrent < single * 1.5, (
+        f"{len(TARGETS)} concurrent scenarios took {concurrent:.4f}s, "
+        f"one scenario took {single:.4f}s"
+    )
+
+
+if __name__ == "__main__":
+    for num_scenarios in range(1, len(TARGETS) + 1):
+        elapsed = asyncio.run(run_scenarios(num_scenarios))
+        print(f"{num_scenarios} scenarios: {elapsed * 1000:.2f}ms")
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from megamock import Mega, MegaMock
+
+pytestmark = pytest.mark.perf
+
+CALLS = 2_000
+CHECKS = 100
+
+
+def make_called_mock() -> MegaMock:
+    mega_mock: MegaMock = MegaMock()
+    for i in range(CALLS):
+        mega_mock(i)
+    return mega_mock
+
+
+def time_failed_checks() -> float:
+    mega_mock = make_called_mock()
+    start_time = time.perf_counter()
+    for _ in range(CHECKS):
+        Mega(mega_mock).not_called()
+    return time.perf_counter() - start_time
+
+
+def time_failed_assertions() -> float:
+    # what Mega used to do
+    mega_mock = make_called_mock()
+    start_time = time.perf_counter()
+    for _ in range(CHECKS):
+        try:
+            mega_mock.assert_not_called()
+        except AssertionError:
+            pass
+    return time.perf_counter() - start_time
+
+
+def test_failed_checks_do_not_format_messages() -> None:
+    checks = time_failed_checks()
+    assertions = time_failed_assertions()
+
+    assert (
+        checks < assertions / 10
+    ), f"Failed checks took {checks:.4f}s, assertions took {assertions:.4f}s"
+
+
+if __name__ == "__main__":
+    print(f"Mega.not_called: {time_failed_checks() / CHECKS * 1_000_000:.2f}us")
+    print(f"assert_not_called: {time_failed_assertions() / CHECKS * 1_000_000:.2f}us")
@@ -0,0 +1,79 @@
+import gc
+import time
+
+import pytest
+
+from megamock import MegaMock
+
+pytestmark = pytest.mark.perf
+
+MOCKS = 2_000
+TREES = 100_000
+
+
+def make_tree() -> MegaMock:
+    mega_mock = MegaMock()
+    mega_mock.client.get.return_value = "value"
+    mega_mock.client.get("key")
+    return mega_mock
+
+
+def gc_pauses(trees: int) -> dict[int, list[float]]:
+    """
+    How long each garbage collection took while creating and discarding mock trees,
+    by generation
+    """
+    pauses: dict[int, list[float]] = {0: [], 1: [], 2: []}
+    start_time = 0.0
+
+    def callback(phase: str, info: dict) -> None:
+        nonlocal start_time
+        if phase == "start":
+            start_time = time.perf_counter()
+        else:
+            pauses[info["generation"]].append(time.perf_counter() - start_time)
+
+    gc.collect()
+    gc.callbacks.append(callback)
+    try:
+        for _ in range(trees):
+            make_tree()
+    finally:
+        gc.callbacks.remove(callback)
+    return pauses
+
+
+def tracked_objects(touch_records: bool) -> int:
+    """
+    The number of objects the garbage collector tracks for each MegaMock
+    """
+    gc.collect()
+    before = len(gc.get_objects())
+    mega_mocks = [MegaMock() for _ in range(MOCKS)]
+    if touch_records:
+        # created up front, like they used to be
+        for mega_mock in mega_mocks:
+            mega_mock.megamock.attr_assignments
+            mega_mock.megamock.spied_access
+    return (len(gc.get_objects()) - before) // MOCKS
+
+
+def test_tracking_records_are_created_when_used() -> None:
+    lazy = tracked_objects(touch_records=False)
+    eager = tracked_objects(touch_records=True)
+
+    assert lazy < eager, f"{lazy} tracked objects per mock, {eager} when eager"
+
+
+if __name__ == "__main__":
+    print(f"tracked objects per MegaMock: {tracked_objects(touch_records=False)}")
+    print(f"  with tracking records: {tracked_objects(touch_records=True)}")
+    start = time.perf_counter()
+    pauses = gc_pauses(TREES)
+    print(f"{TREES} mock trees in {time.perf_counter() - start:.1f}s")
+    for generation, times in pauses.items():
+        if times:
+            print(
+                f"gen {generation}: {len(times)} collections, "
+                f"{sum(times):.3f}s total, {max(times) * 1000:.2f}ms longest"
+            )
@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from megamock import MegaMock
+from tests.perf.test_autospec_cache import make_large_class
+
+pytestmark = pytest.mark.perf
+
+
+def time_construction(large_class: type, lazy: bool) -> float:
+    start_time = time.perf_counter()
+    mock_instance = MegaMock.it(large_class, lazy=lazy)
+    # a typical test only uses a few methods
+    mock_instance.method_0(1)
+    mock_instance.method_1(1)
+    return time.perf_counter() - start_time
+
+
+def test_lazy_construction_scales_with_usage() -> None:
+    large_class = make_large_class()
+    time_construction(large_class, lazy=True)  # warm up
+
+    eager = min(time_construction(large_class, lazy=False) for _ in range(3))
+    lazy = min(time_construction(large_class, lazy=True) for _ in range(3))
+
+    assert lazy < eager / 5, f"Lazy mock took {lazy:.4f}s, eager took {eager:.4f}s"
+
+
+if __name__ == "__main__":
+    large_class = make_large_class()
+    for lazy in (False, True):
+        elapsed = time_construction(large_class, lazy=lazy)
+        print(f"lazy={lazy}: {elapsed * 1000:.2f}ms")
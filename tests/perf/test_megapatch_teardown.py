@@ -0,0 +1,47 @@
+import time
+from types import ModuleType
+from typing import Any, Callable
+from unittest import mock
+
+import pytest
+
+from megamock import MegaPatch
+from tests.conftest import PytestMockStyleMocker
+from tests.unit.simple_app.bar import some_func
+
+pytestmark = pytest.mark.perf
+
+
+def time_teardown(num_patches: int, mocker: ModuleType | object = mock) -> float:
+    context = MegaPatch.new_context()
+    with context:
+        for i in range(num_patches):
+            MegaPatch.it(some_func, new=f"func {i}", mocker=mocker)
+        start_time = time.perf_counter()
+    return time.perf_counter() - start_time
+
+
+@pytest.mark.parametrize(
+    "make_mocker", [lambda: mock, PytestMockStyleMocker], ids=["mock", "mocker"]
+)
+def test_teardown_scales_linearly(make_mocker: Callable[[], Any]) -> None:
+    time_teardown(100, make_mocker())  # warm up
+
+    small = min(time_teardown(100, make_mocker()) for _ in range(3))
+    large = min(time_teardown(400, make_mocker()) for _ in range(3))
+
+    # 4x the patches should be roughly 4x the time, quadratic would be 16x
+    assert large < small * 8, (
+        f"Teardown of 400 patches took {large:.4f}s, "
+        f"100 patches took {small:.4f}s"
+    )
+
+
+if __name__ == "__main__":
+    for num_patches in (100, 200, 400, 800):
+        builtin = time_teardown(num_patches)
+        pytest_mock = time_teardown(num_patches, PytestMockStyleMocker())
+        print(
+            f"{num_patches} patches: {builtin * 1000:.2f}ms, "
+            f"pytest-mock style: {pytest_mock * 1000:.2f}ms"
+        )
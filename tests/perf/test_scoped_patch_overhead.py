@@ -0,0 +1,49 @@
+import time
+from typing import Any
+
+import pytest
+
+from megamock import MegaPatch
+from tests.unit.simple_app import bar
+
+pytestmark = pytest.mark.perf
+
+NUM_CALLS = 20_000
+
+
+def replacement(val: str) -> str:
+    return val
+
+
+def time_calls(**patch_kwargs: Any) -> float:
+    """
+    Nanoseconds per call to a patched function
+    """
+    with MegaPatch.new_context():
+        MegaPatch.it(bar.some_func, **patch_kwargs)
+        start_time = time.perf_counter_ns()
+        for _ in range(NUM_CALLS):
+            bar.some_func("s")
+        return (time.perf_counter_ns() - start_time) / NUM_CALLS
+
+
+def test_scoped_patch_call_overhead() -> None:
+    time_calls(new=replacement, scoped=True)  # warm up
+
+    direct = min(time_calls(new=replacement) for _ in range(3))
+    scoped = min(time_calls(new=replacement, scoped=True) for _ in range(3))
+    mocked = min(time_calls() for _ in range(3))
+
+    # dispatching should be cheap compared to calling the mock itself
+    assert scoped - direct < mocked / 4, (
+        f"Scoped patch call took {scoped:.0f}ns, direct patch call took "
+        f"{direct:.0f}ns, calling a mock took {mocked:.0f}ns"
+    )
+
+
+if __name__ == "__main__":
+    direct = time_calls(new=replacement)
+    scoped = time_calls(new=replacement, scoped=True)
+    print(f"direct: {direct:.0f}ns per call")
+    print(f"scoped: {scoped:.0f}ns per call ({scoped - direct:.0f}ns overhead)")
+    print(f"calling a mock: {time_calls():.0f}ns per call")
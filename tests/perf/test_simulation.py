@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from megamock import MegaMock
+from megamock.simulation import Simulation, VirtualClock
+from tests.unit.simple_app.async_portion import SomeClassWithAsyncMethods
+
+pytestmark = pytest.mark.perf
+
+CALLS = 1_000
+LATENCY = 0.1
+MAX_CONCURRENCY = 10
+
+
+async def simulate() -> tuple[float, float]:
+    clock = VirtualClock()
+    mega_mock = MegaMock.it(
+        SomeClassWithAsyncMethods,
+        simulation=Simulation(
+            latency=LATENCY, max_concurrency=MAX_CONCURRENCY, clock=clock
+        ),
+    )
+    start_time = time.perf_counter()
+    await asyncio.gather(*(mega_mock.some_method(str(i)) for i in range(CALLS)))
+    return clock.now(), time.perf_counter() - start_time
+
+
+async def test_virtual_clock_simulates_without_waiting() -> None:
+    simulated, elapsed = await simulate()
+
+    assert round(simulated, 6) == CALLS / MAX_CONCURRENCY * LATENCY
+    assert elapsed < simulated / 10, f"Simulating {simulated}s took {elapsed:.4f}s"
+
+
+if __name__ == "__main__":
+    simulated, elapsed = asyncio.run(simulate())
+    print(f"simulated {simulated:.1f}s of calls in {elapsed:.4f}s")
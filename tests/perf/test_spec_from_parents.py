@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from megamock import MegaMock
+from tests.unit.simple_app.nested_classes import NestedParent
+
+pytestmark = pytest.mark.perf
+
+CALLS = 20_000
+
+
+def time_resolving(clear_cache: bool) -> float:
+    mega_mock = MegaMock.it(NestedParent)
+    instance = mega_mock.NestedChild.AnotherNestedChild()
+    chain = [instance.z, instance, mega_mock.NestedChild.AnotherNestedChild]
+    start_time = time.perf_counter()
+    for _ in range(CALLS):
+        if clear_cache:
+            # what each real logic call used to do
+            for child in chain:
+                child.megamock.__dict__.pop("_spec_from_parents", None)
+        chain[0]._get_spec_from_parents()
+    return time.perf_counter() - start_time
+
+
+def test_spec_resolved_once() -> None:
+    cached = time_resolving(clear_cache=False)
+    uncached = time_resolving(clear_cache=True)
+
+    assert (
+        cached < uncached / 2
+    ), f"Resolving took {cached:.4f}s, without the cache {uncached:.4f}s"
+
+
+if __name__ == "__main__":
+    print(f"cached: {time_resolving(clear_cache=False) / CALLS * 1_000_000:.3f}us")
+    print(f"uncached: {time_resolving(clear_cache=True) / CALLS * 1_000_000:.3f}us")
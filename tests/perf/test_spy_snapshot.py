@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from megamock import MegaMock
+
+pytestmark = pytest.mark.perf
+
+ITERATIONS = 200
+
+
+class HasLargeContainer:
+    def __init__(self) -> None:
+        self.data = {i: str(i) for i in range(100_000)}
+
+
+def time_spied_reads(spy_snapshot: str) -> float:
+    mega_mock = MegaMock.this(spy=HasLargeContainer(), spy_snapshot=spy_snapshot)
+    start_time = time.perf_counter()
+    for _ in range(ITERATIONS):
+        mega_mock.data
+    return time.perf_counter() - start_time
+
+
+def test_no_copy_is_faster_for_large_containers() -> None:
+    shallow = time_spied_reads("shallow")
+    no_copy = time_spied_reads("none")
+
+    assert no_copy < shallow / 10, f"none took {no_copy:.4f}s, shallow {shallow:.4f}s"
+
+
+if __name__ == "__main__":
+    for spy_snapshot in ("none", "shallow"):
+        elapsed = time_spied_reads(spy_snapshot)
+        print(f"{spy_snapshot}: {elapsed / ITERATIONS * 1_000_000:.2f}us per read")
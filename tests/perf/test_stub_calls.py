@@ -0,0 +1,42 @@
+import sys
+import time
+
+import pytest
+
+from megamock import MegaMock
+from tests.unit.simple_app.foo import Foo
+
+pytestmark = pytest.mark.perf
+
+CALLS = 20_000
+
+
+def time_calls(foo: Foo, calls: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        foo.takes_args("a", "b")
+    return time.perf_counter() - start_time
+
+
+def time_stub(calls: int = CALLS) -> float:
+    return time_calls(MegaMock.stub(Foo, takes_args=("a", "b")), calls)
+
+
+def time_megamock(calls: int = CALLS) -> float:
+    mega_mock = MegaMock.it(Foo)
+    mega_mock.takes_args.return_value = ("a", "b")
+    return time_calls(mega_mock, calls)
+
+
+def test_stub_calls_are_faster() -> None:
+    stub = time_stub()
+    mega_mock = time_megamock()
+
+    assert stub < mega_mock / 20, f"Stub took {stub:.4f}s, MegaMock {mega_mock:.4f}s"
+
+
+if __name__ == "__main__":
+    # python -m tests.perf.test_stub_calls [calls]
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"MegaMock.stub: {time_stub(calls):.3f}s for {calls} calls")
+    print(f"MegaMock.it: {time_megamock(calls):.3f}s for {calls} calls")
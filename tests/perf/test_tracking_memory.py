@@ -0,0 +1,32 @@
+import tracemalloc
+
+import pytest
+
+from megamock import MegaMock
+
+pytestmark = pytest.mark.perf
+
+ITERATIONS = 5_000
+
+
+def measure_memory(tracking: str) -> int:
+    mega_mock: MegaMock = MegaMock(tracking=tracking)
+    tracemalloc.start()
+    try:
+        for i in range(ITERATIONS):
+            mega_mock.foo = i
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_bounded_tracking_keeps_memory_bounded() -> None:
+    full = measure_memory("full")
+    last = measure_memory("last:10")
+
+    assert last < full / 20, f"last:10 used {last} bytes, full used {full} bytes"
+
+
+if __name__ == "__main__":
+    for tracking in ("full", "last:10", "count", "off"):
+        print(f"{tracking}: {measure_memory(tracking) / 1024:.1f}KiB")
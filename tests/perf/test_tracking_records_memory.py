@@ -0,0 +1,37 @@
+import tracemalloc
+from typing import Callable
+
+import pytest
+
+from megamock import MegaMock
+
+pytestmark = pytest.mark.perf
+
+RECORDS = 5_000
+STACK_DEPTH = 30
+
+
+def at_depth(depth: int, func: Callable[[], float]) -> float:
+    return at_depth(depth - 1, func) if depth else func()
+
+
+def bytes_per_record() -> float:
+    mega_mock: MegaMock = MegaMock()
+    tracemalloc.start()
+    try:
+        for i in range(RECORDS):
+            mega_mock.foo = i
+        return tracemalloc.get_traced_memory()[0] / RECORDS
+    finally:
+        tracemalloc.stop()
+
+
+def test_records_are_compact() -> None:
+    # a record with its own list of frames and a __dict__ was over 2KB at this depth
+    size = at_depth(STACK_DEPTH, bytes_per_record)
+
+    assert size < 400, f"Each record took {size:.0f} bytes"
+
+
+if __name__ == "__main__":
+    print(f"{at_depth(STACK_DEPTH, bytes_per_record):.0f} bytes per record")
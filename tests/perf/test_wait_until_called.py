@@ -0,0 +1,55 @@
+import threading
+import time
+from typing import Callable
+
+import pytest
+
+from megamock import Mega, MegaMock
+
+pytestmark = pytest.mark.perf
+
+WAITS = 20
+POLL_INTERVAL = 0.01
+
+
+def call_after(mega_mock: MegaMock, event: threading.Event) -> None:
+    event.wait()
+    mega_mock()
+
+
+def time_wake_ups(wait: Callable[[MegaMock], None]) -> float:
+    total = 0.0
+    for _ in range(WAITS):
+        mega_mock: MegaMock = MegaMock()
+        start_call = threading.Event()
+        thread = threading.Thread(target=call_after, args=(mega_mock, start_call))
+        thread.start()
+        Mega(mega_mock).wait_until_called(timeout=0)  # hook into the calls
+        start_call.set()
+        start_time = time.perf_counter()
+        wait(mega_mock)
+        total += time.perf_counter() - start_time
+        thread.join()
+    return total
+
+
+def wait_until_called(mega_mock: MegaMock) -> None:
+    assert Mega(mega_mock).wait_until_called(timeout=5)
+
+
+def poll(mega_mock: MegaMock) -> None:
+    # what tests used to do
+    while not Mega(mega_mock).called():
+        time.sleep(POLL_INTERVAL)
+
+
+def test_wait_until_called_wakes_up_before_polling() -> None:
+    waiting = time_wake_ups(wait_until_called)
+    polling = time_wake_ups(poll)
+
+    assert waiting < polling / 2, f"Waiting took {waiting:.4f}s, polling {polling:.4f}s"
+
+
+if __name__ == "__main__":
+    print(f"wait_until_called: {time_wake_ups(wait_until_called) / WAITS * 1000:.3f}ms")
+    print(f"polling: {time_wake_ups(poll) / WAITS * 1000:.3f}ms")
@@ -3,6 +3,7 @@ import pytest
 from megamock.megapatches import MegaPatch
 from tests.unit.simple_app.for_autouse_1 import modified_function
 from tests.unit.simple_app.for_autouse_2 import session_modified_function
+from tests.unit.simple_app.for_reusable import reused_function
 
 
 class SomeClass:
@@ -25,3 +26,10 @@ def some_autouse_fixture() -> None:
 @pytest.fixture(autouse=True, scope="session")
 def some_session_autouse_fixture() -> None:
     MegaPatch.it(session_modified_function, return_value="session_modified")
+
+
+@pytest.fixture(scope="session")
+def reusable_session_patch() -> MegaPatch:
+    patch = MegaPatch.it(reused_function, reusable=True)
+    patch.mock.return_value = "baseline"
+    return patch
@@ -0,0 +1,2 @@
+def reused_function() -> str:
+    return "original"
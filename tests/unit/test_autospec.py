@@ -0,0 +1,205 @@
+import inspect
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+from megamock.autospec import AutospecCache, create_autospec
+from tests.unit.simple_app.async_portion import SomeClassWithAsyncMethods
+from tests.unit.simple_app.foo import Foo
+
+
+class WithDecoratedMethods:
+    @staticmethod
+    def static(arg: str) -> str:
+        return arg
+
+    @classmethod
+    def klass(cls, arg: str) -> str:
+        return arg
+
+
+class ModifiedLater:
+    def method(self, arg: str) -> str:
+        return arg
+
+
+def modified_function(arg: str) -> str:
+    return arg
+
+
+@pytest.fixture
+def signature_spy() -> Iterator[mock.MagicMock]:
+    with mock.patch.object(inspect, "signature", wraps=inspect.signature) as spy:
+        yield spy
+
+
+class TestCreateAutospec:
+    def test_enforces_signatures(self) -> None:
+        autospecced = create_autospec(Foo)
+
+        instance = autospecced("s")
+        instance.takes_args("a", "b")
+        with pytest.raises(TypeError):
+            instance.takes_args("a")
+
+    def test_async_methods(self) -> None:
+        autospecced = create_autospec(SomeClassWithAsyncMethods, instance=True)
+
+        assert isinstance(autospecced.some_method, mock.AsyncMock)
+
+    def test_spec_set(self) -> None:
+        autospecced = create_autospec(Foo, spec_set=True)
+
+        with pytest.raises(AttributeError):
+            autospecced.not_an_attribute = 1
+
+    def test_mock_module_not_modified(self) -> None:
+        mock_globals = dict(vars(mock))
+        seen_while_autospeccing = []
+
+        def signature(*args, **kwargs) -> inspect.Signature:
+            seen_while_autospeccing.append(dict(vars(mock)))
+            return original_signature(*args, **kwargs)
+
+        original_signature = inspect.signature
+        with mock.patch.object(inspect, "signature", signature):
+            create_autospec(Foo)
+            create_autospec(Foo, lazy=True)("s").some_method()
+
+        assert seen_while_autospeccing
+        assert all(seen == mock_globals for seen in seen_while_autospeccing)
+
+
+class TestSpecIndex:
+    def test_cached(self) -> None:
+        assert AutospecCache.spec_index(Foo) is AutospecCache.spec_index(Foo)
+
+    def test_names(self) -> None:
+        index = AutospecCache.spec_index(Foo)
+
+        assert "some_method" in index.names
+        assert "__init__" not in index.names
+
+    def test_method_replaced_in_place(self) -> None:
+        assert "method" in AutospecCache.spec_index(ModifiedLater).methods
+
+        original = vars(ModifiedLater)["method"]
+        ModifiedLater.method = staticmethod(original)  # type: ignore
+        try:
+            assert "method" not in AutospecCache.spec_index(ModifiedLater).methods
+        finally:
+            ModifiedLater.method = original  # type: ignore
+
+    def test_disabled(self) -> None:
+        AutospecCache.enabled = False
+        try:
+            assert AutospecCache.spec_index(Foo) is not AutospecCache.spec_index(Foo)
+        finally:
+            AutospecCache.enabled = True
+
+
+class TestLazyAutospec:
+    def test_children_created_on_access(self) -> None:
+        autospecced = create_autospec(Foo, instance=True, lazy=True)
+        assert "some_method" not in autospecced._mock_children
+
+        autospecced.some_method()
+
+        assert "some_method" in autospecced._mock_children
+
+    def test_names_checked_against_spec(self) -> None:
+        autospecced = create_autospec(Foo, instance=True, spec_set=True, lazy=True)
+
+        assert "takes_args" in dir(autospecced)
+        with pytest.raises(AttributeError):
+            autospecced.does_not_exist
+
+    def test_class_return_value_is_lazy(self) -> None:
+        autospecced = create_autospec(Foo, lazy=True)
+
+        instance = autospecced("s")
+
+        assert instance._mock_children == {}
+        with pytest.raises(TypeError):
+            instance.takes_args("a")
+
+    def test_static_and_class_methods(self) -> None:
+        autospecced = create_autospec(WithDecoratedMethods, instance=True, lazy=True)
+
+        autospecced.static("a")
+        autospecced.klass("a")
+        with pytest.raises(TypeError):
+            autospecced.static()
+        with pytest.raises(TypeError):
+            autospecced.klass("a", "b")
+
+    def test_async_methods(self) -> None:
+        autospecced = create_autospec(
+            SomeClassWithAsyncMethods, instance=True, lazy=True
+        )
+
+        assert isinstance(autospecced.some_method, mock.AsyncMock)
+
+    def test_calls_recorded_on_parent(self) -> None:
+        autospecced = create_autospec(Foo, instance=True, lazy=True)
+
+        autospecced.takes_args("a", "b")
+
+        assert autospecced.method_calls == [mock.call.takes_args("a", "b")]
+
+    def test_assigned_attribute_kept(self) -> None:
+        autospecced = create_autospec(Foo, instance=True, lazy=True)
+        replacement = mock.MagicMock(return_value="replaced")
+
+        autospecced.some_method = replacement
+
+        assert autospecced.some_method() == "replaced"
+
+    def test_functions_are_not_lazy(self) -> None:
+        autospecced = create_autospec(modified_function, lazy=True)
+
+        with pytest.raises(TypeError):
+            autospecced()
+
+
+class TestInvalidation:
+    def test_class_modified_lazy(self) -> None:
+        create_autospec(ModifiedLater, lazy=True)
+
+        ModifiedLater.added = lambda self: "added"  # type: ignore
+        try:
+            autospecced = create_autospec(ModifiedLater, instance=True, lazy=True)
+        finally:
+            del ModifiedLater.added  # type: ignore
+
+        assert autospecced.added() is not None
+        with pytest.raises(AttributeError):
+            create_autospec(ModifiedLater, instance=True, lazy=True).added
+
+    def test_class_modified(self) -> None:
+        create_autospec(ModifiedLater)
+
+        ModifiedLater.added = lambda self: "added"  # type: ignore
+        try:
+            autospecced = create_autospec(ModifiedLater, instance=True)
+        finally:
+            del ModifiedLater.added  # type: ignore
+
+        assert autospecced.added() is not None
+        with pytest.raises(AttributeError):
+            create_autospec(ModifiedLater, instance=True).added
+
+    def test_function_modified(self) -> None:
+        create_autospec(modified_function)("a")
+
+        original_code = modified_function.__code__
+        modified_function.__code__ = (lambda arg, other: arg).__code__
+        try:
+            autospecced = create_autospec(modified_function)
+        finally:
+            modified_function.__code__ = original_code
+
+        autospecced("a", "b")
+        with pytest.raises(TypeError):
+            autospecced("a")
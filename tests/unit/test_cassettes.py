@@ -0,0 +1,138 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from megamock import Mega, MegaMock
+from megamock.cassettes import Cassette, CassetteMissException
+from tests.unit.simple_app.async_portion import SomeClassWithAsyncMethods
+from tests.unit.simple_app.bar import some_func
+
+
+class Model:
+    def __init__(self) -> None:
+        self.predictions = 0
+
+    def predict(self, value: int, scale: int = 1) -> int:
+        self.predictions += 1
+        return value * scale + self.predictions
+
+    def fail(self) -> None:
+        raise ValueError("failed")
+
+
+class TestCassette:
+    def test_record_and_replay(self, tmp_path: Path) -> None:
+        path = tmp_path / "model.pickle"
+        model = Model()
+        cassette = Cassette(path)
+        spy = MegaMock.this(spy=model, cassette=cassette)
+
+        assert spy.predict(1) == 2
+        assert spy.predict(2, scale=10) == 22
+        cassette.save()
+
+        replayed = MegaMock.replay(Model, path)
+        assert replayed.predict(1) == 2
+        assert replayed.predict(2, scale=10) == 22
+        assert Mega(replayed.predict).call_count == 2
+        assert model.predictions == 2
+
+    def test_repeated_calls_in_order(self) -> None:
+        cassette = Cassette()
+        spy = MegaMock.this(spy=Model(), cassette=cassette)
+        for _ in range(3):
+            spy.predict(1)
+
+        replayed = MegaMock.replay(Model, cassette)
+        assert [replayed.predict(1) for _ in range(4)] == [2, 3, 4, 4]
+
+        cassette.rewind()
+        assert replayed.predict(1) == 2
+
+    def test_exceptions(self) -> None:
+        cassette = Cassette()
+        spy = MegaMock.this(spy=Model(), cassette=cassette)
+        with pytest.raises(ValueError):
+            spy.fail()
+
+        replayed = MegaMock.replay(Model, cassette)
+        with pytest.raises(ValueError, match="failed"):
+            replayed.fail()
+
+    def test_miss(self) -> None:
+        cassette = Cassette()
+        spy = MegaMock.this(spy=Model(), cassette=cassette)
+        spy.predict(1)
+
+        replayed = MegaMock.replay(Model, cassette)
+        with pytest.raises(CassetteMissException, match="predict"):
+            replayed.predict(2)
+
+    def test_function(self) -> None:
+        cassette = Cassette()
+        spy = MegaMock.this(spy=some_func, cassette=cassette)
+        spy("a")
+
+        assert MegaMock.replay(some_func, cassette)("a") == "aa"
+
+    async def test_async(self) -> None:
+        cassette = Cassette()
+        spy = MegaMock.this(spy=SomeClassWithAsyncMethods(), cassette=cassette)
+        assert await spy.some_method("a") == "a"
+
+        replayed = MegaMock.replay(SomeClassWithAsyncMethods, cassette)
+        assert await replayed.some_method("a") == "a"
+        assert Mega(replayed.some_method).call_count == 1
+
+    def test_argument_order_does_not_matter(self) -> None:
+        cassette = Cassette()
+        cassette.record("get", ({"a": 1, "b": 2}, {"x", "y"}), {"c": 3, "d": 4}, 1)
+
+        assert cassette.replay("get", ({"b": 2, "a": 1}, {"y", "x"}), {"d": 4, "c": 3})
+
+    def test_same_key_across_processes(self, tmp_path: Path) -> None:
+        path = tmp_path / "cassette.pickle"
+        cassette = Cassette(path)
+        cassette.record("get", ({"x", "y", "z"},), {}, 1)
+        cassette.save()
+        script = (
+            "from megamock.cassettes import Cassette; "
+            f"cassette = Cassette.load({str(path)!r}); "
+            "print(cassette.replay('get', ({'z', 'y', 'x'},), {}))"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONHASHSEED": "1"},
+        )
+        assert result.stdout.strip() == "1", result.stderr
+
+    def test_unkeyable_argument(self) -> None:
+        with pytest.raises(TypeError, match="Can't look up a call with a object"):
+            Cassette().record("get", (object(),), {}, 1)
+
+    def test_unkeyable_argument_fails_before_the_call(self) -> None:
+        model = Model()
+        spy = MegaMock.this(spy=model, cassette=Cassette())
+
+        with pytest.raises(TypeError, match="Can't look up a call with a object"):
+            spy.predict(object())
+
+        assert model.predictions == 0
+
+    def test_save_without_path(self) -> None:
+        with pytest.raises(ValueError):
+            Cassette().save()
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        path = tmp_path / "cassette.pickle"
+        Cassette(path).save()
+        path.write_bytes(path.read_bytes().replace(b"version", b"versiom"))
+
+        with pytest.raises(ValueError):
+            Cassette.load(path)
@@ -1,5 +1,8 @@
 import asyncio
+import gc
 import inspect
+import time
+import weakref
 from contextlib import contextmanager
 from typing import Generator, cast
 from unittest import mock
@@ -10,13 +13,15 @@ from megamock import MegaMock, name_words
 from megamock.megamocks import (
     AsyncMegaMock,
     AttributeTrackingBase,
+    CallTimings,
     NonCallableMegaMock,
     UseRealLogic,
 )
 from megamock.megapatches import MegaPatch
 from megamock.megas import Mega
 from tests.unit.conftest import SomeClass
-from tests.unit.simple_app.bar import Bar
+from tests.unit.simple_app.async_portion import SomeClassWithAsyncMethods
+from tests.unit.simple_app.bar import Bar, some_func
 from tests.unit.simple_app.foo import Foo
 from tests.unit.simple_app.generics import UsesGenerics
 from tests.unit.simple_app.nested_classes import NestedParent
@@ -48,6 +53,13 @@ class TestAttributeTrackingBase:
         assert obj.top_of_stacktrace[0].startswith('"file_in_root.py')
 
 
+class WithGenericAnnotations:
+    items: list[str]
+
+    def __init__(self) -> None:
+        self.items = []
+
+
 class TestMegaMock:
     def test_allows_no_args(self) -> None:
         MegaMock()
@@ -263,6 +275,27 @@ class TestMegaMock:
 
             mock_instance.a = MegaMock.this(str)
 
+        def test_spec_set_with_generic_annotations_checks_origin(self) -> None:
+            mock_instance: WithGenericAnnotations = MegaMock.this(
+                WithGenericAnnotations, spec_set=True
+            )
+
+            with pytest.raises(TypeError) as exc:
+                mock_instance.items = "a"  # type: ignore
+            mock_instance.items = ["a"]
+
+            assert str(exc.value) == "'a' is not an instance of list[str]"
+
+        def test_spec_set_with_annotations_resolves_hints_once(self) -> None:
+            mock_instance: SomeClass = MegaMock.this(SomeClass, spec_set=True)
+            mock_instance.a = "first"
+
+            with mock.patch(
+                "megamock.megamocks.get_type_hints", side_effect=AssertionError
+            ):
+                mock_instance.a = "second"
+                MegaMock.this(SomeClass, spec_set=True).a = "third"
+
         def test_spec_set_defaults_to_true(self) -> None:
             mock_instance: SomeClass = MegaMock.this(SomeClass, spec_set=True)
 
@@ -289,7 +322,145 @@ class TestMegaMock:
             with pytest.raises(TypeError):
                 mock_instance()  # type: ignore
 
+    class TestLazy:
+        def test_attributes_created_on_first_access(self) -> None:
+            mock_instance = MegaMock.it(Foo, lazy=True)
+            children = mock_instance._wrapped_legacy_mock._mock_children
+            assert "some_method" not in children
+
+            mock_instance.some_method()
+
+            assert "some_method" in children
+            assert "takes_args" not in children
+
+        def test_attributes_not_in_spec(self) -> None:
+            mock_instance = MegaMock.it(Foo, lazy=True)
+
+            with pytest.raises(AttributeError):
+                mock_instance.does_not_exist  # type: ignore
+
+        def test_signatures_enforced(self) -> None:
+            mock_instance = MegaMock.it(Foo, lazy=True)
+
+            mock_instance.takes_args("a", "b")
+            with pytest.raises(TypeError):
+                mock_instance.takes_args("a")  # type: ignore
+
+        def test_return_values_and_assertions(self) -> None:
+            mock_instance = MegaMock.it(Foo, lazy=True)
+            mock_instance.some_method.return_value = "val"
+
+            assert mock_instance.some_method() == "val"
+            assert Mega(mock_instance.some_method).called_once_with()
+
+        def test_real_logic(self) -> None:
+            mock_instance = MegaMock.it(Foo, lazy=True)
+            Mega(mock_instance.some_method).use_real_logic()
+
+            assert mock_instance.some_method() == "value"
+
+        def test_class(self) -> None:
+            mock_class = MegaMock.the_class(Foo, lazy=True)
+
+            mock_class("s").takes_args("a", "b")
+            with pytest.raises(TypeError):
+                mock_class()  # type: ignore
+
+        def test_nested_classes(self) -> None:
+            mock_instance = MegaMock.it(NestedParent, lazy=True)
+
+            nested = mock_instance.NestedChild.AnotherNestedChild
+            assert not isinstance(nested, NonCallableMegaMock)
+
+        def test_nested_classes_can_be_instantiated(self) -> None:
+            eager = MegaMock.it(NestedParent)
+            lazy = MegaMock.it(NestedParent, lazy=True)
+
+            for mock_instance in (eager, lazy):
+                nested = mock_instance.NestedChild.AnotherNestedChild()
+                assert isinstance(nested, NonCallableMegaMock)
+                nested.z()
+                with pytest.raises(TypeError):
+                    nested.z("a")  # type: ignore
+
+        async def test_async_methods(self) -> None:
+            mock_instance = MegaMock.it(SomeClassWithAsyncMethods, lazy=True)
+            mock_instance.some_method.return_value = "val"
+
+            assert await mock_instance.some_method("s") == "val"
+
+    class TestCompiled:
+        def test_attributes_cached_on_instance(self) -> None:
+            mock_instance = MegaMock.compiled(Foo)
+
+            assert mock_instance.some_method is mock_instance.some_method
+            assert "some_method" in mock_instance.__dict__
+
+        def test_calls_recorded(self) -> None:
+            mock_instance = MegaMock.compiled(Foo)
+            mock_instance.takes_args("a", "b")
+
+            assert Mega(mock_instance.takes_args).called_once_with("a", "b")
+            with pytest.raises(TypeError):
+                mock_instance.takes_args("a")  # type: ignore
+
+        def test_return_value(self) -> None:
+            mock_instance = MegaMock.compiled(Foo)
+            mock_instance.some_method.return_value = "val"
+
+            assert mock_instance.some_method() == "val"
+
+        def test_call_result_reused(self) -> None:
+            mock_instance = MegaMock.compiled(Foo)
+            result = mock_instance.some_method()
+
+            assert isinstance(result, MegaMock)
+            assert mock_instance.some_method() is result
+
+            mock_instance.some_method.return_value = "val"
+            assert mock_instance.some_method() == "val"
+
+        def test_assignment_replaces_cached_attribute(self) -> None:
+            mock_instance = MegaMock.compiled(Foo)
+            mock_instance.some_method
+            mock_instance.some_method = MegaMock(return_value="val")
+
+            assert mock_instance.some_method() == "val"
+
+        def test_attributes_not_in_spec(self) -> None:
+            mock_instance = MegaMock.compiled(Foo)
+
+            with pytest.raises(AttributeError):
+                mock_instance.does_not_exist  # type: ignore
+            with pytest.raises(AttributeError):
+                mock_instance.does_not_exist = 1  # type: ignore
+
+        def test_class_generated_once_per_spec(self) -> None:
+            first = MegaMock.compiled(Foo)
+            second = MegaMock.compiled(Foo)
+
+            assert type(first).__bases__ == type(second).__bases__
+            assert type(first).__bases__[0].__name__ == "CompiledFoo"
+
+        def test_class_regenerated_when_spec_changes(self) -> None:
+            class Changes:
+                def method(self) -> None:
+                    pass
+
+            MegaMock.compiled(Changes)
+            Changes.added = lambda self: "added"  # type: ignore
+
+            mock_instance = MegaMock.compiled(Changes)
+            mock_instance.added()  # type: ignore
+
+            assert "added" in mock_instance.__dict__
+
+        def test_spy_not_supported(self) -> None:
+            with pytest.raises(ValueError):
+                MegaMock.compiled(Foo, spy=Foo("s"))
+
     class TestFromLegacyMock:
+
         def test_when_autospec_used_on_class(self) -> None:
             legacy_mock = mock.create_autospec(SomeClass)
             mega_mock = MegaMock.from_legacy_mock(legacy_mock, spec=SomeClass)
@@ -354,6 +525,63 @@ class TestMegaMock:
             for frame in stacktrace:
                 assert "/megamocks.py" not in frame.filename
 
+        def test_stacktrace_built_on_first_use(self) -> None:
+            mega_mock: MegaMock = MegaMock()
+
+            mega_mock.foo = "bar"
+
+            assignment = mega_mock.megamock.attr_assignments["foo"][0]
+            assert assignment._stacktrace is None
+            assert assignment.stacktrace[0].name == "test_stacktrace_built_on_first_use"
+            assert "mega_mock.foo" in assignment.format_stacktrace(1)[0]
+
+        def test_max_stack_depth(self, monkeypatch: pytest.MonkeyPatch) -> None:
+            monkeypatch.setattr(AttributeTrackingBase, "max_stack_depth", 2)
+            mega_mock: MegaMock = MegaMock()
+
+            mega_mock.foo = "bar"
+
+            assert len(mega_mock.megamock.attr_assignments["foo"][0].stacktrace) == 2
+
+        def test_records_are_compact(self) -> None:
+            mega_mock: MegaMock = MegaMock()
+            for i in range(2):
+                mega_mock.foo = i
+
+            first, second = mega_mock.megamock.attr_assignments["foo"]
+            assert not hasattr(first, "__dict__")
+            # same stack, so it is shared
+            assert first._frames is second._frames
+            assert first.time_ns <= second.time_ns
+
+        def test_time(self) -> None:
+            before = time.time()
+            mega_mock: MegaMock = MegaMock()
+            mega_mock.foo = "bar"
+
+            assignment = mega_mock.megamock.attr_assignments["foo"][0]
+            assert before - 1 < assignment.time < time.time() + 1
+
+        def test_set_time(self) -> None:
+            mega_mock: MegaMock = MegaMock()
+            mega_mock.foo = "bar"
+            assignment = mega_mock.megamock.attr_assignments["foo"][0]
+
+            assignment.time = 1_000_000.5
+
+            assert assignment.time == pytest.approx(1_000_000.5)
+
+        def test_stacks_dropped_with_records(self) -> None:
+            mega_mock: MegaMock = MegaMock()
+            mega_mock.foo = "bar"
+            stack = mega_mock.megamock.attr_assignments["foo"][0]._frames
+            stack_ref = weakref.ref(stack)
+            del stack, mega_mock
+
+            gc.collect()
+
+            assert stack_ref() is None
+
         def test_multiple_assignments(self) -> None:
             mega_mock: MegaMock = MegaMock()
             mega_mock.foo = "foo"
@@ -367,6 +595,226 @@ class TestMegaMock:
             assert mega_mock.megamock.attr_assignments["foo"][0].attr_value == "foo"
             assert mega_mock.megamock.attr_assignments["foo"][1].attr_value == "second"
 
+    class TestTracking:
+        def test_full_by_default(self) -> None:
+            mega_mock: MegaMock = MegaMock()
+            for i in range(3):
+                mega_mock.foo = i
+
+            records = mega_mock.megamock.attr_assignments["foo"]
+            assert [record.attr_value for record in records] == [0, 1, 2]
+            assert records.total == 3
+
+        def test_last_n(self) -> None:
+            mega_mock: MegaMock = MegaMock(tracking="last:2")
+            for i in range(5):
+                mega_mock.foo = i
+
+            records = mega_mock.megamock.attr_assignments["foo"]
+            assert [record.attr_value for record in records] == [3, 4]
+            assert records.total == 5
+
+        def test_count(self) -> None:
+            mega_mock = MegaMock.it(Foo, tracking="count")
+            mega_mock.s = "a"
+            mega_mock.s = "b"
+
+            records = mega_mock.megamock.attr_assignments["s"]
+            assert len(records) == 0
+            assert records.total == 2
+
+        def test_off(self) -> None:
+            mega_mock: MegaMock = MegaMock(tracking="off")
+            mega_mock.foo = "bar"
+
+            assert mega_mock.foo == "bar"
+            assert not mega_mock.megamock.attr_assignments
+
+        def test_spy_access(self) -> None:
+            mega_mock = MegaMock.this(spy=Foo("s"), tracking="last:1")
+            mega_mock.z
+            mega_mock.z
+
+            records = MegaMock(mega_mock).megamock.spied_access["z"]
+            assert len(records) == 1
+            assert records.total == 2
+
+        def test_children_use_parent_tracking(self) -> None:
+            mega_mock = MegaMock.it(Foo, tracking="off")
+
+            assert not mega_mock.some_method.megamock.tracking.enabled
+
+        def test_global_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+            monkeypatch.setattr(AttributeTrackingBase, "default_tracking", "count")
+            mega_mock: MegaMock = MegaMock()
+            mega_mock.foo = "bar"
+
+            assert len(mega_mock.megamock.attr_assignments["foo"]) == 0
+
+        @pytest.mark.parametrize("setting", ["all", "last:0", "last:x", "off:1"])
+        def test_invalid(self, setting: str) -> None:
+            with pytest.raises(ValueError):
+                MegaMock(tracking=setting)
+
+    class TestCallRecording:
+        def test_last_n(self) -> None:
+            mega_mock = MegaMock.it(Foo, record="last:2")
+            for i in range(5):
+                mega_mock.takes_args(i, i)
+
+            assert mega_mock.takes_args.call_args_list == [
+                mock.call(3, 3),
+                mock.call(4, 4),
+            ]
+            assert Mega(mega_mock.takes_args).call_count == 5
+            assert Mega(mega_mock.takes_args).called_with(4, 4)
+            assert Mega(mega_mock.takes_args).any_call(3, 3)
+            assert not Mega(mega_mock.takes_args).any_call(1, 1)
+            assert mega_mock.method_calls == [
+                mock.call.takes_args(3, 3),
+                mock.call.takes_args(4, 4),
+            ]
+
+        def test_count(self) -> None:
+            mega_mock: MegaMock = MegaMock(record="count")
+            mega_mock(1)
+            mega_mock(2)
+
+            assert mega_mock.call_args_list == []
+            assert Mega(mega_mock).call_count == 2
+            assert Mega(mega_mock).call_args == mock.call(2)
+
+        def test_none(self) -> None:
+            mega_mock = MegaMock.it(Foo, record="none")
+            mega_mock.some_method.return_value = "val"
+
+            assert mega_mock.some_method() == "val"
+            assert Mega(mega_mock.some_method).not_called()
+
+        def test_bounded_after_reset(self) -> None:
+            mega_mock: MegaMock = MegaMock(record="last:1")
+            mega_mock(1)
+            mega_mock.reset_mock()
+            mega_mock(2)
+            mega_mock(3)
+
+            assert mega_mock.call_args_list == [mock.call(3)]
+
+        async def test_async(self) -> None:
+            mega_mock = MegaMock.it(SomeClassWithAsyncMethods, record="last:1")
+            for arg in "abcde":
+                await mega_mock.some_method(arg)
+
+            assert mega_mock.some_method.call_args_list == [mock.call("e")]
+            # awaits are trimmed on the next call
+            assert len(mega_mock.some_method.await_args_list) <= 2
+
+        def test_function(self) -> None:
+            mega_mock = MegaMock.it(some_func, record="last:1", index_calls=True)
+            mega_mock("a")
+            mega_mock("b")
+
+            assert mega_mock.call_args_list == [mock.call("b")]
+            assert Mega(mega_mock).any_call("b")
+            assert not Mega(mega_mock).any_call("a")
+
+        def test_invalid(self) -> None:
+            with pytest.raises(ValueError):
+                MegaMock(record="last")
+
+    class TestCallTimings:
+        def test_timestamps(self) -> None:
+            mega_mock = MegaMock.it(Foo, time_calls=True)
+            before = time.perf_counter_ns()
+            mega_mock.some_method()
+            mega_mock.some_method()
+            after = time.perf_counter_ns()
+
+            timings = Mega(mega_mock.some_method).call_timings
+            assert len(timings.starts) == 2
+            assert before <= timings.starts[0] <= timings.starts[1] <= after
+            assert list(timings.intervals()) == [timings.starts[1] - timings.starts[0]]
+
+        def test_call_rate(self) -> None:
+            timings = CallTimings()
+            timings.starts.extend([0, 250_000_000, 500_000_000, 1_000_000_000])
+
+            assert timings.call_rate() == 3.0
+            assert CallTimings().call_rate() == 0.0
+
+        def test_histogram(self) -> None:
+            timings = CallTimings()
+            timings.starts.extend([0, 1_500_000, 2_000_000, 5_000_000])
+
+            assert timings.histogram() == {0: 1, 1_000_000: 1, 3_000_000: 1}
+            assert timings.histogram(bucket_ns=10_000_000) == {0: 3}
+
+        def test_as_dict(self) -> None:
+            timings = CallTimings()
+            timings.starts.extend([10, 30])
+
+            assert timings.as_dict() == {
+                "starts_ns": [10, 30],
+                "intervals_ns": [20],
+                "await_durations_ns": [],
+            }
+
+        def test_cleared_on_reset(self) -> None:
+            mega_mock: MegaMock = MegaMock(time_calls=True)
+            mega_mock()
+            mega_mock()
+            mega_mock.reset_mock()
+            mega_mock()
+
+            assert len(Mega(mega_mock).call_timings.starts) == 1
+
+        def test_cleared_on_reset_before_calls(self) -> None:
+            mega_mock: MegaMock = MegaMock(time_calls=True)
+            mega_mock()
+            mega_mock.reset_mock()
+
+            assert len(Mega(mega_mock).call_timings.starts) == 0
+            assert Mega(mega_mock).call_rate() == 0.0
+
+        def test_cleared_on_parent_reset(self) -> None:
+            mega_mock = MegaMock.it(Foo, time_calls=True)
+            mega_mock.some_method()
+            mega_mock.some_method()
+            mega_mock.reset_mock()
+            mega_mock.some_method()
+
+            assert len(Mega(mega_mock.some_method).call_timings.starts) == 1
+
+        def test_last_n_calls(self) -> None:
+            mega_mock: MegaMock = MegaMock(time_calls=True, record="last:2")
+            for _ in range(5):
+                mega_mock()
+
+            timings = Mega(mega_mock).call_timings
+            assert len(timings.starts) == 2
+            assert len(timings.intervals()) == 1
+
+        async def test_await_durations(self) -> None:
+            mega_mock = MegaMock.it(SomeClassWithAsyncMethods, time_calls=True)
+
+            async def side_effect(arg: str) -> str:
+                await asyncio.sleep(0.01)
+                return arg
+
+            mega_mock.some_method.side_effect = side_effect
+            await mega_mock.some_method("a")
+
+            durations = Mega(mega_mock.some_method).call_timings.await_durations
+            assert len(durations) == 1
+            assert durations[0] >= 10_000_000
+            assert Mega(mega_mock.some_method).timing_histogram(
+                bucket_ns=1_000_000_000, awaits=True
+            ) == {0: 1}
+
+        def test_not_enabled(self) -> None:
+            with pytest.raises(Exception, match="time_calls=True"):
+                Mega(MegaMock()).call_rate()
+
     class TestWraps:
         def test_wraps_object(self) -> None:
             obj = Foo("s")
@@ -412,6 +860,52 @@ class TestMegaMock:
                 .filename.endswith("test_megamocks.py")
             )
 
+        def test_shallow_copy_by_default(self) -> None:
+            self.obj.z = [1]  # type: ignore
+            self.mega_mock.z.append(2)
+
+            access = MegaMock(self.mega_mock).megamock.spied_access["z"][0]
+            assert access.attr_value == [1]
+
+        def test_no_copy(self) -> None:
+            self.obj.z = [1]  # type: ignore
+            mega_mock = MegaMock.this(spy=self.obj, spy_snapshot="none")
+            mega_mock.z.append(2)
+
+            access = MegaMock(mega_mock).megamock.spied_access["z"][0]
+            assert access.attr_value == [1, 2]
+
+        def test_deep_copy(self) -> None:
+            self.obj.z = [[1]]  # type: ignore
+            mega_mock = MegaMock.this(spy=self.obj, spy_snapshot="deep")
+            mega_mock.z[0].append(2)
+
+            access = MegaMock(mega_mock).megamock.spied_access["z"][0]
+            assert access.attr_value == [[1]]
+
+        def test_snapshot_callable(self) -> None:
+            self.obj.z = [1, 2, 3]  # type: ignore
+            mega_mock = MegaMock.this(spy=self.obj, spy_snapshot=len)
+
+            assert mega_mock.z == [1, 2, 3]
+            access = MegaMock(mega_mock).megamock.spied_access["z"][0]
+            assert access.attr_value == 3
+
+        def test_uncopyable_value_recorded_as_is(self) -> None:
+            class Uncopyable:
+                def __copy__(self) -> None:
+                    raise TypeError("cannot copy")
+
+            self.obj.z = value = Uncopyable()  # type: ignore
+
+            assert self.mega_mock.z is value
+            access = MegaMock(self.mega_mock).megamock.spied_access["z"][0]
+            assert access.attr_value is value
+
+        def test_invalid_spy_snapshot(self) -> None:
+            with pytest.raises(ValueError):
+                MegaMock.this(spy=self.obj, spy_snapshot="copy")  # type: ignore
+
         def test_supports_megacast(self) -> None:
             assert self.mega_mock.some_method() == "value"
 
@@ -672,6 +1166,84 @@ class TestMegaMock:
             mock = MegaMock.this(some_func)
             assert not callable(mock._get_call_spec())
 
+        def test_spec_created_once(self) -> None:
+            mega_mock = MegaMock.it(Foo)
+
+            assert (
+                mega_mock.get_a_manager._get_call_spec()
+                is mega_mock.get_a_manager._get_call_spec()
+            )
+
+        def test_call_result_not_shared(self) -> None:
+            mega_mock = MegaMock.it(Foo)
+            result = mega_mock.get_a_manager()
+            result.megamock.name = "first result"
+
+            second_result = mega_mock.get_a_manager()
+            assert isinstance(second_result, MegaMock)
+            assert second_result is not result
+            assert second_result.megamock.name != "first result"
+            assert Mega(mega_mock.get_a_manager).call_count == 2
+
+    class TestGetSpecFromParents:
+        def test_nested_attribute(self) -> None:
+            mega_mock = MegaMock.it(NestedParent)
+            z = mega_mock.NestedChild.AnotherNestedChild.z
+
+            assert z.megamock.attr_name == "z"
+            assert (
+                z._get_spec_from_parents()
+                is NestedParent.NestedChild.AnotherNestedChild.z
+            )
+
+        def test_instance_of_nested_class(self) -> None:
+            mega_mock = MegaMock.it(NestedParent)
+            instance = mega_mock.NestedChild.AnotherNestedChild()
+
+            assert instance.megamock.attr_name is None
+            assert (
+                instance._get_spec_from_parents()
+                is NestedParent.NestedChild.AnotherNestedChild
+            )
+            Mega(instance.z).use_real_logic()
+            assert instance.z() == "z"
+
+        def test_child_of_return_value(self) -> None:
+            mega_mock = MegaMock.it(NestedParent)
+            z = mega_mock.NestedChild.AnotherNestedChild().z
+
+            assert (
+                z._get_spec_from_parents()
+                is NestedParent.NestedChild.AnotherNestedChild.z
+            )
+
+        def test_no_root_spec(self) -> None:
+            mega_mock = MegaMock()
+
+            assert mega_mock.a.b._get_spec_from_parents() is None
+
+        def test_nested_attribute_missing_from_spec(self) -> None:
+            mega_mock = MegaMock.it(NestedParent)
+            z = mega_mock.NestedChild.AnotherNestedChild.z
+            z._get_spec_from_parents()
+
+            mega_mock.megamock.spec = Foo
+
+            assert z._get_spec_from_parents() is None
+            assert mega_mock.NestedChild._get_spec_from_parents() is None
+
+        def test_root_spec_changed(self) -> None:
+            mega_mock = MegaMock.it(NestedParent)
+            child = mega_mock.NestedChild
+            child._get_spec_from_parents()
+
+            class OtherParent:
+                class NestedChild:
+                    pass
+
+            mega_mock.megamock.spec = OtherParent
+            assert child._get_spec_from_parents() is OtherParent.NestedChild
+
     class TestPydanticObjects:
         @pytest.mark.xfail
         def test_mocking_nested_attributes(self) -> None:
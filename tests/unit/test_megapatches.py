@@ -1,11 +1,24 @@
+import asyncio
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator
 from unittest import mock
 
 import pytest
 
 from megamock import MegaPatch
 from megamock.megamocks import NonCallableMegaMock, UseRealLogic
-from megamock.megapatches import MegaMock, MegaPatchContext
+from megamock.megapatches import (
+    MegaMock,
+    MegaPatchBehavior,
+    MegaPatchContext,
+    MegaPatchGroup,
+    PatchTimings,
+)
 from megamock.megas import Mega
+from tests.conftest import PytestMockStyleMocker
 from tests.unit.simple_app import bar as other_bar
 from tests.unit.simple_app import foo, nested_classes
 from tests.unit.simple_app.async_portion import (
@@ -70,6 +83,87 @@ class TestMegaPatchContext:
         del megapatch_context
         assert Mega(megapatch.stop).called_once()
 
+    def test_add_remove_all(self) -> None:
+        megapatch_context = MegaPatchContext()
+        megapatch1 = MegaMock.it(MegaPatch)
+        megapatch2 = MegaMock.it(MegaPatch)
+        megapatch_context.add_all([megapatch1, megapatch2])
+        assert megapatch_context.active_patches() == [megapatch1, megapatch2]
+        megapatch_context.remove_all([megapatch1, megapatch2])
+        assert megapatch_context.active_patches() == []
+
+    def test_stop_all_stops_most_recent_first(self) -> None:
+        MegaPatch.it(Foo.moo, new="first")
+        MegaPatch.it(Foo.moo, new="second")
+        assert Foo.moo == "second"
+
+        MegaPatch.stop_all(MegaPatch.context_stack[-1])
+
+        assert Foo.moo == "cow"
+
+    async def test_context_stack_is_per_task(self) -> None:
+        outer_context = MegaPatch.current_context()
+
+        async def scenario() -> None:
+            with MegaPatch.new_context() as context:
+                await asyncio.sleep(0)
+                assert MegaPatch.current_context() is context
+                assert MegaPatch.context_stack[-2] is outer_context
+
+        await asyncio.gather(scenario(), scenario())
+
+        assert MegaPatch.current_context() is outer_context
+
+    def test_stop_in_new_thread(self) -> None:
+        def patch_and_stop() -> str:
+            MegaPatch.it(some_func, return_value="val").stop()
+            return some_func("s")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(patch_and_stop).result() == "sa"
+
+    def test_context_stack_append_and_pop(self) -> None:
+        outer_context = MegaPatch.current_context()
+        context = MegaPatchContext()
+
+        MegaPatch.context_stack.append(context)
+
+        assert MegaPatch.current_context() is context
+        assert MegaPatch.context_stack.pop() is context
+        assert MegaPatch.current_context() is outer_context
+
+    async def test_context_stack_append_is_per_task(self) -> None:
+        outer_context = MegaPatch.current_context()
+
+        async def scenario() -> None:
+            context = MegaPatchContext()
+            MegaPatch.context_stack.append(context)
+            await asyncio.sleep(0)
+            assert MegaPatch.current_context() is context
+            MegaPatch.context_stack.pop()
+
+        await asyncio.gather(scenario(), scenario())
+
+        assert MegaPatch.current_context() is outer_context
+
+    async def test_patches_added_to_task_context(self) -> None:
+        outer_context = MegaPatch.current_context()
+
+        async def scenario(start_patch: Callable[[], MegaPatch]) -> None:
+            with MegaPatch.new_context() as context:
+                patch = start_patch()
+                await asyncio.sleep(0)
+                assert context.active_patches() == [patch]
+                assert patch not in outer_context.active_patches()
+
+        await asyncio.gather(
+            scenario(lambda: MegaPatch.it(Foo.moo, new="val")),
+            scenario(lambda: MegaPatch.it(Foo.z, new="val")),
+        )
+
+        assert Foo.moo == "cow"
+        assert Foo.z == "z"
+
 
 class TestMegaPatchPatching:
     def test_patch_class_itself(self) -> None:
@@ -286,6 +380,117 @@ class TestMegaPatchPatching:
         assert Foo("s").some_method() == "new val"
 
 
+class TestMegaPatchPytestMockStyleMocker:
+    def test_patches_are_started(
+        self, stopall_mocker: PytestMockStyleMocker
+    ) -> None:
+        MegaPatch.it(Foo.some_method, return_value="val", mocker=stopall_mocker)
+
+        assert Foo("s").some_method() == "val"
+
+    def test_stop_only_undoes_own_patches(
+        self, stopall_mocker: PytestMockStyleMocker
+    ) -> None:
+        mocker = stopall_mocker
+        method_patch = MegaPatch.it(Foo.some_method, return_value="val", mocker=mocker)
+        MegaPatch.it(Foo.moo, new="dog", mocker=mocker)
+
+        method_patch.stop()
+
+        assert Foo("s").some_method() == "value"
+        assert Foo.moo == "dog"
+        assert mocker.stopall_calls == 0
+
+    def test_context_teardown_does_not_use_stopall(
+        self, stopall_mocker: PytestMockStyleMocker
+    ) -> None:
+        mocker = stopall_mocker
+        with MegaPatch.new_context():
+            for i in range(10):
+                MegaPatch.it(Foo.moo, new=f"moo {i}", mocker=mocker)
+
+        assert Foo.moo == "cow"
+        assert mocker.stopall_calls == 0
+        assert mocker._patches_and_mocks == []
+
+    def test_context_teardown_keeps_other_mocker_patches(
+        self, stopall_mocker: PytestMockStyleMocker
+    ) -> None:
+        mocker = stopall_mocker
+        mocker.patch("tests.unit.simple_app.foo.Foo.z", "patched")
+        with MegaPatch.new_context():
+            for i in range(10):
+                MegaPatch.it(Foo.moo, new=f"moo {i}", mocker=mocker)
+
+        assert Foo.moo == "cow"
+        assert Foo.z == "patched"
+        assert len(mocker._patches_and_mocks) == 1
+        mocker.stopall()
+        assert Foo.z == "z"
+
+    def test_mocker_stopall_undoes_patches(
+        self, stopall_mocker: PytestMockStyleMocker
+    ) -> None:
+        megapatch = MegaPatch.it(Foo.moo, new="dog", mocker=stopall_mocker)
+
+        stopall_mocker.stopall()
+        assert Foo.moo == "cow"
+
+        megapatch.stop()
+        assert Foo.moo == "cow"
+
+    def test_mocker_without_stop(
+        self, stopall_mocker: PytestMockStyleMocker
+    ) -> None:
+        MegaPatch.it(Foo.moo, new="dog", mocker=stopall_mocker)
+        # older versions of pytest-mock can't stop a single patch
+        mocker = mock.NonCallableMock(
+            wraps=stopall_mocker, spec=["patch", "stopall"]
+        )
+        megapatch = MegaPatch.it(Foo.some_method, return_value="val", mocker=mocker)
+
+        megapatch.stop()
+
+        assert Foo("s").some_method() == "value"
+        assert Foo.moo == "cow"
+        assert stopall_mocker.stopall_calls == 1
+
+    def test_autostart_can_be_disabled(
+        self, stopall_mocker: PytestMockStyleMocker
+    ) -> None:
+        patch = MegaPatch.it(
+            Foo.some_method,
+            return_value="val",
+            autostart=False,
+            mocker=stopall_mocker,
+        )
+        assert Foo("s").some_method() == "value"
+
+        with patch:
+            assert Foo("s").some_method() == "val"
+
+
+class TestMegaPatchStopAll:
+    def test_patches_are_registered_with_stopall(self) -> None:
+        # calling mock.patch.stopall() here would undo the session patches too
+        megapatch = MegaPatch.it(Foo.moo, new="dog")
+        assert megapatch.patches[0] in mock._patch._active_patches  # type: ignore
+
+        megapatch.stop()
+        assert megapatch.patches[0] not in mock._patch._active_patches  # type: ignore
+
+    def test_context_teardown_keeps_other_patches_registered(self) -> None:
+        outer = MegaPatch.it(Foo.moo, new="outer")
+        with MegaPatch.new_context():
+            for i in range(5):
+                MegaPatch.it(Foo.moo, new=f"moo {i}")
+            MegaPatch.it(Foo.some_method, return_value="val")
+
+        assert Foo.moo == "outer"
+        assert Foo("s").some_method() == "value"
+        assert outer.patches[0] in mock._patch._active_patches  # type: ignore
+
+
 class TestMegaPatchAutoStart:
     def test_enabled_by_default(self) -> None:
         MegaPatch.it(Foo.helpful_manager, new="something")
@@ -383,6 +588,24 @@ class TestMegaPatchReturnValue:
         assert Foo("s").some_method() == "value"
 
 
+class TestMegaPatchLazy:
+    def test_lazy_class_patch(self) -> None:
+        patch = MegaPatch.it(Foo, lazy=True)
+        patch.megainstance.some_method.return_value = "val"
+
+        assert Foo("s").some_method() == "val"
+        with pytest.raises(TypeError):
+            Foo("s").takes_args("a")  # type: ignore
+
+    def test_lazy_behavior(self) -> None:
+        patch = MegaPatch.it(
+            Foo, behavior=MegaPatchBehavior(autospec=True, lazy=True)
+        )
+
+        assert "some_method" not in patch.megainstance._wrapped_legacy_mock.__dict__
+        assert isinstance(Foo("s").some_method(), MegaMock)
+
+
 class TestMegaPatchObject:
     # Issue https://github.com/JamesHutchison/megamock/issues/8
     @pytest.mark.xfail
@@ -594,3 +817,349 @@ class TestMegaPatchNewContext:
         context = MegaPatch.new_context()
         with context:
             assert len([x for x in MegaPatch.context_stack if x is context]) == 1
+
+
+class TestMegaPatchMany:
+    def test_patches_all_things(self) -> None:
+        patches = MegaPatch.many(Foo.some_method, some_func, bar)
+
+        assert isinstance(patches, MegaPatchGroup)
+        assert len(patches) == 3
+        patches[0].mock.return_value = "patched method"
+        patches[1].mock.return_value = "patched func"
+
+        assert Foo("s").some_method() == "patched method"
+        assert other_bar.some_func("v") == "patched func"
+        assert isinstance(foo.bar, NonCallableMegaMock)
+
+    def test_shared_kwargs(self) -> None:
+        MegaPatch.many(Foo.moo, Foo.z, new="shared")
+
+        assert Foo.moo == "shared"
+        assert Foo.z == "shared"
+
+    def test_duplicates_are_patched_once(self) -> None:
+        patches = MegaPatch.many(Foo, OtherFoo)
+
+        assert len(patches) == 1
+        assert Foo("s") is patches[0].megainstance
+
+    def test_registered_with_context(self) -> None:
+        patches = MegaPatch.many(Foo.some_method, some_func)
+
+        for megapatch in patches:
+            assert megapatch in MegaPatch.active_patches(MegaPatch.context_stack[-1])
+            assert megapatch in MegaPatch.active_patches()
+
+    def test_stop_as_a_group(self) -> None:
+        patches = MegaPatch.many(Foo.some_method, some_func, return_value="val")
+        assert Foo("s").some_method() == "val"
+
+        patches.stop()
+
+        assert Foo("s").some_method() == "value"
+        assert some_func("v") == "va"
+        for megapatch in patches:
+            assert megapatch not in MegaPatch.active_patches()
+
+    def test_stops_in_reverse_order(self) -> None:
+        patches = MegaPatch.many(Foo, Foo.some_method, return_value="val")
+        patches.stop()
+
+        assert Foo("s").some_method() == "value"
+
+    def test_autostart_disabled(self) -> None:
+        patches = MegaPatch.many(Foo.some_method, autostart=False, return_value="val")
+        assert Foo("s").some_method() == "value"
+
+        with patches:
+            assert Foo("s").some_method() == "val"
+
+        assert Foo("s").some_method() == "value"
+
+
+class TestMegaPatchReusable:
+    def test_reset_clears_call_history(self) -> None:
+        patch = MegaPatch.it(Foo.some_method, reusable=True)
+        Foo("s").some_method()
+
+        patch.reset()
+
+        assert Mega(patch.mock).not_called()
+
+    def test_reset_restores_baseline_return_value(self) -> None:
+        patch = MegaPatch.it(some_func, return_value="baseline", reusable=True)
+        patch.mark_baseline()
+        patch.mock.return_value = "changed"
+
+        patch.reset()
+
+        assert some_func("s") == "baseline"
+
+    def test_reset_restores_side_effect_iterables(self) -> None:
+        patch = MegaPatch.it(some_func, side_effect=["a", "b"], reusable=True)
+        patch.mark_baseline()
+        assert some_func("s") == "a"
+
+        patch.reset()
+
+        assert [some_func("s"), some_func("s")] == ["a", "b"]
+
+    def test_reset_restores_values_configured_on_children(self) -> None:
+        patch = MegaPatch.it(Foo, reusable=True)
+        patch.megainstance.some_method.return_value = "baseline"
+        patch.mark_baseline()
+        patch.megainstance.some_method.return_value = "changed"
+        patch.megainstance.takes_args.side_effect = Exception("Error!")
+
+        patch.reset()
+
+        assert Foo("s") is patch.megainstance
+        assert Foo("s").some_method() == "baseline"
+        assert isinstance(Foo("s").takes_args("a", "b"), MegaMock)
+
+    def test_reset_restores_assigned_attributes(self) -> None:
+        patch = MegaPatch.it(Foo, reusable=True)
+        patch.megainstance.z = "baseline"
+        patch.mark_baseline()
+        patch.megainstance.moo = "dog"
+        patch.megainstance.z = "changed"
+        patch.megainstance.some_method = MegaMock(return_value="replaced")
+
+        patch.reset()
+
+        assert Foo("s").moo != "dog"
+        assert Foo("s").z == "baseline"
+        assert isinstance(Foo("s").some_method(), MegaMock)
+
+    def test_baseline_keeps_remaining_side_effect_values(self) -> None:
+        patch = MegaPatch.it(some_func, side_effect=("a", "b", "c"), reusable=True)
+        assert some_func("s") == "a"
+        patch.mark_baseline()
+        assert some_func("s") == "b"
+
+        patch.reset()
+
+        assert [some_func("s"), some_func("s")] == ["b", "c"]
+
+    def test_endless_side_effect_iterator_is_not_reusable(self) -> None:
+        patch = MegaPatch.it(some_func, side_effect=itertools.count(), reusable=True)
+
+        patch.mark_baseline()
+
+        assert not patch.reusable
+        assert [some_func("s"), some_func("s")] == [0, 1]
+        with pytest.raises(ValueError):
+            patch.reset()
+
+    def test_single_use_side_effect_iterator_is_not_consumed(self) -> None:
+        patch = MegaPatch.it(some_func, reusable=True)
+        patch.mock.side_effect = (value for value in ["a", "b"])
+
+        MegaPatch.mark_reusable_baselines()
+
+        assert not patch.reusable
+        assert [some_func("s"), some_func("s")] == ["a", "b"]
+
+    def test_reset_without_baseline_uses_current_state(self) -> None:
+        patch = MegaPatch.it(some_func, return_value="val", reusable=True)
+        some_func("s")
+
+        patch.reset()
+
+        assert Mega(patch.mock).not_called()
+        assert some_func("s") == "val"
+
+    def test_patch_remains_in_place(self) -> None:
+        patch = MegaPatch.it(some_func, return_value="val", reusable=True)
+
+        patch.reset()
+
+        assert patch in MegaPatch.active_patches()
+        assert some_func("s") == "val"
+
+    def test_reset_reusable_only_resets_reusable_patches(self) -> None:
+        reusable_patch = MegaPatch.it(some_func, return_value="val", reusable=True)
+        other_patch = MegaPatch.it(Foo.some_method, return_value="val")
+        MegaPatch.mark_reusable_baselines()
+        some_func("s")
+        Foo("s").some_method()
+
+        MegaPatch.reset_reusable()
+
+        assert reusable_patch.reusable
+        assert Mega(reusable_patch.mock).not_called()
+        assert Mega(other_patch.mock).called_once()
+
+
+def in_other_thread(func: Callable[[], Any]) -> Any:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(func).result()
+
+
+class TestMegaPatchScoped:
+    def test_patch_only_visible_in_current_thread(self) -> None:
+        MegaPatch.it(some_func, return_value="val", scoped=True)
+
+        assert some_func("s") == "val"
+        assert in_other_thread(lambda: some_func("s")) == "sa"
+
+    def test_method(self) -> None:
+        MegaPatch.it(Foo.some_method, return_value="val", scoped=True)
+
+        assert Foo("s").some_method() == "val"
+        assert in_other_thread(lambda: Foo("s").some_method()) == "value"
+
+    def test_class(self) -> None:
+        patch = MegaPatch.it(Foo, scoped=True)
+
+        assert Foo("s") is patch.megainstance
+        assert in_other_thread(lambda: Foo("s").some_method()) == "value"
+
+    def test_class_attribute(self) -> None:
+        MegaPatch.it(Foo.moo, new="patched", scoped=True)
+
+        assert Foo.moo == "patched"
+        assert in_other_thread(lambda: Foo.moo) == "cow"
+
+    async def test_patch_only_visible_in_current_task(self) -> None:
+        async def patched_scenario() -> None:
+            MegaPatch.it(some_func, return_value="val", scoped=True)
+            await asyncio.sleep(0)
+            assert some_func("s") == "val"
+
+        async def unpatched_scenario() -> None:
+            await asyncio.sleep(0)
+            assert some_func("s") == "sa"
+
+        await asyncio.gather(patched_scenario(), unpatched_scenario())
+
+    def test_stacked_patches(self) -> None:
+        MegaPatch.it(some_func, new=lambda s: "first", scoped=True)
+        second = MegaPatch.it(some_func, new=lambda s: "second", scoped=True)
+        assert some_func("s") == "second"
+
+        second.stop()
+
+        assert some_func("s") == "first"
+
+    def test_original_restored_when_stopped(self) -> None:
+        original = vars(other_bar)["some_func"]
+        patch = MegaPatch.it(some_func, return_value="val", scoped=True)
+        assert vars(other_bar)["some_func"] is not original
+
+        patch.stop()
+
+        assert vars(other_bar)["some_func"] is original
+
+    def test_many(self) -> None:
+        MegaPatch.many(some_func, Foo.some_method, return_value="val", scoped=True)
+
+        assert some_func("s") == "val"
+        assert in_other_thread(lambda: Foo("s").some_method()) == "value"
+
+    def test_patch_in_other_thread_keeps_proxy(self) -> None:
+        MegaPatch.it(some_func, return_value="val", scoped=True)
+
+        def patch_and_stop() -> str:
+            MegaPatch.it(some_func, return_value="other", scoped=True).stop()
+            return some_func("s")
+
+        assert in_other_thread(patch_and_stop) == "sa"
+        assert some_func("s") == "val"
+
+    def test_stopping_twice_only_releases_once(self) -> None:
+        first = MegaPatch.it(some_func, return_value="first", scoped=True)
+        MegaPatch.it(some_func, return_value="second", scoped=True)
+
+        for patch in first.patches:
+            patch.stop()
+            patch.stop()
+
+        assert some_func("s") == "second"
+
+    def test_conflicting_arguments(self) -> None:
+        MegaPatch.it(some_func, return_value="val", scoped=True)
+
+        with pytest.raises(ValueError):
+            MegaPatch.it(some_func, return_value="val", scoped=True, create=True)
+
+    def test_module_constant_not_supported(self) -> None:
+        with pytest.raises(ValueError):
+            MegaPatch.it(bar, new="patched", scoped=True)
+
+    def test_many_undoes_started_patches_when_one_fails(self) -> None:
+        original = vars(other_bar)["some_func"]
+
+        with pytest.raises(ValueError):
+            MegaPatch.many(some_func, bar, scoped=True)
+
+        assert vars(other_bar)["some_func"] is original
+        assert in_other_thread(lambda: some_func("s")) == "sa"
+
+    def test_new_callable_not_supported(self) -> None:
+        with pytest.raises(ValueError):
+            MegaPatch.it(some_func, new_callable=MegaMock, scoped=True)
+
+
+class TestPatchTimings:
+    @pytest.fixture(autouse=True)
+    def enable_timings(self) -> Iterator[None]:
+        # keep the session timings intact when running with timings enabled
+        was_enabled, session_stats = PatchTimings.enabled, PatchTimings._stats
+        PatchTimings._stats = {}
+        PatchTimings.enable()
+        yield
+        PatchTimings.enabled, PatchTimings._stats = was_enabled, session_stats
+
+    def test_records_each_phase_per_target(self) -> None:
+        patch = MegaPatch.it(some_func)
+        patch.stop()
+
+        timings = PatchTimings.as_dict()
+
+        target = "tests.unit.simple_app.bar.some_func"
+        assert set(timings[target]) == set(PatchTimings.PHASES)
+        assert all(stats["count"] == 1 for stats in timings[target].values())
+
+    def test_aggregates_across_patches(self) -> None:
+        MegaPatch.it(some_func).stop()
+        MegaPatch.it(some_func).stop()
+
+        stats = PatchTimings.as_dict()["tests.unit.simple_app.bar.some_func"]
+
+        assert stats["start"]["count"] == 2
+        assert stats["start"]["total_ns"] >= stats["start"]["max_ns"]
+
+    def test_records_many(self) -> None:
+        MegaPatch.many(some_func, Foo.some_method).stop()
+
+        timings = PatchTimings.as_dict()
+
+        assert "tests.unit.simple_app.foo.Foo.some_method" in timings
+        assert timings["tests.unit.simple_app.bar.some_func"]["stop"]["count"] == 1
+
+    def test_nothing_recorded_when_disabled(self) -> None:
+        PatchTimings.disable()
+
+        MegaPatch.it(some_func).stop()
+
+        assert PatchTimings.as_dict() == {}
+
+    def test_report_slowest_first(self) -> None:
+        MegaPatch.it(some_func)
+        MegaPatch.it(Foo)
+
+        report = PatchTimings.report(limit=1)
+
+        assert len(report) == 1
+        assert report[0] == PatchTimings.report()[0]
+        assert PatchTimings.slowest(limit=1)[0][0] in report[0]
+
+    def test_write_json(self, tmp_path: Path) -> None:
+        MegaPatch.it(some_func)
+        json_path = tmp_path / "timings.json"
+
+        PatchTimings.write_json(str(json_path))
+
+        assert json.loads(json_path.read_text()) == PatchTimings.as_dict()
@@ -1,6 +1,15 @@
+import asyncio
+import threading
+import time
+from typing import cast
+from unittest.mock import ANY
+
+import pytest
+
 from megamock.megamocks import MegaMock
-from megamock.megas import Mega
+from megamock.megas import Mega, MegaAssertionError
 from megamock.type_util import call
+from tests.unit.simple_app.foo import Foo
 
 
 class TestMega:
@@ -96,6 +105,196 @@ class TestMega:
 
             assert Mega(mock).has_calls([call(4, 5, 6)], any_order=True) is False
 
+    class TestIndexedCalls:
+        def test_any_call(self) -> None:
+            mock: MegaMock = MegaMock(index_calls=True)
+            mock(1, 2, 3)
+            mock(4, five=5)
+
+            assert Mega(mock).any_call(4, five=5)
+            assert Mega(mock).any_call(1, 2, 3)
+            assert Mega(mock).any_call(4, 5) is False
+            assert "call not found" in str(Mega.last_assertion_error)
+
+        def test_any_call_normalizes_with_signature(self) -> None:
+            foo = MegaMock.it(Foo, index_calls=True)
+            foo.takes_args("a", arg2="b")
+
+            assert Mega(foo.takes_args).any_call("a", "b")
+            assert foo.takes_args.megamock.call_index is not None
+
+        def test_any_call_unhashable_arguments(self) -> None:
+            mock: MegaMock = MegaMock(index_calls=True)
+            mock([1], {"a": 1})
+
+            assert Mega(mock).any_call([1], {"a": 1})
+            assert Mega(mock).any_call(ANY, {"a": 1})
+            assert Mega(mock).any_call([2], {"a": 1}) is False
+
+        def test_any_call_compared_with_custom_equality(self) -> None:
+            mock: MegaMock = MegaMock(index_calls=True)
+            mock(ANY)
+
+            assert Mega(mock).any_call(1)
+
+        def test_has_calls_any_order(self) -> None:
+            mock: MegaMock = MegaMock(index_calls=True)
+            mock(1)
+            mock(2)
+            mock(1)
+
+            assert Mega(mock).has_calls([call(1), call(2), call(1)], any_order=True)
+            assert (
+                Mega(mock).has_calls([call(1), call(1), call(1)], any_order=True)
+                is False
+            )
+            assert "does not contain all of" in str(Mega.last_assertion_error)
+
+        def test_reset(self) -> None:
+            mock: MegaMock = MegaMock(index_calls=True)
+            mock(1)
+            mock.reset_mock()
+            mock(2)
+
+            assert Mega(mock).any_call(1) is False
+            assert Mega(mock).any_call(2)
+
+        def test_last_n_calls(self) -> None:
+            mock: MegaMock = MegaMock(index_calls=True, record="last:2")
+            for i in range(5):
+                mock(i)
+
+            assert Mega(mock).any_call(1) is False
+            assert Mega(mock).any_call(3)
+            assert Mega(mock).has_calls([call(4), call(3)], any_order=True)
+
+    class TestLastAssertionError:
+        def test_same_message_as_mock(self) -> None:
+            mock = MegaMock.it(Foo)
+            mock.takes_args("a", "b")
+
+            assert Mega(mock.takes_args).called_with("c", "d") is False
+            with pytest.raises(AssertionError) as exc_info:
+                mock.takes_args.assert_called_with("c", "d")
+            assert str(Mega.last_assertion_error) == str(exc_info.value)
+
+        def test_message_formatted_on_use(self) -> None:
+            mock: MegaMock = MegaMock()
+            mock(1)
+
+            assert Mega(mock).not_called() is False
+            error = cast(MegaAssertionError, Mega.last_assertion_error)
+            assert error._message is None
+
+            assert "Called 1 times" in str(error)
+            assert error._message is not None
+
+        def test_message_has_calls_at_time_of_check(self) -> None:
+            mock: MegaMock = MegaMock()
+            mock(1)
+
+            assert Mega(mock).called_once_with(2) is False
+            error = Mega.last_assertion_error
+            mock(3)
+
+            assert "Actual: mock(1)" in str(error)
+
+        def test_message_has_calls_at_time_of_check_last_n_calls(self) -> None:
+            mock: MegaMock = MegaMock(record="last:2")
+            for i in range(3):
+                mock(i)
+
+            assert Mega(mock).not_called() is False
+            error = Mega.last_assertion_error
+            mock(3)
+
+            message = str(error)
+            assert "Calls: [call(2)]." in message
+            assert "call(3)" not in message
+
+    class TestWaitUntilCalled:
+        @staticmethod
+        def call_later(func, *args, delay: float = 0.05) -> threading.Thread:
+            def run() -> None:
+                time.sleep(delay)
+                func(*args)
+
+            thread = threading.Thread(target=run)
+            thread.start()
+            return thread
+
+        def test_wakes_up_on_call(self) -> None:
+            mock: MegaMock = MegaMock()
+            thread = self.call_later(mock, 1)
+
+            start = time.perf_counter()
+            assert Mega(mock).wait_until_called(timeout=5)
+            assert time.perf_counter() - start < 1
+            thread.join()
+
+        def test_already_called(self) -> None:
+            mock: MegaMock = MegaMock()
+            mock()
+
+            assert Mega(mock).wait_until_called(timeout=0)
+
+        def test_timeout(self) -> None:
+            mock: MegaMock = MegaMock()
+
+            assert Mega(mock).wait_until_called(timeout=0.01) is False
+            assert "to be called within 0.01 seconds" in str(
+                Mega.last_assertion_error
+            )
+
+        def test_count(self) -> None:
+            mock: MegaMock = MegaMock()
+            mock()
+            thread = self.call_later(mock)
+
+            assert Mega(mock).wait_until_called(timeout=5, count=2)
+            assert mock.call_count == 2
+            thread.join()
+
+        def test_with_args(self) -> None:
+            mock: MegaMock = MegaMock()
+            mock(1)
+            thread = self.call_later(mock, 2)
+
+            assert Mega(mock).wait_until_called(timeout=5, with_args=call(2))
+            thread.join()
+            assert Mega(mock).wait_until_called(timeout=0, with_args=call(3)) is False
+            assert "with mock(3)" in str(Mega.last_assertion_error)
+
+        def test_method(self) -> None:
+            mock = MegaMock.it(Foo)
+            thread = self.call_later(mock.some_method)
+
+            assert Mega(mock.some_method).wait_until_called(timeout=5)
+            thread.join()
+
+        async def test_until_called(self) -> None:
+            mock: MegaMock = MegaMock()
+
+            async def call_later() -> None:
+                await asyncio.sleep(0.05)
+                mock(1)
+
+            task = asyncio.create_task(call_later())
+            assert await Mega(mock).until_called(timeout=5, with_args=call(1))
+            await task
+
+        async def test_until_called_from_thread(self) -> None:
+            mock: MegaMock = MegaMock()
+            thread = self.call_later(mock)
+
+            assert await Mega(mock).until_called(timeout=5)
+            thread.join()
+
+        async def test_until_called_timeout(self) -> None:
+            mock: MegaMock = MegaMock()
+
+            assert await Mega(mock).until_called(timeout=0.01) is False
+
     class TestCallArgs:
         def test_call_args(self) -> None:
             mock = MegaMock()
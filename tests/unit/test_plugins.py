@@ -1,5 +1,17 @@
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config
+from _pytest.terminal import TerminalReporter
+
+from megamock import Mega, MegaMock, MegaPatch
+from megamock.megamocks import AttributeTrackingBase
+from megamock.megapatches import PatchTimings
+from megamock.plugins.pytest import pytest_configure, pytest_terminal_summary
+from tests.unit.simple_app.bar import some_func
 from tests.unit.simple_app.for_autouse_1 import get_value
 from tests.unit.simple_app.for_autouse_2 import session_modified_function
+from tests.unit.simple_app.for_reusable import reused_function
 
 
 class TestPytestPlugin:
@@ -8,3 +20,107 @@ class TestPytestPlugin:
 
     def test_session_modified_fixture(self) -> None:
         assert session_modified_function() == "session_modified"
+
+
+class TestReusablePatches:
+    def test_change_reusable_patch(self, reusable_session_patch: MegaPatch) -> None:
+        assert reused_function() == "baseline"
+
+        reusable_session_patch.mock.return_value = "changed"
+
+        assert reused_function() == "changed"
+
+    def test_reset_between_tests(self, reusable_session_patch: MegaPatch) -> None:
+        assert Mega(reusable_session_patch.mock).not_called()
+        assert reused_function() == "baseline"
+
+
+class TestPatchTimingsReport:
+    def test_prints_slowest_patches(self) -> None:
+        reporter = MegaMock.it(TerminalReporter)
+        config = MegaMock.it(Config)
+        config.getoption.side_effect = lambda name: name == "megamock_patch_timings"
+        was_enabled, session_stats = PatchTimings.enabled, PatchTimings._stats
+        PatchTimings._stats = {}
+        PatchTimings.enable()
+        try:
+            MegaPatch.it(some_func).stop()
+            pytest_terminal_summary(reporter, 0, config)
+        finally:
+            PatchTimings.enabled, PatchTimings._stats = was_enabled, session_stats
+
+        assert Mega(reporter.write_sep).called_once_with(
+            "=", "megamock slowest patches"
+        )
+        assert "simple_app.bar.some_func" in str(reporter.write_line.call_args)
+
+    def test_nothing_printed_without_option(self) -> None:
+        reporter = MegaMock.it(TerminalReporter)
+        config = MegaMock.it(Config)
+        config.getoption.return_value = None
+
+        pytest_terminal_summary(reporter, 0, config)
+
+        assert Mega(reporter.write_sep).not_called()
+
+
+class TestTrackingOption:
+    def test_sets_default_tracking(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(AttributeTrackingBase, "default_tracking", "full")
+        config = MegaMock.it(Config)
+        config.getini.return_value = "last:3"
+        config.getoption.return_value = None
+
+        pytest_configure(config)
+
+        assert AttributeTrackingBase.default_tracking == "last:3"
+
+    def test_invalid_value(self) -> None:
+        config = MegaMock.it(Config)
+        config.getini.return_value = "everything"
+
+        with pytest.raises(ValueError):
+            pytest_configure(config)
+
+
+class TestReusablePatchesOption:
+    TEST_FILE = """
+        import pytest
+
+        from megamock import Mega, MegaPatch
+
+
+        def reused_function() -> str:
+            return "original"
+
+
+        @pytest.fixture(scope="module")
+        def reusable_patch() -> MegaPatch:
+            return MegaPatch.it(reused_function, reusable=True)
+
+
+        def test_first(reusable_patch: MegaPatch) -> None:
+            reused_function()
+
+
+        def test_second(reusable_patch: MegaPatch) -> None:
+            assert Mega(reusable_patch.mock).not_called()
+    """
+
+    def run(self, pytester: pytest.Pytester, ini: str) -> pytest.RunResult:
+        pytester.makeini(f"[pytest]\naddopts = -p megamock.plugins.pytest\n{ini}")
+        pytester.makepyfile(self.TEST_FILE)
+        # the plugin is loaded in a fresh interpreter, so it needs to find megamock
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("PYTHONPATH", str(Path(__file__).parents[2]))
+            return pytester.runpytest_subprocess()
+
+    def test_reset_between_tests_when_enabled(self, pytester: pytest.Pytester) -> None:
+        result = self.run(pytester, "megamock_reusable_patches = true")
+
+        result.assert_outcomes(passed=2)
+
+    def test_not_reset_by_default(self, pytester: pytest.Pytester) -> None:
+        result = self.run(pytester, "")
+
+        result.assert_outcomes(passed=1, failed=1)
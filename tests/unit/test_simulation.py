@@ -0,0 +1,134 @@
+import asyncio
+import time
+
+import pytest
+
+from megamock import Mega, MegaMock
+from megamock.simulation import Distribution, Simulation, VirtualClock
+from tests.unit.simple_app.async_portion import SomeClassWithAsyncMethods
+from tests.unit.simple_app.foo import Foo
+
+
+class TestDistribution:
+    def test_fixed(self) -> None:
+        assert Distribution.fixed(0.5).sample() == 0.5
+
+    def test_seeded(self) -> None:
+        first = Distribution.normal(1.0, 0.5)
+        second = Distribution.normal(1.0, 0.5)
+
+        assert [first.sample() for _ in range(5)] == [
+            second.sample() for _ in range(5)
+        ]
+
+    def test_uniform(self) -> None:
+        distribution = Distribution.uniform(1.0, 2.0)
+
+        assert all(1.0 <= distribution.sample() <= 2.0 for _ in range(100))
+
+    def test_never_negative(self) -> None:
+        distribution = Distribution.normal(0.0, 1.0)
+
+        assert all(distribution.sample() >= 0.0 for _ in range(100))
+
+
+class TestVirtualClock:
+    def test_sleep_until(self) -> None:
+        clock = VirtualClock()
+        clock.sleep_until(2.0)
+        clock.sleep_until(1.0)
+
+        assert clock.now() == 2.0
+
+    def test_advance(self) -> None:
+        clock = VirtualClock(start=1.0)
+        clock.advance(0.5)
+
+        assert clock.now() == 1.5
+
+
+class TestSimulation:
+    def test_latency(self) -> None:
+        clock = VirtualClock()
+        mega_mock = MegaMock.it(Foo, simulation=Simulation(latency=0.5, clock=clock))
+        mega_mock.some_method.return_value = "value"
+
+        assert mega_mock.some_method() == "value"
+        assert clock.now() == 0.5
+        assert Mega(mega_mock.some_method).called_once()
+
+    def test_throughput(self) -> None:
+        clock = VirtualClock()
+        mega_mock = MegaMock.it(Foo, simulation=Simulation(throughput=10, clock=clock))
+        for _ in range(5):
+            mega_mock.some_method()
+
+        assert clock.now() == pytest.approx(0.4)
+
+    def test_shared_by_attributes(self) -> None:
+        clock = VirtualClock()
+        simulation = Simulation(latency=1.0, clock=clock)
+        mega_mock = MegaMock.it(Foo, simulation=simulation)
+        mega_mock.some_method()
+        mega_mock.takes_args("a", "b")
+
+        assert mega_mock.takes_args.megamock.simulation is simulation
+        assert clock.now() == 2.0
+
+    def test_real_clock(self) -> None:
+        mega_mock = MegaMock.it(Foo, simulation=Simulation(latency=0.02))
+
+        start = time.perf_counter()
+        mega_mock.some_method()
+        assert time.perf_counter() - start >= 0.02
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            Simulation(max_concurrency=0)
+        with pytest.raises(ValueError):
+            Simulation(throughput=0)
+
+    async def test_max_concurrency(self) -> None:
+        clock = VirtualClock()
+        mega_mock = MegaMock.it(
+            SomeClassWithAsyncMethods,
+            simulation=Simulation(latency=1.0, max_concurrency=2, clock=clock),
+        )
+
+        await asyncio.gather(*(mega_mock.some_method(str(i)) for i in range(5)))
+
+        assert clock.now() == 3.0
+        assert Mega(mega_mock.some_method).call_count == 5
+
+    async def test_concurrent_tasks(self) -> None:
+        clock = VirtualClock()
+        mega_mock = MegaMock.it(
+            SomeClassWithAsyncMethods,
+            simulation=Simulation(latency=1.0, max_concurrency=2, clock=clock),
+        )
+
+        async def worker(arg: str) -> None:
+            await mega_mock.some_method(arg)
+
+        await asyncio.gather(*(worker(str(i)) for i in range(4)))
+
+        assert clock.now() == 2.0
+
+    async def test_timeout(self) -> None:
+        mega_mock = MegaMock.it(
+            SomeClassWithAsyncMethods, simulation=Simulation(latency=10.0)
+        )
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(mega_mock.some_method("a"), 0.01)
+
+    async def test_awaits_are_timed(self) -> None:
+        clock = VirtualClock()
+        mega_mock = MegaMock.it(
+            SomeClassWithAsyncMethods,
+            simulation=Simulation(latency=1.0, clock=clock),
+            time_calls=True,
+        )
+        await mega_mock.some_method("a")
+
+        assert len(Mega(mega_mock.some_method).call_timings.await_durations) == 1
@@ -0,0 +1,124 @@
+import inspect
+from dataclasses import dataclass
+
+import pytest
+
+from megamock import MegaMock, MegaPatch
+from megamock.stubs import _stub_template
+from tests.unit.simple_app.async_portion import SomeClassWithAsyncMethods
+from tests.unit.simple_app.bar import some_func
+from tests.unit.simple_app.foo import Foo
+
+
+class WithMethodKinds:
+    def method(self, arg: int, *, flag: bool = False) -> int:
+        return arg
+
+    @classmethod
+    def class_method(cls, arg: int) -> int:
+        return arg
+
+    @staticmethod
+    def static_method(arg: int = 1) -> int:
+        return arg
+
+    def __call__(self, arg: int) -> int:
+        return arg
+
+
+@dataclass
+class Point:
+    x: int
+    y: int = 0
+
+    def length(self) -> float:
+        return (self.x**2 + self.y**2) ** 0.5
+
+
+class Settings(dict):
+    pass
+
+
+class TestStub:
+    def test_returns(self) -> None:
+        stub = MegaMock.stub(Foo, some_method="value", moo="dog")
+
+        assert stub.some_method() == "value"
+        assert stub.moo == "dog"
+        assert stub.takes_args("a", "b") is None
+        assert stub.s is None
+
+    def test_is_instance_of_spec(self) -> None:
+        assert isinstance(MegaMock.stub(Foo), Foo)
+
+    def test_same_signatures(self) -> None:
+        stub = MegaMock.stub(WithMethodKinds)
+
+        assert str(inspect.signature(stub.method)) == "(arg, *, flag=False)"
+        with pytest.raises(TypeError):
+            stub.method(1, True)  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            stub.static_method(1, 2)  # type: ignore[call-arg]
+
+    def test_method_kinds(self) -> None:
+        stub = MegaMock.stub(
+            WithMethodKinds, class_method=1, static_method=2, __call__=3
+        )
+
+        assert stub.class_method(0) == 1
+        assert stub.static_method() == 2
+        assert stub(0) == 3
+
+    def test_dataclass(self) -> None:
+        stub = MegaMock.stub(Point, x=3, length=5.0)
+
+        assert stub.x == 3
+        assert stub.y is None
+        assert stub.length() == 5.0
+
+    def test_builtin_subclass(self) -> None:
+        stub = MegaMock.stub(Settings, get="value", fromkeys={})
+
+        assert stub.get("key") == "value"
+        assert stub.get("key", "default") == "value"
+        assert stub.keys() is None
+        assert stub.fromkeys(["key"]) == {}
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError):
+            MegaMock.stub(Foo, not_an_attribute=1)
+
+        stub = MegaMock.stub(Foo)
+        with pytest.raises(AttributeError):
+            stub.not_an_attribute = 1  # type: ignore[attr-defined]
+
+    def test_set_attribute(self) -> None:
+        stub = MegaMock.stub(Foo)
+        stub.moo = "dog"
+
+        assert stub.moo == "dog"
+
+    def test_function(self) -> None:
+        stub = MegaMock.stub(some_func, return_value="value")
+
+        assert stub("a") == "value"
+        assert stub.__name__ == "some_func"
+        with pytest.raises(TypeError):
+            stub()  # type: ignore[call-arg]
+
+    async def test_async(self) -> None:
+        stub = MegaMock.stub(SomeClassWithAsyncMethods, some_method="value")
+
+        assert await stub.some_method("a") == "value"
+
+    def test_template_cached(self) -> None:
+        MegaMock.stub(Foo)
+
+        assert _stub_template(Foo) is _stub_template(Foo)
+
+    def test_patch(self) -> None:
+        MegaPatch.it(
+            Foo.some_method, new=MegaMock.stub(Foo.some_method, return_value="stub")
+        )
+
+        assert Foo("s").some_method() == "stub"